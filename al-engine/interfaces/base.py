@@ -39,6 +39,13 @@ class ALFrameworkPlugin(ABC):
     (modAL, ALiPy, custom implementations) must follow.
     """
     
+    # Version of the fitted model, bumped by every successful (re)training
+    model_version: int = 0
+    
+    # Query strategy scores of the samples returned by the last
+    # query_samples() call, in the same order (None if not reported)
+    query_scores: Optional[np.ndarray] = None
+    
     @abstractmethod
     def initialize(self, config: Dict[str, Any]) -> None:
         """
@@ -71,13 +78,16 @@ class ALFrameworkPlugin(ABC):
         pass
     
     @abstractmethod
-    def query_samples(self, X_unlabeled: np.ndarray, n_samples: int) -> List[int]:
+    def query_samples(self, X_unlabeled: np.ndarray, n_samples: int,
+                      candidate_indices: Optional[np.ndarray] = None) -> List[int]:
         """
         Select most informative samples to label.
         
         Args:
             X_unlabeled: Unlabeled data pool (n_samples, n_features)
             n_samples: Number of samples to select
+            candidate_indices: Optional rows of X_unlabeled to choose from.
+                When given, returned indices are positions in candidate_indices.
             
         Returns:
             List of indices of selected samples
@@ -115,6 +125,21 @@ class ALFrameworkPlugin(ABC):
         """
         pass
     
+    def predict_pool(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict labels and uncertainties for rows of the unlabeled pool.
+        
+        Frameworks that cache pool predictions override this to avoid
+        re-running the model on rows that were already scored.
+        
+        Args:
+            indices: Row indices into the framework's unlabeled pool
+        
+        Returns:
+            Tuple of (predictions, uncertainties)
+        """
+        return self.predict(self.X_unlabeled[indices])
+    
     @abstractmethod
     def get_metrics(self) -> ModelMetrics:
         """
@@ -144,6 +169,32 @@ class ALFrameworkPlugin(ABC):
             state: Previously saved framework state
         """
         pass
+    
+    def save_snapshot(self, directory: str) -> None:
+        """
+        Write a binary snapshot of the fitted framework (model, data split,
+        model version and history) into a directory.
+        
+        Args:
+            directory: Directory to write into
+        
+        Raises:
+            NotImplementedError: If the framework does not support snapshots
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
+    
+    def load_snapshot(self, directory: str) -> None:
+        """
+        Restore the framework from a snapshot written by save_snapshot,
+        without reloading the dataset or retraining.
+        
+        Args:
+            directory: Snapshot directory
+        
+        Raises:
+            NotImplementedError: If the framework does not support snapshots
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support snapshots")
 
 class ModelPlugin(ABC):
     """
@@ -238,6 +289,10 @@ class QueryStrategyPlugin(ABC):
     (uncertainty sampling, diversity sampling, hybrid approaches, etc.).
     """
     
+    # Scores of the samples returned by the last select_samples() call, in
+    # the same order (None if the strategy does not report scores)
+    selection_scores: Optional[np.ndarray] = None
+    
     @abstractmethod
     def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray, 
                       n_samples: int, **kwargs) -> List[int]:
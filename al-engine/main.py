@@ -9,10 +9,12 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
+import os
 from typing import Dict, Any, List
 import uvicorn
 
 from services.al_engine_service import ALEngineService
+from services.shard_router import ShardedALEngineService
 from plugin_registry import registry
 from interfaces.base import ALFrameworkPlugin
 
@@ -50,7 +52,9 @@ app.add_middleware(
 )
 
 # Initialize services
-al_service = ALEngineService()
+# AL_ENGINE_SHARDS > 1 spreads experiments over that many worker processes
+n_shards = int(os.getenv("AL_ENGINE_SHARDS", "1"))
+al_service = ShardedALEngineService(n_shards) if n_shards > 1 else ALEngineService()
 
 @app.post("/initialize")
 async def initialize_experiment(config: Dict[str, Any]):
@@ -72,6 +76,16 @@ async def get_next_sample():
         logger.error(f"Failed to get next sample: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/next-samples")
+async def get_next_samples(n: int = 1):
+    """Get the n most informative samples for labeling from a single query."""
+    try:
+        result = await al_service.get_next_samples(n_samples=n)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get next samples: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/submit-label")
 async def submit_label(sample_id: str, label: int):
     """Submit a label for a sample and update the model."""
@@ -82,6 +96,16 @@ async def submit_label(sample_id: str, label: int):
         logger.error(f"Failed to submit label: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/flush-labels")
+async def flush_labels():
+    """Apply all labels buffered by the retrain policy to the model now."""
+    try:
+        result = await al_service.flush_labels()
+        return result
+    except Exception as e:
+        logger.error(f"Failed to flush labels: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/metrics")
 async def get_metrics():
     """Get current model performance metrics."""
@@ -104,7 +128,7 @@ async def get_status():
 
 @app.post("/reset")
 async def reset_engine():
-    """Reset the AL engine state."""
+    """Reset the AL engine state (all experiments)."""
     try:
         result = await al_service.reset()
         return result
@@ -112,6 +136,116 @@ async def reset_engine():
         logger.error(f"Failed to reset engine: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/snapshot")
+async def snapshot_experiment():
+    """Write a binary snapshot of the latest experiment."""
+    try:
+        result = await al_service.snapshot()
+        return result
+    except Exception as e:
+        logger.error(f"Failed to snapshot experiment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/experiments")
+async def list_experiments():
+    """List all experiments hosted by the engine."""
+    try:
+        result = await al_service.list_experiments()
+        return result
+    except Exception as e:
+        logger.error(f"Failed to list experiments: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/experiments/{experiment_id}/next-sample")
+async def get_experiment_next_sample(experiment_id: str):
+    """Get the next most informative sample of an experiment."""
+    try:
+        result = await al_service.get_next_sample(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get next sample: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/experiments/{experiment_id}/next-samples")
+async def get_experiment_next_samples(experiment_id: str, n: int = 1):
+    """Get the n most informative samples of an experiment from a single query."""
+    try:
+        result = await al_service.get_next_samples(n_samples=n, experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get next samples: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/experiments/{experiment_id}/submit-label")
+async def submit_experiment_label(experiment_id: str, sample_id: str, label: int):
+    """Submit a label for a sample of an experiment and update its model."""
+    try:
+        result = await al_service.submit_label(sample_id, label, experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to submit label: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/experiments/{experiment_id}/flush-labels")
+async def flush_experiment_labels(experiment_id: str):
+    """Apply all labels buffered for an experiment to its model now."""
+    try:
+        result = await al_service.flush_labels(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to flush labels: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/experiments/{experiment_id}/metrics")
+async def get_experiment_metrics(experiment_id: str):
+    """Get current model performance metrics of an experiment."""
+    try:
+        result = await al_service.get_metrics(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get metrics: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/experiments/{experiment_id}/status")
+async def get_experiment_status(experiment_id: str):
+    """Get experiment status and configuration."""
+    try:
+        result = await al_service.get_status(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get status: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/experiments/{experiment_id}/reset")
+async def reset_experiment(experiment_id: str):
+    """Remove an experiment from the engine."""
+    try:
+        result = await al_service.reset(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to reset experiment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/experiments/{experiment_id}/snapshot")
+async def snapshot_experiment_by_id(experiment_id: str):
+    """Write a binary snapshot of an experiment (fitted model, labels, data split)."""
+    try:
+        result = await al_service.snapshot(experiment_id=experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to snapshot experiment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/experiments/{experiment_id}/restore")
+async def restore_experiment(experiment_id: str):
+    """Restore an experiment from its snapshot without retraining."""
+    try:
+        result = await al_service.restore(experiment_id)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to restore experiment: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/plugins/available")
 async def list_available_plugins():
     """List all available plugins."""
@@ -161,12 +295,19 @@ async def startup_event():
     logger.info("Starting AL Engine service...")
     registry.auto_discover_plugins()
     logger.info(f"Discovered plugins: {registry.list_available()}")
+    registry.warm_up_from_env()
+    if isinstance(al_service, ShardedALEngineService):
+        al_service.start()
+    if os.getenv("AL_ENGINE_SNAPSHOT_DIR"):
+        result = await al_service.restore_all()
+        logger.info(f"Restored experiments from snapshots: {list(result['restored'].keys())}")
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down AL Engine service...")
+    await al_service.shutdown()
 
 if __name__ == "__main__":
     uvicorn.run(
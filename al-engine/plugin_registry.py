@@ -3,12 +3,21 @@ Plugin Registry for AL Engine
 
 This module manages the registration and discovery of all plugins.
 It provides a centralized way to register, discover, and instantiate plugins.
+
+Discovery reads a manifest of the plugins each module provides and only
+imports a module when one of its plugins is first requested, so startup does
+not pay for importing every framework and its dependencies. Modules missing
+from the manifest, or changed since it was written, are imported eagerly.
+Regenerate the manifest with `python plugin_registry.py`.
 """
 
 import os
+import hashlib
 import importlib
 import inspect
-from typing import Dict, List, Type, Any
+import json
+import threading
+from typing import Dict, List, Type, Any, Iterator, Optional, Tuple
 import logging
 
 from interfaces.base import (
@@ -18,6 +27,22 @@ from interfaces.base import (
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_FILE = "manifest.json"
+
+# Plugin type names (as used in metadata keys and plugin info) by plugin subdirectory
+PLUGIN_TYPES = {
+    "frameworks": "framework",
+    "models": "model",
+    "strategies": "strategy",
+    "datasets": "dataset",
+    "preprocessors": "preprocessor"
+}
+
+def _file_digest(path: str) -> str:
+    """Hash a plugin module's source, to tell whether the manifest still describes it."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
 class PluginRegistry:
     """
     Central registry for all AL Engine plugins.
@@ -37,6 +62,10 @@ class PluginRegistry:
         # Plugin metadata
         self.plugin_metadata: Dict[str, Dict[str, Any]] = {}
         
+        # Manifest entries of plugins whose module is not imported yet, by plugin subdirectory
+        self.lazy_plugins: Dict[str, Dict[str, Dict[str, Any]]] = {plugin_type: {} for plugin_type in PLUGIN_TYPES}
+        self._lock = threading.RLock()
+        
         logger.info("Plugin registry initialized")
     
     def register_framework(self, name: str, plugin_class: Type[ALFrameworkPlugin], 
@@ -147,10 +176,11 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self.frameworks:
-            raise ValueError(f"Framework plugin '{name}' not found. Available: {list(self.frameworks.keys())}")
+        plugin_class = self._resolve("frameworks", name)
+        if plugin_class is None:
+            raise ValueError(f"Framework plugin '{name}' not found. Available: {self._available_names('frameworks')}")
         
-        return self.frameworks[name]()
+        return plugin_class()
     
     def get_model(self, name: str, **kwargs) -> ModelPlugin:
         """
@@ -166,10 +196,11 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self.models:
-            raise ValueError(f"Model plugin '{name}' not found. Available: {list(self.models.keys())}")
+        plugin_class = self._resolve("models", name)
+        if plugin_class is None:
+            raise ValueError(f"Model plugin '{name}' not found. Available: {self._available_names('models')}")
         
-        return self.models[name](**kwargs)
+        return plugin_class(**kwargs)
     
     def get_strategy(self, name: str, **kwargs) -> QueryStrategyPlugin:
         """
@@ -185,10 +216,11 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self.strategies:
-            raise ValueError(f"Strategy plugin '{name}' not found. Available: {list(self.strategies.keys())}")
+        plugin_class = self._resolve("strategies", name)
+        if plugin_class is None:
+            raise ValueError(f"Strategy plugin '{name}' not found. Available: {self._available_names('strategies')}")
         
-        return self.strategies[name](**kwargs)
+        return plugin_class(**kwargs)
     
     def get_dataset(self, name: str, **kwargs) -> DatasetPlugin:
         """
@@ -204,10 +236,11 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self.datasets:
-            raise ValueError(f"Dataset plugin '{name}' not found. Available: {list(self.datasets.keys())}")
+        plugin_class = self._resolve("datasets", name)
+        if plugin_class is None:
+            raise ValueError(f"Dataset plugin '{name}' not found. Available: {self._available_names('datasets')}")
         
-        return self.datasets[name](**kwargs)
+        return plugin_class(**kwargs)
     
     def get_preprocessor(self, name: str, **kwargs) -> PreprocessorPlugin:
         """
@@ -223,10 +256,11 @@ class PluginRegistry:
         Raises:
             ValueError: If plugin not found
         """
-        if name not in self.preprocessors:
-            raise ValueError(f"Preprocessor plugin '{name}' not found. Available: {list(self.preprocessors.keys())}")
+        plugin_class = self._resolve("preprocessors", name)
+        if plugin_class is None:
+            raise ValueError(f"Preprocessor plugin '{name}' not found. Available: {self._available_names('preprocessors')}")
         
-        return self.preprocessors[name](**kwargs)
+        return plugin_class(**kwargs)
     
     def list_available(self) -> Dict[str, List[str]]:
         """
@@ -235,13 +269,22 @@ class PluginRegistry:
         Returns:
             Dict mapping plugin types to lists of available plugins
         """
-        return {
-            "frameworks": list(self.frameworks.keys()),
-            "models": list(self.models.keys()),
-            "strategies": list(self.strategies.keys()),
-            "datasets": list(self.datasets.keys()),
-            "preprocessors": list(self.preprocessors.keys())
-        }
+        return {plugin_type: self._available_names(plugin_type) for plugin_type in PLUGIN_TYPES}
+    
+    def is_available(self, plugin_type: str, plugin_name: str) -> bool:
+        """
+        Check whether a plugin is registered or listed in the manifest,
+        without importing it.
+        
+        Args:
+            plugin_type: Type of plugin (framework, model, strategy, dataset, preprocessor)
+            plugin_name: Name of the plugin
+        
+        Returns:
+            True if the plugin can be instantiated
+        """
+        plural = self._plural(plugin_type)
+        return plugin_name in getattr(self, plural) or plugin_name in self.lazy_plugins[plural]
     
     def get_plugin_info(self, plugin_type: str, plugin_name: str) -> Dict[str, Any]:
         """
@@ -264,15 +307,24 @@ class PluginRegistry:
         }
         
         # Check if plugin exists
-        plugin_dict = getattr(self, f"{plugin_type}s", {})
+        plural = self._plural(plugin_type)
+        plugin_dict = getattr(self, plural)
+        lazy_entry = self.lazy_plugins[plural].get(plugin_name)
         if plugin_name in plugin_dict:
             info["available"] = True
+            info["loaded"] = True
             info["class"] = plugin_dict[plugin_name].__name__
             info["module"] = plugin_dict[plugin_name].__module__
             
             # Add metadata if available
             if key in self.plugin_metadata:
                 info["metadata"] = self.plugin_metadata[key]
+        elif lazy_entry is not None:
+            info["available"] = True
+            info["loaded"] = False
+            info["class"] = lazy_entry["class"]
+            info["module"] = lazy_entry["module"]
+            info["metadata"] = lazy_entry.get("metadata", {})
         
         return info
     
@@ -280,6 +332,9 @@ class PluginRegistry:
         """
         Automatically discover and register plugins from the plugins directory.
         
+        Plugins listed in the directory's manifest are registered lazily;
+        other modules are imported and registered right away.
+        
         Args:
             plugin_dir: Directory to search for plugins
         """
@@ -288,28 +343,213 @@ class PluginRegistry:
             return
         
         logger.info(f"Auto-discovering plugins in {plugin_dir}")
+        manifest = self._load_manifest(plugin_dir)
         
         # Discover plugins in each subdirectory
-        for plugin_type in ["frameworks", "models", "strategies", "datasets", "preprocessors"]:
+        for plugin_type in PLUGIN_TYPES:
             type_dir = os.path.join(plugin_dir, plugin_type)
             if os.path.exists(type_dir):
-                self._discover_plugins_in_dir(type_dir, plugin_type)
+                self._discover_plugins_in_dir(type_dir, plugin_type, manifest)
+    
+    def write_manifest(self, plugin_dir: str = "plugins") -> str:
+        """
+        Import every plugin module and write the manifest used for lazy discovery.
+        
+        Args:
+            plugin_dir: Plugins directory
+        
+        Returns:
+            Path of the written manifest
+        """
+        modules = []
+        for plugin_type, module_path, path in self._iter_plugin_modules(plugin_dir):
+            try:
+                module = importlib.import_module(module_path)
+            except Exception as e:
+                # Left out, so discovery retries the import (and reports the error) eagerly
+                logger.error(f"Failed to load plugin module {module_path}: {str(e)}")
+                continue
+            
+            modules.append({
+                "type": plugin_type,
+                "module": module_path,
+                "digest": _file_digest(path),
+                "plugins": [
+                    {
+                        "name": plugin_name,
+                        "class": plugin_class.__name__,
+                        "metadata": {"description": (inspect.getdoc(plugin_class) or "").split("\n")[0]}
+                    }
+                    for plugin_name, plugin_class in self._plugin_classes(module, plugin_type)
+                ]
+            })
+        
+        manifest_path = os.path.join(plugin_dir, MANIFEST_FILE)
+        with open(manifest_path, "w") as f:
+            json.dump({"modules": modules}, f, indent=2)
+            f.write("\n")
+        
+        logger.info(f"Wrote plugin manifest {manifest_path} with {len(modules)} modules")
+        return manifest_path
     
-    def _discover_plugins_in_dir(self, directory: str, plugin_type: str):
+    def warm_up(self, plugins: Optional[List[str]] = None) -> threading.Thread:
+        """
+        Import lazily registered plugins on a background thread, so the first
+        request using them does not pay for the import.
+        
+        Args:
+            plugins: Plugins as "type:name" (e.g. "framework:sklearn"); all
+                lazily registered plugins if None
+        
+        Returns:
+            The started thread
+        """
+        if plugins is None:
+            targets = [(plural, name) for plural, entries in self.lazy_plugins.items() for name in list(entries)]
+        else:
+            targets = []
+            for plugin in plugins:
+                plugin_type, _, name = plugin.partition(":")
+                targets.append((self._plural(plugin_type.strip()), name.strip()))
+        
+        def preload() -> None:
+            for plural, name in targets:
+                try:
+                    if self._resolve(plural, name) is None:
+                        logger.warning(f"Cannot preload unknown plugin {PLUGIN_TYPES[plural]}:{name}")
+                except ValueError as e:
+                    logger.error(str(e))
+            logger.info(f"Preloaded {len(targets)} plugins")
+        
+        thread = threading.Thread(target=preload, name="al-plugin-warm-up", daemon=True)
+        thread.start()
+        return thread
+    
+    def warm_up_from_env(self) -> Optional[threading.Thread]:
+        """
+        Preload the plugins listed in AL_ENGINE_PRELOAD_PLUGINS ("all", or
+        comma-separated "type:name" entries) in the background.
+        
+        Returns:
+            The warm-up thread, or None if nothing is configured
+        """
+        preload = os.getenv("AL_ENGINE_PRELOAD_PLUGINS", "").strip()
+        if not preload:
+            return None
+        if preload == "all":
+            return self.warm_up()
+        return self.warm_up([plugin for plugin in preload.split(",") if plugin.strip()])
+    
+    def _plural(self, plugin_type: str) -> str:
+        """Map a plugin type (singular or plugin subdirectory name) to its subdirectory name."""
+        if plugin_type in PLUGIN_TYPES:
+            return plugin_type
+        for plural, singular in PLUGIN_TYPES.items():
+            if singular == plugin_type:
+                return plural
+        raise ValueError(f"Unknown plugin type '{plugin_type}'. Available: {list(PLUGIN_TYPES.values())}")
+    
+    def _available_names(self, plugin_type: str) -> List[str]:
+        """List registered and lazily registered plugin names of a type."""
+        registered = list(getattr(self, plugin_type).keys())
+        return registered + [name for name in self.lazy_plugins[plugin_type] if name not in registered]
+    
+    def _resolve(self, plugin_type: str, name: str) -> Optional[Type]:
+        """
+        Get a plugin class, importing its module on first use.
+        
+        Args:
+            plugin_type: Plugin subdirectory name
+            name: Plugin name
+        
+        Returns:
+            Plugin class, or None if no such plugin is known
+        
+        Raises:
+            ValueError: If the plugin's module fails to import
+        """
+        plugins = getattr(self, plugin_type)
+        if name in plugins:
+            return plugins[name]
+        
+        with self._lock:
+            entry = self.lazy_plugins[plugin_type].get(name)
+            if entry is None:
+                return plugins.get(name)
+            
+            try:
+                module = importlib.import_module(entry["module"])
+            except Exception as e:
+                self.lazy_plugins[plugin_type].pop(name, None)
+                raise ValueError(f"Failed to load plugin module {entry['module']}: {str(e)}")
+            
+            logger.info(f"Imported plugin module {entry['module']} for {PLUGIN_TYPES[plugin_type]} '{name}'")
+            self._register_plugins_from_module(module, plugin_type)
+            for registered_name in list(self.lazy_plugins[plugin_type]):
+                if self.lazy_plugins[plugin_type][registered_name]["module"] == entry["module"]:
+                    self.lazy_plugins[plugin_type].pop(registered_name)
+            return plugins.get(name)
+    
+    def _load_manifest(self, plugin_dir: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the plugin manifest.
+        
+        Args:
+            plugin_dir: Plugins directory
+        
+        Returns:
+            Manifest module entries by module path (empty if there is no usable manifest)
+        """
+        manifest_path = os.path.join(plugin_dir, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return {}
+        
+        try:
+            with open(manifest_path) as f:
+                return {entry["module"]: entry for entry in json.load(f)["modules"]}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable plugin manifest {manifest_path}: {e}")
+            return {}
+    
+    def _iter_plugin_modules(self, plugin_dir: str) -> Iterator[Tuple[str, str, str]]:
+        """Yield (plugin subdirectory, module path, file path) of every plugin module."""
+        for plugin_type in PLUGIN_TYPES:
+            type_dir = os.path.join(plugin_dir, plugin_type)
+            if not os.path.exists(type_dir):
+                continue
+            for filename in sorted(os.listdir(type_dir)):
+                if filename.endswith(".py") and not filename.startswith("__"):
+                    yield plugin_type, f"plugins.{plugin_type}.{filename[:-3]}", os.path.join(type_dir, filename)
+    
+    def _discover_plugins_in_dir(self, directory: str, plugin_type: str,
+                                 manifest: Optional[Dict[str, Dict[str, Any]]] = None):
         """
         Discover plugins in a specific directory.
         
         Args:
             directory: Directory to search
             plugin_type: Type of plugins to discover
+            manifest: Manifest module entries by module path
         """
+        manifest = manifest or {}
         for filename in os.listdir(directory):
             if filename.endswith(".py") and not filename.startswith("__"):
                 module_name = filename[:-3]  # Remove .py extension
+                module_path = f"plugins.{plugin_type}.{module_name}"
+                
+                entry = manifest.get(module_path)
+                if entry is not None and entry.get("digest") == _file_digest(os.path.join(directory, filename)):
+                    # Listed and unchanged: import on first use
+                    for plugin in entry["plugins"]:
+                        if plugin["name"] not in getattr(self, plugin_type):
+                            self.lazy_plugins[plugin_type][plugin["name"]] = {"module": module_path, **plugin}
+                    continue
+                
+                if entry is not None:
+                    logger.info(f"Plugin module {module_path} changed since the manifest was written, importing it")
                 
                 try:
                     # Import the module
-                    module_path = f"plugins.{plugin_type}.{module_name}"
                     module = importlib.import_module(module_path)
                     
                     # Find plugin classes in the module
@@ -318,13 +558,16 @@ class PluginRegistry:
                 except Exception as e:
                     logger.error(f"Failed to load plugin module {module_path}: {str(e)}")
     
-    def _register_plugins_from_module(self, module, plugin_type: str):
+    def _plugin_classes(self, module, plugin_type: str) -> Iterator[Tuple[str, type]]:
         """
-        Register plugins found in a module.
+        Find the plugin classes defined in a module.
         
         Args:
             module: Python module containing plugins
-            plugin_type: Type of plugins to register
+            plugin_type: Type of plugins to find
+        
+        Yields:
+            Tuples of (plugin name, plugin class)
         """
         # Map plugin types to their base classes
         base_classes = {
@@ -344,15 +587,36 @@ class PluginRegistry:
             if (issubclass(obj, base_class) and 
                 obj != base_class and 
                 obj.__module__ == module.__name__):
-                
-                # Register the plugin
-                plugin_name = getattr(obj, 'PLUGIN_NAME', name.lower())
-                register_method = getattr(self, f"register_{plugin_type[:-1]}")  # Remove 's' from end
-                
-                try:
-                    register_method(plugin_name, obj)
-                except Exception as e:
-                    logger.error(f"Failed to register plugin {plugin_name}: {str(e)}")
+                yield getattr(obj, 'PLUGIN_NAME', name.lower()), obj
+    
+    def _register_plugins_from_module(self, module, plugin_type: str):
+        """
+        Register plugins found in a module.
+        
+        Args:
+            module: Python module containing plugins
+            plugin_type: Type of plugins to register
+        """
+        register_methods = {
+            "frameworks": self.register_framework,
+            "models": self.register_model,
+            "strategies": self.register_strategy,
+            "datasets": self.register_dataset,
+            "preprocessors": self.register_preprocessor
+        }
+        
+        for plugin_name, plugin_class in self._plugin_classes(module, plugin_type):
+            # Register the plugin
+            register_method = register_methods[plugin_type]
+            
+            try:
+                register_method(plugin_name, plugin_class)
+            except Exception as e:
+                logger.error(f"Failed to register plugin {plugin_name}: {str(e)}")
 
 # Global registry instance
-registry = PluginRegistry() 
\ No newline at end of file
+registry = PluginRegistry() 
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    PluginRegistry().write_manifest()
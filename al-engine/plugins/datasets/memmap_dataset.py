@@ -0,0 +1,212 @@
+"""
+Memory-Mapped Dataset Plugin
+
+Serves features from ``.npy`` or raw binary files through ``np.memmap`` so
+that pools larger than RAM can be queried without loading them. Labels
+(``.npy``) and metadata (JSON) are stored alongside the feature file.
+"""
+
+import json
+import os
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from interfaces.base import DatasetPlugin, SampleInfo
+
+logger = logging.getLogger(__name__)
+
+class MemmapDatasetPlugin(DatasetPlugin):
+    """
+    Memory-Mapped Dataset
+    
+    Features are a (n_samples, n_features) array on disk, opened read-only.
+    Rows are paged in by the OS only when they are accessed, so slicing off
+    the unlabeled pool does not copy it.
+    
+    The leading rows are used for the initial (warm start) training set, so
+    the files are expected to be stored in shuffled order.
+    """
+    
+    PLUGIN_NAME = "memmap"
+    
+    def __init__(self, features_path: str, labels_path: Optional[str] = None,
+                 metadata_path: Optional[str] = None, dtype: str = "float32",
+                 n_features: Optional[int] = None, offset: int = 0):
+        """
+        Initialize the memory-mapped dataset.
+        
+        Args:
+            features_path: ``.npy`` file, or raw binary file of row-major features
+            labels_path: Optional ``.npy`` file of integer labels (-1 for unknown)
+            metadata_path: Optional JSON metadata file (feature_names, class_names,
+                description); defaults to ``<features_path stem>.json`` if present
+            dtype: Element type of a raw binary feature file
+            n_features: Number of columns of a raw binary feature file
+            offset: Header bytes to skip in a raw binary feature file
+        """
+        if not os.path.exists(features_path):
+            raise FileNotFoundError(f"Feature file {features_path} not found")
+        
+        self.features_path = features_path
+        self.labels_path = labels_path
+        self.dtype = np.dtype(dtype)
+        self.n_features = n_features
+        self.offset = offset
+        
+        if metadata_path is None:
+            default_metadata_path = os.path.splitext(features_path)[0] + ".json"
+            if os.path.exists(default_metadata_path):
+                metadata_path = default_metadata_path
+        self.metadata_path = metadata_path
+        
+        self.metadata: Dict[str, Any] = {}
+        if self.metadata_path:
+            with open(self.metadata_path) as f:
+                self.metadata = json.load(f)
+        
+        self.X: Optional[np.ndarray] = None
+        self.y: Optional[np.ndarray] = None
+    
+    def _open_features(self) -> np.ndarray:
+        """Map the feature file read-only."""
+        if self.features_path.endswith(".npy"):
+            X = np.load(self.features_path, mmap_mode="r")
+        else:
+            n_features = self.n_features or self.metadata.get("n_features")
+            if not n_features:
+                raise ValueError("n_features is required for raw binary feature files")
+            
+            row_bytes = self.dtype.itemsize * n_features
+            n_rows = (os.path.getsize(self.features_path) - self.offset) // row_bytes
+            X = np.memmap(self.features_path, dtype=self.dtype, mode="r",
+                          offset=self.offset, shape=(n_rows, n_features))
+        
+        if X.ndim != 2:
+            raise ValueError(f"Feature file must hold a 2-D array, got shape {X.shape}")
+        return X
+    
+    def load_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Map the dataset without reading it into memory.
+        
+        Returns:
+            Tuple of (memory-mapped features, memory-mapped labels or None)
+        """
+        if self.X is None:
+            self.X = self._open_features()
+            
+            if self.labels_path:
+                self.y = np.load(self.labels_path, mmap_mode="r")
+                if len(self.y) != len(self.X):
+                    raise ValueError(f"Label file has {len(self.y)} rows, feature file has {len(self.X)}")
+            
+            logger.info(f"Mapped dataset {self.features_path}: {self.X.shape[0]} samples, "
+                        f"{self.X.shape[1]} features ({self.X.nbytes / 2**30:.2f} GiB)")
+        
+        return self.X, self.y
+    
+    def get_initial_training_data(self, n_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get initial training data for warm start.
+        
+        Args:
+            n_samples: Number of leading rows to use
+        
+        Returns:
+            Tuple of (features, labels) copied into memory
+        """
+        X, y = self.load_data()
+        if y is None:
+            raise ValueError("Initial training requires a labels file")
+        
+        y_initial = np.asarray(y[:n_samples])
+        if np.any(y_initial < 0):
+            raise ValueError(f"The first {n_samples} rows must be labeled for initial training")
+        
+        return np.array(X[:n_samples]), y_initial
+    
+    def get_unlabeled_pool(self, n_initial: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Get the pool rows following the initial training set.
+        
+        Args:
+            n_initial: Number of leading rows used for initial training
+        
+        Returns:
+            Tuple of (memory-mapped pool features, pool labels or None)
+        """
+        X, y = self.load_data()
+        return X[n_initial:], None if y is None else y[n_initial:]
+    
+    def generate_synthetic(self, n_samples: int) -> np.ndarray:
+        """
+        Generate synthetic unlabeled samples by adding noise to random rows.
+        
+        Args:
+            n_samples: Number of synthetic samples to generate
+        
+        Returns:
+            Synthetic features (n_samples, n_features)
+        """
+        X, _ = self.load_data()
+        rng = np.random.default_rng(42)
+        
+        # Sorted row indices keep the reads sequential on disk
+        base_samples = np.asarray(X[np.sort(rng.integers(0, len(X), n_samples))], dtype=np.float64)
+        noise_std = 0.1 * np.std(base_samples, axis=0)
+        
+        return base_samples + rng.normal(0, 1, base_samples.shape) * noise_std
+    
+    def _feature_names(self) -> List[str]:
+        """Feature names from the metadata, or generic column names."""
+        names = self.metadata.get("feature_names")
+        if names and len(names) == self.X.shape[1]:
+            return names
+        return [f"feature_{i}" for i in range(self.X.shape[1])]
+    
+    def get_sample_info(self, index: int) -> SampleInfo:
+        """
+        Get detailed information about a specific sample.
+        
+        Args:
+            index: Row index
+        
+        Returns:
+            SampleInfo object with sample details
+        """
+        X, y = self.load_data()
+        metadata = {"index": index, "source": self.features_path}
+        if y is not None and y[index] >= 0:
+            metadata["label"] = int(y[index])
+        
+        return SampleInfo(
+            sample_id=f"sample_{index}",
+            features={name: float(value) for name, value in zip(self._feature_names(), X[index])},
+            uncertainty_score=0.0,
+            metadata=metadata
+        )
+    
+    def get_dataset_info(self) -> Dict[str, Any]:
+        """
+        Get information about the dataset.
+        
+        Returns:
+            Dict containing dataset metadata
+        """
+        X, y = self.load_data()
+        
+        return {
+            "name": self.metadata.get("name", os.path.basename(self.features_path)),
+            "description": self.metadata.get("description", ""),
+            "storage": "memmap",
+            "features_path": self.features_path,
+            "labels_path": self.labels_path,
+            "n_samples": int(X.shape[0]),
+            "n_features": int(X.shape[1]),
+            "dtype": str(X.dtype),
+            "size_bytes": int(X.nbytes),
+            "has_labels": y is not None,
+            "feature_names": self._feature_names(),
+            "class_names": self.metadata.get("class_names")
+        }
@@ -0,0 +1,189 @@
+"""
+Sparse Dataset Plugin
+
+Serves text or hashed features stored as a scipy.sparse ``.npz`` file (see
+``scipy.sparse.save_npz``). The matrix is kept in CSR form end to end, so
+memory grows with the number of non-zero entries rather than with
+samples x features. Labels (``.npy``) and metadata (JSON) are stored
+alongside the feature file.
+"""
+
+import json
+import os
+import numpy as np
+import scipy.sparse as sp
+from typing import Dict, Any, List, Optional, Tuple
+import logging
+
+from interfaces.base import DatasetPlugin, SampleInfo
+from utils.sparse import nonzero_entries
+
+logger = logging.getLogger(__name__)
+
+class SparseDatasetPlugin(DatasetPlugin):
+    """
+    Sparse (CSR) Dataset
+    
+    The leading rows are used for the initial (warm start) training set, so
+    the file is expected to be stored in shuffled order.
+    """
+    
+    PLUGIN_NAME = "sparse"
+    
+    def __init__(self, features_path: str, labels_path: Optional[str] = None,
+                 metadata_path: Optional[str] = None):
+        """
+        Initialize the sparse dataset.
+        
+        Args:
+            features_path: ``.npz`` file written by scipy.sparse.save_npz
+            labels_path: Optional ``.npy`` file of integer labels (-1 for unknown)
+            metadata_path: Optional JSON metadata file (feature_names, class_names,
+                description); defaults to ``<features_path stem>.json`` if present
+        """
+        if not os.path.exists(features_path):
+            raise FileNotFoundError(f"Feature file {features_path} not found")
+        
+        self.features_path = features_path
+        self.labels_path = labels_path
+        
+        if metadata_path is None:
+            default_metadata_path = os.path.splitext(features_path)[0] + ".json"
+            if os.path.exists(default_metadata_path):
+                metadata_path = default_metadata_path
+        self.metadata_path = metadata_path
+        
+        self.metadata: Dict[str, Any] = {}
+        if self.metadata_path:
+            with open(self.metadata_path) as f:
+                self.metadata = json.load(f)
+        
+        self.X: Optional[sp.csr_matrix] = None
+        self.y: Optional[np.ndarray] = None
+    
+    def load_data(self) -> Tuple[sp.csr_matrix, np.ndarray]:
+        """
+        Load the sparse feature matrix.
+        
+        Returns:
+            Tuple of (CSR features, labels or None)
+        """
+        if self.X is None:
+            self.X = sp.load_npz(self.features_path).tocsr()
+            
+            if self.labels_path:
+                self.y = np.load(self.labels_path, mmap_mode="r")
+                if len(self.y) != self.X.shape[0]:
+                    raise ValueError(f"Label file has {len(self.y)} rows, feature file has {self.X.shape[0]}")
+            
+            logger.info(f"Loaded sparse dataset {self.features_path}: {self.X.shape[0]} samples, "
+                        f"{self.X.shape[1]} features, {self.X.nnz} non-zeros")
+        
+        return self.X, self.y
+    
+    def get_initial_training_data(self, n_samples: int) -> Tuple[sp.csr_matrix, np.ndarray]:
+        """
+        Get initial training data for warm start.
+        
+        Args:
+            n_samples: Number of leading rows to use
+        
+        Returns:
+            Tuple of (CSR features, labels)
+        """
+        X, y = self.load_data()
+        if y is None:
+            raise ValueError("Initial training requires a labels file")
+        
+        y_initial = np.asarray(y[:n_samples])
+        if np.any(y_initial < 0):
+            raise ValueError(f"The first {n_samples} rows must be labeled for initial training")
+        
+        return X[:n_samples], y_initial
+    
+    def get_unlabeled_pool(self, n_initial: int) -> Tuple[sp.csr_matrix, Optional[np.ndarray]]:
+        """
+        Get the pool rows following the initial training set.
+        
+        Args:
+            n_initial: Number of leading rows used for initial training
+        
+        Returns:
+            Tuple of (CSR pool features, pool labels or None)
+        """
+        X, y = self.load_data()
+        return X[n_initial:], None if y is None else y[n_initial:]
+    
+    def generate_synthetic(self, n_samples: int) -> sp.csr_matrix:
+        """
+        Generate synthetic samples by perturbing the non-zero values of random rows.
+        
+        The sparsity pattern of each base row is kept.
+        
+        Args:
+            n_samples: Number of synthetic samples to generate
+        
+        Returns:
+            Synthetic CSR features (n_samples, n_features)
+        """
+        X, _ = self.load_data()
+        rng = np.random.default_rng(42)
+        
+        synthetic = X[rng.integers(0, X.shape[0], n_samples)].astype(np.float64)
+        noise_std = 0.1 * (np.std(synthetic.data) if synthetic.nnz else 0.0)
+        synthetic.data += rng.normal(0, noise_std, synthetic.nnz)
+        return synthetic
+    
+    def _feature_name(self, column: int) -> str:
+        """Feature name of a column from the metadata, or a generic column name."""
+        names = self.metadata.get("feature_names")
+        if names and len(names) == self.X.shape[1]:
+            return names[column]
+        return f"feature_{column}"
+    
+    def get_sample_info(self, index: int) -> SampleInfo:
+        """
+        Get detailed information about a specific sample.
+        
+        Args:
+            index: Row index
+        
+        Returns:
+            SampleInfo object with the sample's non-zero features
+        """
+        X, y = self.load_data()
+        metadata = {"index": index, "source": self.features_path}
+        if y is not None and y[index] >= 0:
+            metadata["label"] = int(y[index])
+        
+        return SampleInfo(
+            sample_id=f"sample_{index}",
+            features={self._feature_name(column): value for column, value in nonzero_entries(X[index])},
+            uncertainty_score=0.0,
+            metadata=metadata
+        )
+    
+    def get_dataset_info(self) -> Dict[str, Any]:
+        """
+        Get information about the dataset.
+        
+        Returns:
+            Dict containing dataset metadata
+        """
+        X, y = self.load_data()
+        
+        return {
+            "name": self.metadata.get("name", os.path.basename(self.features_path)),
+            "description": self.metadata.get("description", ""),
+            "storage": "sparse",
+            "features_path": self.features_path,
+            "labels_path": self.labels_path,
+            "n_samples": int(X.shape[0]),
+            "n_features": int(X.shape[1]),
+            "nnz": int(X.nnz),
+            "density": float(X.nnz / max(1, X.shape[0] * X.shape[1])),
+            "dtype": str(X.dtype),
+            "size_bytes": int(X.data.nbytes + X.indices.nbytes + X.indptr.nbytes),
+            "has_labels": y is not None,
+            "class_names": self.metadata.get("class_names")
+        }
@@ -0,0 +1,361 @@
+"""
+Online Learning AL Framework Plugin
+
+Active learning with scikit-learn estimators that learn incrementally
+through partial_fit (SGD, passive-aggressive, naive Bayes). A model update
+only trains on the newly labeled rows, so its cost does not grow with the
+labeled set. Dataset loading, preprocessing, querying and snapshots are
+shared with the sklearn framework plugin.
+
+Metrics are progressive-validation estimates: every new label is scored by
+the model before the model learns from it, and the running confusion matrix
+gives accuracy, precision, recall and F1 without re-predicting the labeled set.
+"""
+
+import numpy as np
+from typing import Dict, Any, Tuple
+from datetime import datetime
+import logging
+
+from interfaces.base import ModelMetrics
+from plugins.frameworks.sklearn_plugin import SklearnALPlugin
+from utils.training_buffer import TrainingBuffer
+from utils.snapshot_io import save_array, load_array
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.linear_model import SGDClassifier, PassiveAggressiveClassifier, Perceptron
+from sklearn.naive_bayes import GaussianNB, MultinomialNB, BernoulliNB
+
+logger = logging.getLogger(__name__)
+
+ONLINE_ESTIMATORS = {
+    "sgd": SGDClassifier,
+    "passive_aggressive": PassiveAggressiveClassifier,
+    "perceptron": Perceptron,
+    "gaussian_nb": GaussianNB,
+    "multinomial_nb": MultinomialNB,
+    "bernoulli_nb": BernoulliNB
+}
+
+class MarginProbabilities(ClassifierMixin, BaseEstimator):
+    """
+    Class probabilities for margin classifiers without predict_proba.
+    
+    Uncertainty scoring needs probabilities; this wrapper maps the decision
+    function of e.g. PassiveAggressiveClassifier through a softmax (a
+    sigmoid for two classes).
+    """
+    
+    def __init__(self, estimator=None):
+        """
+        Initialize the wrapper.
+        
+        Args:
+            estimator: Classifier with partial_fit and decision_function
+        """
+        self.estimator = estimator
+    
+    @property
+    def classes_(self) -> np.ndarray:
+        """Class labels the estimator was trained with."""
+        return self.estimator.classes_
+    
+    def partial_fit(self, X: np.ndarray, y: np.ndarray, classes=None) -> 'MarginProbabilities':
+        """Train the estimator on a batch."""
+        self.estimator.partial_fit(X, y, classes=classes)
+        return self
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict labels."""
+        return self.estimator.predict(X)
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Turn decision function values into class probabilities.
+        
+        Args:
+            X: Features
+        
+        Returns:
+            Probabilities (n_samples, n_classes)
+        """
+        margins = self.estimator.decision_function(X)
+        if margins.ndim == 1:
+            positive = 1.0 / (1.0 + np.exp(-margins))
+            return np.column_stack([1.0 - positive, positive])
+        
+        margins = margins - margins.max(axis=1, keepdims=True)
+        exp_margins = np.exp(margins)
+        return exp_margins / exp_margins.sum(axis=1, keepdims=True)
+
+def _weighted_scores(confusion: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Accuracy and support-weighted precision, recall and F1 of a confusion matrix.
+    
+    Args:
+        confusion: Counts indexed by (true class, predicted class)
+    
+    Returns:
+        Tuple of (accuracy, precision, recall, f1); classes without
+        predictions score 0, as in sklearn.metrics
+    """
+    total = confusion.sum()
+    if total == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    
+    true_positives = np.diag(confusion).astype(np.float64)
+    support = confusion.sum(axis=1)
+    predicted = confusion.sum(axis=0)
+    
+    precision = np.divide(true_positives, predicted, out=np.zeros_like(true_positives), where=predicted > 0)
+    recall = np.divide(true_positives, support, out=np.zeros_like(true_positives), where=support > 0)
+    denominator = precision + recall
+    f1 = np.divide(2 * precision * recall, denominator, out=np.zeros_like(true_positives), where=denominator > 0)
+    
+    weights = support / total
+    return (float(true_positives.sum() / total), float(weights @ precision),
+            float(weights @ recall), float(weights @ f1))
+
+def _model_info(estimator) -> Dict[str, Any]:
+    """Describe an (unwrapped) online estimator for ModelMetrics."""
+    if isinstance(estimator, MarginProbabilities):
+        estimator = estimator.estimator
+    return {
+        "library": "scikit-learn",
+        "algorithm": type(estimator).__name__,
+        "parameters": estimator.get_params(),
+        "evaluation": "progressive_validation"
+    }
+
+class OnlineALPlugin(SklearnALPlugin):
+    """
+    Online Learning Active Learning Plugin
+    
+    Updates the model with partial_fit on each batch of new labels instead
+    of refitting it on the whole labeled set.
+    """
+    
+    PLUGIN_NAME = "online"
+    
+    def __init__(self):
+        """Initialize the online AL plugin."""
+        super().__init__()
+        self.classes = None
+        self.initial_epochs = 1
+        self.confusion = None
+        self.model_info = {}
+    
+    def _create_estimator(self, model_config: Dict[str, Any]):
+        """
+        Create the partial_fit estimator selected in the model configuration.
+        
+        Args:
+            model_config: Model configuration (type, parameters, optional
+                "classes" and "initial_epochs")
+        
+        Returns:
+            scikit-learn estimator with partial_fit and predict_proba
+        """
+        model_type = model_config.get('type', 'sgd')
+        model_params = dict(model_config.get('parameters', {}))
+        
+        if model_type not in ONLINE_ESTIMATORS:
+            raise ValueError(f"Unknown online model '{model_type}'. Available: {list(ONLINE_ESTIMATORS.keys())}")
+        
+        # Logistic loss gives SGD calibrated probabilities
+        if model_type == "sgd":
+            model_params.setdefault("loss", "log_loss")
+        
+        self.classes = np.unique(model_config['classes']) if model_config.get('classes') else None
+        self.initial_epochs = max(1, int(model_config.get('initial_epochs', 1)))
+        
+        estimator = ONLINE_ESTIMATORS[model_type](**model_params)
+        if not hasattr(estimator, "predict_proba"):
+            estimator = MarginProbabilities(estimator)
+        self.model_info = _model_info(estimator)
+        return estimator
+    
+    def _uses_modal(self) -> bool:
+        """The online plugin trains the estimator directly; modAL's teach() refits."""
+        return False
+    
+    def _record_predictions(self, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        """Add predictions to the running confusion matrix."""
+        np.add.at(self.confusion, (np.searchsorted(self.classes, y_true),
+                                   np.searchsorted(self.classes, y_pred)), 1)
+    
+    def train_initial_model(self, X_train: np.ndarray, y_train: np.ndarray) -> Dict[str, Any]:
+        """
+        Train the initial model with partial_fit.
+        
+        Args:
+            X_train: Training features
+            y_train: Training labels
+        
+        Returns:
+            Training result
+        """
+        if not self.is_initialized:
+            raise ValueError("Plugin not initialized. Call initialize() first.")
+        
+        try:
+            self.labeled = TrainingBuffer(X_train, y_train)
+            self.X_train, self.y_train = self.labeled.X, self.labeled.y
+            
+            # partial_fit needs every class up front; later labels must be among them
+            if self.classes is None:
+                self.classes = np.unique(self.y_train)
+            for _ in range(self.initial_epochs):
+                self.estimator.partial_fit(self.X_train, self.y_train, classes=self.classes)
+            
+            # The initial set is scored after training, later labels before it
+            self.confusion = np.zeros((len(self.classes), len(self.classes)), dtype=np.int64)
+            self._record_predictions(self.y_train, self.estimator.predict(self.X_train))
+            self.model_version += 1
+            
+            initial_metrics = self._calculate_metrics()
+            self._log_training_event("initial_training", len(y_train))
+            
+            return {
+                "status": "success",
+                "samples_trained": len(y_train),
+                "initial_metrics": initial_metrics.__dict__
+            }
+        
+        except Exception as e:
+            logger.error(f"Initial training failed: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    def update_model(self, X_new: np.ndarray, y_new: np.ndarray) -> Dict[str, Any]:
+        """
+        Update the model with newly labeled samples only.
+        
+        Args:
+            X_new: New training features
+            y_new: New training labels
+        
+        Returns:
+            Update result
+        """
+        if not self.is_initialized:
+            raise ValueError("Plugin not initialized. Call initialize() first.")
+        
+        try:
+            if self.dtype_policy.configured:
+                X_new = self.dtype_policy.as_features(X_new)
+            y_new = np.asarray(y_new)
+            
+            unknown = np.setdiff1d(y_new, self.classes)
+            if len(unknown):
+                return {
+                    "status": "error",
+                    "error": f"Labels {unknown.tolist()} are not among the model's classes "
+                             f"{self.classes.tolist()}; list all classes in model.classes",
+                    "retryable": False
+                }
+            
+            metrics_before = self._calculate_metrics()
+            
+            # Score the new labels before learning from them (progressive validation);
+            # record the scores only once the update succeeded, so a retry counts them once
+            y_pred = self.estimator.predict(X_new)
+            self.estimator.partial_fit(X_new, y_new)
+            self._record_predictions(y_new, y_pred)
+            
+            self.labeled.append(X_new, y_new)
+            self.X_train, self.y_train = self.labeled.X, self.labeled.y
+            self.model_version += 1
+            
+            metrics_after = self._calculate_metrics()
+            self._log_training_event("model_update", len(y_new))
+            
+            return {
+                "status": "success",
+                "samples_added": len(y_new),
+                "update_mode": "partial_fit",
+                "metrics_before": metrics_before.__dict__,
+                "metrics_after": metrics_after.__dict__
+            }
+        
+        except Exception as e:
+            logger.error(f"Model update failed: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e),
+                # Invalid input fails the same way again; other errors may be transient
+                "retryable": not isinstance(e, ValueError)
+            }
+    
+    def _calculate_metrics(self) -> ModelMetrics:
+        """
+        Calculate progressive-validation metrics from the running confusion matrix.
+        
+        Metrics are cached per model version like the sklearn plugin's, so
+        the metrics before an update are those computed after the last one.
+        
+        Returns:
+            ModelMetrics object
+        """
+        if not self.is_initialized or self.confusion is None:
+            return ModelMetrics(
+                accuracy=0.0, f1_score=0.0, precision=0.0, recall=0.0,
+                labeled_count=0, total_samples=0, last_updated="",
+                model_info={}
+            )
+        
+        cached_metrics = self.prediction_cache.get("metrics", self.model_version)
+        if cached_metrics is not None:
+            return cached_metrics
+        
+        accuracy, precision, recall, f1 = _weighted_scores(self.confusion)
+        metrics = ModelMetrics(
+            accuracy=accuracy,
+            f1_score=f1,
+            precision=precision,
+            recall=recall,
+            labeled_count=len(self.y_train),
+            total_samples=len(self.y_train) + self.X_unlabeled.shape[0],
+            last_updated=datetime.now().isoformat(),
+            model_info=self.model_info
+        )
+        
+        self.prediction_cache.put("metrics", self.model_version, metrics)
+        return metrics
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get current framework state.
+        
+        Returns:
+            Framework state
+        """
+        state = super().get_state()
+        state["classes"] = self.classes.tolist() if self.classes is not None else None
+        return state
+    
+    def save_snapshot(self, directory: str) -> None:
+        """
+        Write a binary snapshot, including the classes and the running confusion matrix.
+        
+        Args:
+            directory: Directory to write into
+        """
+        super().save_snapshot(directory)
+        save_array(directory, "classes", self.classes)
+        save_array(directory, "confusion", self.confusion)
+    
+    def load_snapshot(self, directory: str) -> None:
+        """
+        Restore the framework from a snapshot without retraining.
+        
+        Args:
+            directory: Snapshot directory
+        """
+        super().load_snapshot(directory)
+        self.classes = load_array(directory, "classes")
+        self.confusion = load_array(directory, "confusion")
+        model_config = self.config.get('model', {})
+        self.initial_epochs = max(1, int(model_config.get('initial_epochs', 1)))
+        self.model_info = _model_info(self.estimator)
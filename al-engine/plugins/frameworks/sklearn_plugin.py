@@ -5,15 +5,26 @@ This plugin provides Active Learning functionality using scikit-learn models
 with optional modAL integration for advanced query strategies.
 """
 
+import os
 import numpy as np
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 import logging
 
-from interfaces.base import ALFrameworkPlugin, ModelMetrics
+from interfaces.base import ALFrameworkPlugin, QueryStrategyPlugin, PreprocessorPlugin, ModelMetrics
+from plugin_registry import registry
+from utils.uncertainty import uncertainty_scores, top_k_indices
+from utils.prediction_cache import PredictionCache
+from utils.streaming import stream_top_k, iter_chunk_bounds
+from utils.dataset_cache import DatasetCache
+from utils.dtype_policy import DtypePolicy
+from utils.sparse import is_sparse
+from utils.training_buffer import TrainingBuffer
+from utils.forest_growth import ForestGrowthPolicy, ForestGrowth
+from utils.tree_probability_cache import TreeProbabilityCache
+from utils.snapshot_io import save_array, load_array, create_array, save_object, load_object, save_manifest, load_manifest
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.datasets import load_wine
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 
@@ -28,6 +39,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Rows scored per chunk for memory-mapped pools without scoring.chunk_size
+MEMMAP_CHUNK_SIZE = 65536
+
 class SklearnALPlugin(ALFrameworkPlugin):
     """
     Scikit-Learn Active Learning Plugin
@@ -44,9 +58,20 @@ class SklearnALPlugin(ALFrameworkPlugin):
         self.config = None
         self.X_train = None
         self.y_train = None
+        self.labeled: Optional[TrainingBuffer] = None
+        self.forest_growth: Optional[ForestGrowth] = None
+        self.tree_cache: Optional[TreeProbabilityCache] = None
         self.X_unlabeled = None
-        self.scaler = StandardScaler()
+        self.dataset = None
+        self.query_strategy = None
+        self.scoring_config = {}
+        self.preprocessor = None
+        self.dtype_policy = DtypePolicy()
         self.training_history = []
+        self.model_version = 0
+        self.prediction_cache = PredictionCache()
+        self.snapshot_path = None
+        self.dataset_cache_status = None
         self.is_initialized = False
         
         logger.info("Scikit-learn AL plugin initialized")
@@ -65,20 +90,27 @@ class SklearnALPlugin(ALFrameworkPlugin):
         dataset_config = config.get('dataset', {})
         
         # Initialize model based on config
-        model_type = model_config.get('type', 'random_forest')
-        model_params = model_config.get('parameters', {})
+        estimator = self._create_estimator(model_config)
+        self.forest_growth = self._create_forest_growth(model_config, estimator)
+        # Incremental updates change few trees; rescore only those
+        self.tree_cache = TreeProbabilityCache() if self.forest_growth is not None else None
         
-        if model_type == 'random_forest':
-            estimator = RandomForestClassifier(**model_params)
-        else:
-            # Default to random forest
-            estimator = RandomForestClassifier(n_estimators=50, random_state=42)
+        # Initialize query strategy plugin
+        self.query_strategy = self._create_query_strategy(config.get('query_strategy', {}))
+        self.scoring_config = config.get('scoring') or {}
+        self.dtype_policy = DtypePolicy.from_config(config)
         
         # Load dataset
         self._load_dataset(dataset_config)
         
+        # Let pool-dependent strategies (e.g. density indexes) start precomputing
+        if hasattr(self.query_strategy, 'prepare_pool'):
+            self.query_strategy.prepare_pool(self.X_unlabeled, dataset_dir=self._dataset_dir())
+        self.model_version = 0
+        self.prediction_cache = PredictionCache()
+        
         # Initialize active learner if modAL is available
-        if MODAL_AVAILABLE:
+        if self._uses_modal():
             self.model = ActiveLearner(
                 estimator=estimator,
                 query_strategy=uncertainty_sampling
@@ -91,6 +123,209 @@ class SklearnALPlugin(ALFrameworkPlugin):
         self.is_initialized = True
         logger.info("Scikit-learn AL plugin initialized with configuration")
     
+    def _create_query_strategy(self, strategy_config: Dict[str, Any]) -> Optional[QueryStrategyPlugin]:
+        """
+        Create the query strategy plugin selected in the configuration.
+        
+        Args:
+            strategy_config: Query strategy configuration (type and parameters)
+        
+        Returns:
+            Query strategy plugin, or None if the strategy is not registered
+        """
+        if isinstance(strategy_config, str):
+            strategy_config = {'type': strategy_config}
+        
+        strategy_type = strategy_config.get('type', 'uncertainty_sampling')
+        strategy_params = strategy_config.get('parameters', {})
+        
+        if not registry.is_available("strategy", strategy_type):
+            logger.warning(f"Query strategy '{strategy_type}' not registered, using default uncertainty sampling")
+            return None
+        
+        return registry.get_strategy(strategy_type, **strategy_params)
+    
+    def _create_estimator(self, model_config: Dict[str, Any]):
+        """
+        Create the unfitted estimator selected in the model configuration.
+        
+        Args:
+            model_config: Model configuration (type and parameters)
+        
+        Returns:
+            scikit-learn estimator
+        """
+        model_type = model_config.get('type', 'random_forest')
+        model_params = model_config.get('parameters', {})
+        
+        if model_type == 'random_forest':
+            return RandomForestClassifier(**model_params)
+        # Default to random forest
+        return RandomForestClassifier(n_estimators=50, random_state=42)
+    
+    def _uses_modal(self) -> bool:
+        """Whether the estimator is wrapped in a modAL ActiveLearner."""
+        return MODAL_AVAILABLE
+    
+    def _create_forest_growth(self, model_config: Dict[str, Any], estimator,
+                              state: Optional[Dict[str, Any]] = None) -> Optional[ForestGrowth]:
+        """
+        Create the incremental update state selected in the model configuration.
+        
+        Args:
+            model_config: Model configuration ("incremental" entry)
+            estimator: Unfitted estimator (its n_estimators is the full refit size)
+            state: Growth counters of a restored snapshot
+        
+        Returns:
+            ForestGrowth, or None if every update refits the model in full
+        """
+        policy = ForestGrowthPolicy.from_config(model_config.get('incremental'))
+        if policy is None:
+            return None
+        
+        base_trees = (state or {}).get('base_trees') or estimator.get_params().get('n_estimators', 100)
+        return ForestGrowth(policy, base_trees=base_trees, state=state)
+    
+    def _dataset_dir(self) -> Optional[str]:
+        """Directory of the dataset plugin's files, if the dataset is file-backed."""
+        features_path = getattr(self.dataset, 'features_path', None)
+        return os.path.dirname(os.path.abspath(features_path)) if features_path else None
+    
+    def _get_learner(self):
+        """Get the fitted learner (modAL ActiveLearner or plain estimator)."""
+        if MODAL_AVAILABLE and self.model:
+            return self.model
+        return self.estimator
+    
+    def _get_estimator(self):
+        """Get the underlying scikit-learn estimator."""
+        if MODAL_AVAILABLE and self.model:
+            return self.model.estimator
+        return self.estimator
+    
+    def _labeled_features(self) -> np.ndarray:
+        """Get the features the model has been trained on so far."""
+        if MODAL_AVAILABLE and self.model and self.model.X_training is not None:
+            return self.model.X_training
+        return self.X_train
+    
+    def _labeled_targets(self) -> np.ndarray:
+        """Get the labels the model has been trained on so far."""
+        if MODAL_AVAILABLE and self.model and self.model.y_training is not None:
+            return self.model.y_training
+        return self.y_train
+    
+    def _pool_probabilities(self) -> np.ndarray:
+        """
+        Get class probabilities for the whole unlabeled pool.
+        
+        The pool is scored once per model version and served from the
+        prediction cache until the next model update. With incremental forest
+        growth only the trees added or retired since the last scoring are run.
+        Memory-mapped pools are scored chunk by chunk.
+        
+        Returns:
+            Class probabilities (n_pool, n_classes)
+        """
+        def score_pool() -> np.ndarray:
+            estimator = self._get_estimator()
+            if self.tree_cache is not None and hasattr(estimator, 'estimators_'):
+                return self.dtype_policy.as_scores(self.tree_cache.probabilities(estimator, self.X_unlabeled))
+            
+            learner = self._get_learner()
+            chunk_size = self._scoring_chunk_size()
+            if chunk_size is None:
+                return self.dtype_policy.as_scores(learner.predict_proba(self.X_unlabeled))
+            return np.concatenate([
+                self.dtype_policy.as_scores(learner.predict_proba(self.X_unlabeled[start:stop]))
+                for start, stop in iter_chunk_bounds(self.X_unlabeled.shape[0], chunk_size)
+            ])
+        
+        return self.prediction_cache.get_or_compute("pool_probabilities", self.model_version, score_pool)
+    
+    def _candidate_probabilities(self, X_unlabeled: np.ndarray,
+                                 candidate_indices: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Get class probabilities for the rows being queried.
+        
+        The whole pool is scored (and cached) unless only a small candidate
+        subset is queried and the pool has not been scored for this model
+        version yet; then only the candidates are scored.
+        
+        Args:
+            X_unlabeled: Unlabeled data pool
+            candidate_indices: Optional rows of X_unlabeled to score
+        
+        Returns:
+            Class probabilities aligned with the candidate rows
+        """
+        pool_cached = self.prediction_cache.contains("pool_probabilities", self.model_version)
+        is_subset = candidate_indices is not None and 2 * len(candidate_indices) < X_unlabeled.shape[0]
+        
+        # The tree cache keeps whole-pool rescoring cheap, so it is preferred
+        # over scoring a candidate subset with the full forest
+        if X_unlabeled is self.X_unlabeled and (pool_cached or not is_subset or self.tree_cache is not None):
+            probabilities = self._pool_probabilities()
+            return probabilities if candidate_indices is None else probabilities[candidate_indices]
+        
+        X_candidates = X_unlabeled if candidate_indices is None else X_unlabeled[candidate_indices]
+        return self._get_learner().predict_proba(X_candidates)
+    
+    def _scoring_chunk_size(self) -> Optional[int]:
+        """Rows scored per chunk: scoring.chunk_size, or a default for memory-mapped pools."""
+        if self.scoring_config.get('chunk_size'):
+            return int(self.scoring_config['chunk_size'])
+        # One predict_proba call would read the whole mapped pool into memory
+        if isinstance(self.X_unlabeled, np.memmap):
+            return MEMMAP_CHUNK_SIZE
+        return None
+    
+    def _use_streaming(self) -> bool:
+        """Whether queries score the pool in chunks instead of all at once."""
+        if self._scoring_chunk_size() is None:
+            return False
+        # Streaming needs per-chunk scores; strategies without them see the whole pool
+        return self.query_strategy is None or hasattr(self.query_strategy, 'score_samples')
+    
+    def _stream_query(self, X_unlabeled: np.ndarray, n_samples: int,
+                      candidate_indices: Optional[np.ndarray]) -> List[int]:
+        """
+        Select samples by scoring the candidates chunk by chunk.
+        
+        Only a running top-k of the scores is kept, so peak memory is bounded
+        by the chunk size (times scoring.n_jobs threads) for any pool size.
+        
+        Args:
+            X_unlabeled: Unlabeled data pool
+            n_samples: Number of samples to select
+            candidate_indices: Optional rows of X_unlabeled to choose from
+        
+        Returns:
+            Positions of the selected samples, most informative first
+        """
+        learner = self._get_learner()
+        n_candidates = X_unlabeled.shape[0] if candidate_indices is None else len(candidate_indices)
+        
+        def score_chunk(start: int, stop: int) -> np.ndarray:
+            rows = np.arange(start, stop) if candidate_indices is None else candidate_indices[start:stop]
+            X_chunk = X_unlabeled[start:stop] if candidate_indices is None else X_unlabeled[rows]
+            probabilities = learner.predict_proba(X_chunk)
+            
+            if self.query_strategy is not None:
+                return self.query_strategy.score_samples(
+                    learner, X_chunk, probabilities=probabilities, pool=X_unlabeled, indices=rows
+                )
+            return uncertainty_scores(probabilities, "least_confidence")
+        
+        positions, scores = stream_top_k(
+            score_chunk, n_candidates, n_samples,
+            chunk_size=self._scoring_chunk_size(),
+            n_jobs=int(self.scoring_config.get('n_jobs', 1))
+        )
+        self.query_scores = scores
+        return positions.tolist()
+    
     def _load_dataset(self, dataset_config: Dict[str, Any]):
         """
         Load and prepare the dataset.
@@ -99,33 +334,214 @@ class SklearnALPlugin(ALFrameworkPlugin):
             dataset_config: Dataset configuration
         """
         dataset_type = dataset_config.get('type', 'wine')
+        self.dataset_cache_status = None
         
         if dataset_type == 'wine':
-            # Load wine dataset
-            wine_data = load_wine()
-            X, y = wine_data.data, wine_data.target
-            
-            # Split into initial training and unlabeled pool
-            X_train, X_unlabeled, y_train, y_unlabeled = train_test_split(
-                X, y, test_size=0.7, random_state=42, stratify=y
-            )
-            
-            # Scale features
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_unlabeled_scaled = self.scaler.transform(X_unlabeled)
-            
-            self.X_train = X_train_scaled
-            self.y_train = y_train
-            self.X_unlabeled = X_unlabeled_scaled
-            self.y_unlabeled = y_unlabeled  # For evaluation purposes
+            self.preprocessor = self._create_preprocessor(['standard_scaler'])
+            spec = {
+                "type": dataset_type,
+                "test_size": 0.7,
+                "random_state": 42,
+                "synthetic_samples": dataset_config.get('synthetic_samples', 100),
+                "preprocessing": self.preprocessor.get_spec(),
+                "dtype": {"features": self.dtype_policy.features.name, "storage": self.dtype_policy.storage.name}
+            }
+            cache = DatasetCache.from_env() if dataset_config.get('cache', True) else None
+            cached = cache.get(spec) if cache is not None else None
             
-            # Generate synthetic samples if requested
-            n_synthetic = dataset_config.get('synthetic_samples', 100)
-            if n_synthetic > 0:
-                synthetic_samples = self._generate_synthetic_samples(n_synthetic)
-                self.X_unlabeled = np.vstack([self.X_unlabeled, synthetic_samples])
+            if cached is not None:
+                arrays, objects = cached
+                self.X_train = arrays["X_train"]
+                self.y_train = arrays["y_train"]
+                self.X_unlabeled = arrays["X_unlabeled"]
+                self.y_unlabeled = arrays["y_unlabeled"]
+                self.preprocessor = objects["preprocessor"]
+                # Synthetic generation seeds the global RNG that unseeded models
+                # draw from; restoring its state keeps cached runs reproducible
+                np.random.set_state(objects["rng_state"])
+                self.dataset_cache_status = {"key": cache.key(spec), "hit": True}
+                logger.info(f"Loaded prepared dataset from cache entry {cache.key(spec)}")
+            else:
+                self._prepare_wine_dataset(spec)
+                if cache is not None:
+                    try:
+                        key = cache.put(
+                            spec,
+                            arrays={"X_train": self.X_train, "y_train": self.y_train,
+                                    "X_unlabeled": self.X_unlabeled, "y_unlabeled": self.y_unlabeled},
+                            objects={"preprocessor": self.preprocessor, "rng_state": np.random.get_state()}
+                        )
+                        self.dataset_cache_status = {"key": key, "hit": False}
+                    except OSError as e:
+                        logger.warning(f"Could not cache prepared dataset in {cache.root}: {e}")
+        else:
+            self._load_plugin_dataset(dataset_type, dataset_config)
+        
+        logger.info(f"Dataset loaded: {self.X_train.shape[0]} training, {self.X_unlabeled.shape[0]} unlabeled")
+    
+    def _prepare_wine_dataset(self, spec: Dict[str, Any]):
+        """
+        Load, split, preprocess and extend the wine dataset.
+        
+        Args:
+            spec: Dataset spec (split, seed and synthetic sample count)
+        """
+        # Load wine dataset
+        wine_data = load_wine()
+        X, y = wine_data.data, wine_data.target
+        
+        # Split into initial training and unlabeled pool
+        X_train, X_unlabeled, y_train, y_unlabeled = train_test_split(
+            X, y, test_size=spec["test_size"], random_state=spec["random_state"], stratify=y
+        )
+        
+        # Preprocess features
+        X_train_scaled = self.preprocessor.fit_transform(X_train)
+        X_unlabeled_scaled = self.preprocessor.transform(X_unlabeled)
+        
+        self.X_train = X_train_scaled
+        self.y_train = y_train
+        self.X_unlabeled = X_unlabeled_scaled
+        self.y_unlabeled = y_unlabeled  # For evaluation purposes
+        
+        # Generate synthetic samples if requested
+        n_synthetic = spec["synthetic_samples"]
+        if n_synthetic > 0:
+            synthetic_samples = self._generate_synthetic_samples(n_synthetic)
+            self.X_unlabeled = np.vstack([self.X_unlabeled, synthetic_samples])
+        
+        self.X_train = self.dtype_policy.as_features(self.X_train)
+        self.X_unlabeled = self.dtype_policy.as_storage(self.X_unlabeled)
+    
+    def _load_plugin_dataset(self, dataset_type: str, dataset_config: Dict[str, Any]):
+        """
+        Load the dataset through a registered dataset plugin.
+        
+        The leading rows form the initial training set and the remaining rows
+        the unlabeled pool. The pool is used as returned by the plugin (e.g. a
+        memory-mapped view) unless preprocessing is configured, and it is not
+        extended with synthetic samples, which would copy it into memory.
+        
+        Args:
+            dataset_type: Registered dataset plugin name
+            dataset_config: Dataset configuration (type, parameters, initial_samples)
+        """
+        if not registry.is_available("dataset", dataset_type):
+            raise ValueError(f"Unknown dataset '{dataset_type}'. Available: {['wine'] + registry.list_available()['datasets']}")
+        
+        self.dataset = registry.get_dataset(dataset_type, **dataset_config.get('parameters', {}))
+        n_initial = dataset_config.get('initial_samples', 100)
+        
+        self.X_train, self.y_train = self.dataset.get_initial_training_data(n_initial)
         
-        logger.info(f"Dataset loaded: {len(self.X_train)} training, {len(self.X_unlabeled)} unlabeled")
+        if hasattr(self.dataset, 'get_unlabeled_pool'):
+            self.X_unlabeled, self.y_unlabeled = self.dataset.get_unlabeled_pool(n_initial)
+        else:
+            X, y = self.dataset.load_data()
+            self.X_unlabeled = X[n_initial:]
+            self.y_unlabeled = None if y is None else y[n_initial:]
+        
+        self.preprocessor = self._create_preprocessor([])
+        # The pool is only converted to the storage dtype when the experiment sets a dtype policy
+        convert_pool = self.dtype_policy.configured and self.X_unlabeled.dtype != self.dtype_policy.storage
+        if self.preprocessor.steps or convert_pool:
+            self._preprocess_plugin_pool(dataset_type, dataset_config)
+        if self.dtype_policy.configured:
+            self.X_train = self.dtype_policy.as_features(self.X_train)
+        
+        if dataset_config.get('synthetic_samples'):
+            logger.warning(f"synthetic_samples is ignored for dataset plugin '{dataset_type}'")
+    
+    def _create_preprocessor(self, default_steps: List[Any]) -> PreprocessorPlugin:
+        """
+        Create the preprocessing pipeline declared in the configuration.
+        
+        Args:
+            default_steps: Steps used when the configuration declares none
+        
+        Returns:
+            Unfitted preprocessing pipeline
+        """
+        steps = self.config.get('preprocessing') if self.config else None
+        return registry.get_preprocessor('pipeline', steps=default_steps if steps is None else steps)
+    
+    def _preprocess_plugin_pool(self, dataset_type: str, dataset_config: Dict[str, Any]):
+        """
+        Fit the preprocessing pipeline on the initial training set and
+        transform the pool of a dataset plugin into the storage dtype.
+        
+        With a dataset cache the pool is transformed chunk by chunk straight
+        into a memory-mapped cache file, keyed by the dataset file's identity,
+        so a later initialization on the same files maps it without
+        transforming again. Without one the transformed pool is held in memory.
+        
+        Args:
+            dataset_type: Registered dataset plugin name
+            dataset_config: Dataset configuration
+        """
+        features_path = getattr(self.dataset, 'features_path', None)
+        # Sparse pools are compact already and are transformed in memory
+        cacheable = dataset_config.get('cache', True) and features_path and not is_sparse(self.X_unlabeled)
+        cache = DatasetCache.from_env() if cacheable else None
+        
+        spec = None
+        if cache is not None:
+            stat = os.stat(features_path)
+            spec = {
+                "type": dataset_type,
+                "parameters": dataset_config.get('parameters', {}),
+                "initial_samples": dataset_config.get('initial_samples', 100),
+                "source": {"path": os.path.abspath(features_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+                "preprocessing": self.preprocessor.get_spec(),
+                "storage_dtype": self.dtype_policy.storage.name
+            }
+            cached = cache.get(spec)
+            if cached is not None:
+                arrays, objects = cached
+                self.X_train = np.asarray(arrays["X_train"])
+                self.X_unlabeled = arrays["X_unlabeled"]
+                self.preprocessor = objects["preprocessor"]
+                self.dataset_cache_status = {"key": cache.key(spec), "hit": True}
+                logger.info(f"Loaded preprocessed pool from cache entry {cache.key(spec)}")
+                return
+        
+        self.X_train = self.preprocessor.fit_transform(self.X_train)
+        
+        if cache is None:
+            self.X_unlabeled = self._transform_pool(self.X_unlabeled)
+            return
+        
+        try:
+            with cache.create(spec) as directory:
+                out = create_array(directory, "X_unlabeled", self.X_unlabeled.shape, self.dtype_policy.storage)
+                self.preprocessor.transform(self.X_unlabeled, out=out)
+                out.flush()
+                del out
+                save_array(directory, "X_train", self.X_train)
+                save_object(directory, "preprocessor", self.preprocessor)
+            cached = cache.get(spec)
+            if cached is None:
+                raise OSError(f"cache entry {cache.key(spec)} is unreadable")
+            self.X_unlabeled = cached[0]["X_unlabeled"]
+            self.dataset_cache_status = {"key": cache.key(spec), "hit": False}
+        except OSError as e:
+            logger.warning(f"Could not cache preprocessed pool in {cache.root}: {e}")
+            self.X_unlabeled = self._transform_pool(self.X_unlabeled)
+    
+    def _transform_pool(self, X: np.ndarray) -> np.ndarray:
+        """
+        Transform a pool in memory into the storage dtype.
+        
+        Args:
+            X: Pool features (dense or sparse)
+        
+        Returns:
+            Transformed pool (sparse pools stay sparse)
+        """
+        if is_sparse(X):
+            return self.dtype_policy.as_storage(self.preprocessor.transform(X))
+        out = np.empty(X.shape, dtype=self.dtype_policy.storage)
+        return self.preprocessor.transform(X, out=out)
     
     def _generate_synthetic_samples(self, n_samples: int) -> np.ndarray:
         """
@@ -168,16 +584,19 @@ class SklearnALPlugin(ALFrameworkPlugin):
             raise ValueError("Plugin not initialized. Call initialize() first.")
         
         try:
+            self.labeled = TrainingBuffer(X_train, y_train)
+            
             if MODAL_AVAILABLE and self.model:
-                # Use modAL
-                self.model.fit(X_train, y_train)
+                # Use modAL (its labeled set is a view of the buffer)
+                self.model.fit(self.labeled.X, self.labeled.y)
             else:
                 # Use fallback
-                self.estimator.fit(X_train, y_train)
+                self.estimator.fit(self.labeled.X, self.labeled.y)
             
             # Update training data
             self.X_train = X_train
             self.y_train = y_train
+            self.model_version += 1
             
             # Calculate initial metrics
             initial_metrics = self._calculate_metrics()
@@ -198,14 +617,16 @@ class SklearnALPlugin(ALFrameworkPlugin):
                 "error": str(e)
             }
     
-    def query_samples(self, X_unlabeled: np.ndarray, n_samples: int) -> List[int]:
+    def query_samples(self, X_unlabeled: np.ndarray, n_samples: int,
+                      candidate_indices: Optional[np.ndarray] = None) -> List[int]:
         """
         Select most informative samples to label.
         
         Args:
             X_unlabeled: Unlabeled data pool
             n_samples: Number of samples to select
-            
+            candidate_indices: Optional rows of X_unlabeled to choose from
+        
         Returns:
             List of indices of selected samples
         """
@@ -213,15 +634,38 @@ class SklearnALPlugin(ALFrameworkPlugin):
             raise ValueError("Plugin not initialized. Call initialize() first.")
         
         try:
-            if MODAL_AVAILABLE and self.model:
+            self.query_scores = None
+            if candidate_indices is not None:
+                candidate_indices = np.asarray(candidate_indices)
+            
+            if self._use_streaming():
+                # Score the pool in bounded-memory chunks
+                return self._stream_query(X_unlabeled, n_samples, candidate_indices)
+            elif self.query_strategy is not None:
+                # Use configured query strategy plugin with cached probabilities
+                probabilities = self._candidate_probabilities(X_unlabeled, candidate_indices)
+                self.query_strategy.selection_scores = None
+                selected = self.query_strategy.select_samples(
+                    self._get_learner(), X_unlabeled, n_samples,
+                    candidate_indices=candidate_indices, probabilities=probabilities,
+                    X_labeled=self._labeled_features(), y_labeled=self._labeled_targets(),
+                    model_version=self.model_version
+                )
+                self.query_scores = self.query_strategy.selection_scores
+                return selected
+            elif MODAL_AVAILABLE and self.model:
                 # Use modAL uncertainty sampling
-                query_indices, _ = self.model.query(X_unlabeled, n_instances=n_samples)
+                X_candidates = X_unlabeled if candidate_indices is None else X_unlabeled[candidate_indices]
+                query_indices, _ = self.model.query(X_candidates, n_instances=n_samples)
                 return query_indices.tolist()
             else:
-                # Fallback: random sampling
-                indices = np.random.choice(len(X_unlabeled), n_samples, replace=False)
-                return indices.tolist()
-                
+                # Fallback: built-in least-confidence sampling
+                probabilities = self._candidate_probabilities(X_unlabeled, candidate_indices)
+                scores = uncertainty_scores(probabilities, "least_confidence")
+                selected = top_k_indices(scores, n_samples)
+                self.query_scores = scores[selected]
+                return selected.tolist()
+        
         except Exception as e:
             logger.error(f"Query failed: {str(e)}")
             return []
@@ -241,17 +685,40 @@ class SklearnALPlugin(ALFrameworkPlugin):
             raise ValueError("Plugin not initialized. Call initialize() first.")
         
         try:
+            # New rows may come from a more compact pool; train on the feature dtype
+            if self.dtype_policy.configured:
+                X_new = self.dtype_policy.as_features(X_new)
+            
             # Get metrics before update
             metrics_before = self._calculate_metrics()
             
+            # Copy only the new rows; the labeled set grows in place
+            n_labeled = len(self.labeled)
+            self.labeled.append(X_new, y_new)
+            
+            update_mode = "full"
+            try:
+                if self.forest_growth is not None:
+                    # Add trees trained on recent labels, refitting only periodically
+                    update_mode = self.forest_growth.update(
+                        self._get_estimator(), self.labeled.X, self.labeled.y, len(y_new)
+                    )
+                else:
+                    self._get_estimator().fit(self.labeled.X, self.labeled.y)
+            except Exception:
+                # Drop the new rows so a retried update does not add them twice
+                self.labeled.truncate(n_labeled)
+                raise
+            
             if MODAL_AVAILABLE and self.model:
-                # Use modAL
-                self.model.teach(X_new, y_new)
+                # Use modAL's labeled set as views of the buffer rather than
+                # letting teach() restack it
+                self.model.X_training, self.model.y_training = self.labeled.X, self.labeled.y
             else:
                 # Fallback: retrain with all data
-                self.X_train = np.vstack([self.X_train, X_new])
-                self.y_train = np.hstack([self.y_train, y_new])
-                self.estimator.fit(self.X_train, self.y_train)
+                self.X_train, self.y_train = self.labeled.X, self.labeled.y
+            
+            self.model_version += 1
             
             # Get metrics after update
             metrics_after = self._calculate_metrics()
@@ -262,6 +729,7 @@ class SklearnALPlugin(ALFrameworkPlugin):
             return {
                 "status": "success",
                 "samples_added": len(y_new),
+                "update_mode": update_mode,
                 "metrics_before": metrics_before.__dict__,
                 "metrics_after": metrics_after.__dict__
             }
@@ -270,7 +738,9 @@ class SklearnALPlugin(ALFrameworkPlugin):
             logger.error(f"Model update failed: {str(e)}")
             return {
                 "status": "error",
-                "error": str(e)
+                "error": str(e),
+                # Invalid input fails the same way again; other errors may be transient
+                "retryable": not isinstance(e, ValueError)
             }
     
     def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -295,7 +765,7 @@ class SklearnALPlugin(ALFrameworkPlugin):
                 probabilities = self.estimator.predict_proba(X)
             
             # Calculate uncertainties (1 - max probability)
-            uncertainties = 1 - np.max(probabilities, axis=1)
+            uncertainties = uncertainty_scores(probabilities, "least_confidence")
             
             return predictions, uncertainties
             
@@ -303,6 +773,37 @@ class SklearnALPlugin(ALFrameworkPlugin):
             logger.error(f"Prediction failed: {str(e)}")
             return np.array([]), np.array([])
     
+    def predict_pool(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict labels and uncertainties for rows of the unlabeled pool.
+        
+        Reads the cached pool probabilities of the current model version
+        when the pool has been scored, instead of running the model again.
+        
+        Args:
+            indices: Row indices into the unlabeled pool
+        
+        Returns:
+            Tuple of (predictions, uncertainties)
+        """
+        if not self.is_initialized:
+            raise ValueError("Plugin not initialized. Call initialize() first.")
+        
+        try:
+            if self.prediction_cache.contains("pool_probabilities", self.model_version):
+                probabilities = self._pool_probabilities()[indices]
+            else:
+                # Streaming and subset queries never score the whole pool
+                probabilities = self._get_learner().predict_proba(self.X_unlabeled[indices])
+            predictions = self._get_estimator().classes_[np.argmax(probabilities, axis=1)]
+            uncertainties = uncertainty_scores(probabilities, "least_confidence")
+            
+            return predictions, uncertainties
+        
+        except Exception as e:
+            logger.error(f"Pool prediction failed: {str(e)}")
+            return np.array([]), np.array([])
+    
     def get_metrics(self) -> ModelMetrics:
         """
         Get current model performance metrics.
@@ -313,7 +814,12 @@ class SklearnALPlugin(ALFrameworkPlugin):
         return self._calculate_metrics()
     
     def _calculate_metrics(self) -> ModelMetrics:
-        """Calculate current model performance metrics."""
+        """
+        Calculate current model performance metrics.
+        
+        Metrics are cached per model version, so repeated calls between
+        model updates do not re-run the model on the training set.
+        """
         if not self.is_initialized or self.X_train is None:
             return ModelMetrics(
                 accuracy=0.0, f1_score=0.0, precision=0.0, recall=0.0,
@@ -321,6 +827,10 @@ class SklearnALPlugin(ALFrameworkPlugin):
                 model_info={}
             )
         
+        cached_metrics = self.prediction_cache.get("metrics", self.model_version)
+        if cached_metrics is not None:
+            return cached_metrics
+        
         try:
             # Predict on training data
             if MODAL_AVAILABLE and self.model:
@@ -344,17 +854,20 @@ class SklearnALPlugin(ALFrameworkPlugin):
             precision = precision_score(self.y_train, y_pred, average='weighted')
             recall = recall_score(self.y_train, y_pred, average='weighted')
             
-            return ModelMetrics(
+            metrics = ModelMetrics(
                 accuracy=float(accuracy),
                 f1_score=float(f1),
                 precision=float(precision),
                 recall=float(recall),
                 labeled_count=len(self.y_train),
-                total_samples=len(self.y_train) + len(self.X_unlabeled),
+                total_samples=len(self.y_train) + self.X_unlabeled.shape[0],
                 last_updated=datetime.now().isoformat(),
                 model_info=model_info
             )
             
+            self.prediction_cache.put("metrics", self.model_version, metrics)
+            return metrics
+        
         except Exception as e:
             logger.error(f"Metrics calculation failed: {str(e)}")
             return ModelMetrics(
@@ -374,16 +887,31 @@ class SklearnALPlugin(ALFrameworkPlugin):
             "config": self.config,
             "is_initialized": self.is_initialized,
             "training_history": self.training_history,
-            "labeled_count": len(self.y_train) if self.y_train is not None else 0
+            "labeled_count": len(self.y_train) if self.y_train is not None else 0,
+            "model_version": self.model_version,
+            "prediction_cache": self.prediction_cache.get_stats(),
+            "snapshot_path": self.snapshot_path,
+            "dataset_cache": self.dataset_cache_status,
+            "dtype": self.dtype_policy.get_spec(),
+            "training_buffer": self.labeled.get_stats() if self.labeled is not None else None,
+            "forest_growth": self.forest_growth.get_stats() if self.forest_growth is not None else None,
+            "tree_cache": self.tree_cache.get_stats() if self.tree_cache is not None else None
         }
     
     def load_state(self, state: Dict[str, Any]) -> None:
         """
         Load framework state.
         
+        States referencing a snapshot restore the fitted model and labels
+        from it; otherwise the experiment is re-initialized from its config.
+        
         Args:
             state: Previously saved state
         """
+        if state.get("snapshot_path"):
+            self.load_snapshot(state["snapshot_path"])
+            return
+        
         self.config = state.get("config")
         self.is_initialized = state.get("is_initialized", False)
         self.training_history = state.get("training_history", [])
@@ -391,6 +919,114 @@ class SklearnALPlugin(ALFrameworkPlugin):
         if self.is_initialized and self.config:
             self.initialize(self.config)
     
+    def save_snapshot(self, directory: str) -> None:
+        """
+        Write a binary snapshot of the fitted framework.
+        
+        The fitted estimator and preprocessor are pickled; the labeled set and the
+        unlabeled pool are saved as .npy files. Pools of file-backed dataset
+        plugins are not copied, the restore maps the dataset files again.
+        
+        Args:
+            directory: Directory to write into
+        """
+        if not self.is_initialized:
+            raise ValueError("Plugin not initialized. Call initialize() first.")
+        
+        os.makedirs(directory, exist_ok=True)
+        pool_in_snapshot = self._dataset_dir() is None
+        
+        save_array(directory, "X_train", self.X_train)
+        save_array(directory, "y_train", self.y_train)
+        if MODAL_AVAILABLE and self.model:
+            save_array(directory, "X_labeled", self.model.X_training)
+            save_array(directory, "y_labeled", self.model.y_training)
+        if pool_in_snapshot:
+            save_array(directory, "X_unlabeled", self.X_unlabeled)
+            save_array(directory, "y_unlabeled", self.y_unlabeled)
+        
+        save_object(directory, "estimator", self._get_estimator())
+        save_object(directory, "preprocessor", self.preprocessor)
+        save_manifest(directory, {
+            "framework": self.PLUGIN_NAME,
+            "config": self.config,
+            "model_version": self.model_version,
+            "training_history": self.training_history,
+            "forest_growth": self.forest_growth.get_stats() if self.forest_growth is not None else None,
+            "modal": bool(MODAL_AVAILABLE and self.model),
+            "pool_in_snapshot": pool_in_snapshot,
+            "created_at": datetime.now().isoformat()
+        })
+        
+        self.snapshot_path = directory
+        logger.info(f"Saved snapshot of model version {self.model_version} to {directory}")
+    
+    def load_snapshot(self, directory: str) -> None:
+        """
+        Restore the framework from a snapshot without retraining.
+        
+        The unlabeled pool is memory-mapped from the snapshot (or from the
+        dataset files), so restoring takes time proportional to the labeled
+        set rather than the pool.
+        
+        Args:
+            directory: Snapshot directory
+        """
+        manifest = load_manifest(directory)
+        self.config = manifest["config"]
+        self.query_strategy = self._create_query_strategy(self.config.get('query_strategy', {}))
+        self.scoring_config = self.config.get('scoring') or {}
+        self.dtype_policy = DtypePolicy.from_config(self.config)
+        
+        if manifest["pool_in_snapshot"]:
+            self.dataset = None
+            self.X_unlabeled = load_array(directory, "X_unlabeled", mmap=True)
+            self.y_unlabeled = load_array(directory, "y_unlabeled", mmap=True)
+        else:
+            dataset_config = self.config.get('dataset', {})
+            self._load_plugin_dataset(dataset_config.get('type'), dataset_config)
+        
+        self.X_train = load_array(directory, "X_train")
+        self.y_train = load_array(directory, "y_train")
+        X_labeled = load_array(directory, "X_labeled")
+        y_labeled = load_array(directory, "y_labeled")
+        
+        estimator = load_object(directory, "estimator")
+        self.forest_growth = self._create_forest_growth(
+            self.config.get('model', {}), estimator, state=manifest.get("forest_growth")
+        )
+        self.tree_cache = TreeProbabilityCache() if self.forest_growth is not None else None
+        # Snapshots from before preprocessing pipelines hold a bare scaler
+        has_pipeline = os.path.exists(os.path.join(directory, "preprocessor.pkl"))
+        self.preprocessor = load_object(directory, "preprocessor" if has_pipeline else "scaler")
+        
+        if X_labeled is not None:
+            self.labeled = TrainingBuffer(X_labeled, y_labeled)
+        else:
+            self.labeled = TrainingBuffer(self.X_train, self.y_train)
+        
+        if self._uses_modal():
+            # Build the learner without training data, then attach the labeled set
+            self.model = ActiveLearner(estimator=estimator, query_strategy=uncertainty_sampling)
+            self.model.X_training, self.model.y_training = self.labeled.X, self.labeled.y
+        else:
+            self.estimator = estimator
+            self.model = None
+            if X_labeled is not None:
+                # The fallback retrains on X_train, so it must hold every label
+                self.X_train, self.y_train = self.labeled.X, self.labeled.y
+        
+        self.model_version = manifest["model_version"]
+        self.training_history = manifest["training_history"]
+        self.prediction_cache = PredictionCache()
+        self.snapshot_path = directory
+        self.is_initialized = True
+        
+        if hasattr(self.query_strategy, 'prepare_pool'):
+            self.query_strategy.prepare_pool(self.X_unlabeled, dataset_dir=self._dataset_dir())
+        
+        logger.info(f"Restored snapshot of model version {self.model_version} from {directory}")
+    
     def _log_training_event(self, event_type: str, n_samples: int):
         """
         Log training events.
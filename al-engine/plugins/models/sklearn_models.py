@@ -0,0 +1,138 @@
+"""
+Scikit-Learn Model Plugin
+
+Wraps scikit-learn classifiers behind the ModelPlugin interface so they can
+be used as committee members or standalone models.
+"""
+
+import numpy as np
+from typing import Dict, Any
+import logging
+
+from interfaces.base import ModelPlugin
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier, GradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.naive_bayes import GaussianNB
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.svm import SVC
+
+logger = logging.getLogger(__name__)
+
+ESTIMATORS = {
+    "random_forest": RandomForestClassifier,
+    "extra_trees": ExtraTreesClassifier,
+    "gradient_boosting": GradientBoostingClassifier,
+    "logistic_regression": LogisticRegression,
+    "naive_bayes": GaussianNB,
+    "knn": KNeighborsClassifier,
+    "svm": SVC
+}
+
+class SklearnModelPlugin(ModelPlugin):
+    """
+    Scikit-Learn Model Plugin
+    
+    Any classifier from ESTIMATORS, selected by name and configured with
+    keyword parameters.
+    """
+    
+    PLUGIN_NAME = "sklearn"
+    
+    def __init__(self, estimator: str = "random_forest", **params):
+        """
+        Initialize the model plugin.
+        
+        Args:
+            estimator: Estimator name (see ESTIMATORS)
+            **params: Estimator parameters
+        """
+        if estimator not in ESTIMATORS:
+            raise ValueError(f"Unknown estimator '{estimator}'. Available: {list(ESTIMATORS.keys())}")
+        
+        # SVC only exposes predict_proba when trained with probability estimates
+        if estimator == "svm":
+            params.setdefault("probability", True)
+        
+        self.estimator_name = estimator
+        self.estimator = ESTIMATORS[estimator](**params)
+        self.is_fitted = False
+    
+    @property
+    def classes_(self) -> np.ndarray:
+        """Class labels seen during fit."""
+        return self.estimator.classes_
+    
+    def fit(self, X: np.ndarray, y: np.ndarray) -> 'SklearnModelPlugin':
+        """
+        Train the model on given data.
+        
+        Args:
+            X: Training features
+            y: Training labels
+        
+        Returns:
+            Self for method chaining
+        """
+        self.estimator.fit(X, y)
+        self.is_fitted = True
+        return self
+    
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict labels for given features.
+        
+        Args:
+            X: Features to predict
+        
+        Returns:
+            Predicted labels
+        """
+        return self.estimator.predict(X)
+    
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Predict class probabilities for given features.
+        
+        Args:
+            X: Features to predict
+        
+        Returns:
+            Class probabilities (n_samples, n_classes)
+        """
+        return self.estimator.predict_proba(X)
+    
+    def score(self, X: np.ndarray, y: np.ndarray) -> float:
+        """
+        Calculate model accuracy on given data.
+        
+        Args:
+            X: Test features
+            y: True labels
+        
+        Returns:
+            Accuracy
+        """
+        return float(self.estimator.score(X, y))
+    
+    def get_params(self) -> Dict[str, Any]:
+        """
+        Get model parameters.
+        
+        Returns:
+            Dict of model parameters
+        """
+        return {"estimator": self.estimator_name, **self.estimator.get_params()}
+    
+    def set_params(self, **params) -> 'SklearnModelPlugin':
+        """
+        Set model parameters.
+        
+        Args:
+            **params: Estimator parameters to set
+        
+        Returns:
+            Self for method chaining
+        """
+        self.estimator.set_params(**params)
+        self.is_fitted = False
+        return self
@@ -0,0 +1,152 @@
+"""
+Preprocessing Pipeline Plugin
+
+Chains registered preprocessors declared in the experiment config. The
+steps are fitted once on the initial training set; pools are then
+transformed chunk by chunk, each chunk passing through every step while it
+is still in cache, directly into the output array (which may be a
+memory-mapped file), so no full-size intermediate copies are made.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Union
+import logging
+
+from interfaces.base import PreprocessorPlugin
+from plugin_registry import registry
+from utils.sparse import is_sparse
+from utils.streaming import iter_chunk_bounds
+
+logger = logging.getLogger(__name__)
+
+class PreprocessingPipeline(PreprocessorPlugin):
+    """
+    Preprocessing Pipeline
+    
+    Applies a sequence of preprocessor plugins in order. An empty pipeline
+    passes data through unchanged.
+    """
+    
+    PLUGIN_NAME = "pipeline"
+    
+    def __init__(self, steps: Optional[List[Union[str, Dict[str, Any]]]] = None, chunk_size: int = 4096):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            steps: Preprocessor plugin names, or configurations with a "type"
+                and "parameters", in the order they are applied
+            chunk_size: Rows transformed per chunk
+        """
+        self.steps_config = [
+            {"type": step, "parameters": {}} if isinstance(step, str)
+            else {"type": step["type"], "parameters": step.get("parameters", {})}
+            for step in steps or []
+        ]
+        self.steps: List[PreprocessorPlugin] = [
+            registry.get_preprocessor(step["type"], **step["parameters"]) for step in self.steps_config
+        ]
+        self.chunk_size = max(1, chunk_size)
+    
+    def get_spec(self) -> List[Dict[str, Any]]:
+        """
+        Describe the pipeline for cache keys.
+        
+        Returns:
+            Step configurations in order
+        """
+        return self.steps_config
+    
+    def fit(self, X: np.ndarray) -> 'PreprocessingPipeline':
+        """
+        Fit every step on the output of the previous ones.
+        
+        Args:
+            X: Training features
+        
+        Returns:
+            Self for method chaining
+        
+        Raises:
+            ValueError: If a step cannot transform sparse features and X is sparse
+        """
+        if is_sparse(X):
+            dense_only = [config["type"] for config, step in zip(self.steps_config, self.steps)
+                          if not getattr(step, "SUPPORTS_SPARSE", True)]
+            if dense_only:
+                raise ValueError(f"Preprocessing steps {dense_only} do not support sparse features")
+        
+        for i, step in enumerate(self.steps):
+            if i < len(self.steps) - 1:
+                X = step.fit_transform(X)
+            else:
+                step.fit(X)
+        return self
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Transform features chunk by chunk through all steps.
+        
+        Args:
+            X: Features to transform (may be memory-mapped)
+            out: Optional float array of X's shape to write into (e.g. a
+                compact float32 or float16 pool); ignored for sparse X
+        
+        Returns:
+            Transformed features (out if given; X itself for an empty pipeline)
+        """
+        if not self.steps and out is None:
+            return X
+        
+        if is_sparse(X):
+            # Steps transform sparse matrices whole, keeping them sparse
+            for step in self.steps:
+                X = step.transform(X)
+            return X
+        
+        if out is None:
+            out = np.empty(X.shape, dtype=np.float64)
+        
+        # Steps always run in float64; a more compact out gets each finished
+        # chunk from one reused buffer
+        buffer = None
+        if out.dtype != np.float64:
+            buffer = np.empty((min(self.chunk_size, len(X)),) + X.shape[1:], dtype=np.float64)
+        
+        for start, stop in iter_chunk_bounds(len(X), self.chunk_size):
+            chunk = out[start:stop] if buffer is None else buffer[:stop - start]
+            chunk[...] = X[start:stop]
+            for step in self.steps:
+                if hasattr(step, 'transform_inplace'):
+                    step.transform_inplace(chunk)
+                else:
+                    chunk[...] = step.transform(chunk)
+            if buffer is not None:
+                out[start:stop] = chunk
+        return out
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit the pipeline and transform features.
+        
+        Args:
+            X: Features to fit and transform
+        
+        Returns:
+            Transformed features
+        """
+        return self.fit(X).transform(X)
+    
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Undo every step, last step first.
+        
+        Args:
+            X: Transformed features
+        
+        Returns:
+            Original features
+        """
+        for step in reversed(self.steps):
+            X = step.inverse_transform(X)
+        return X
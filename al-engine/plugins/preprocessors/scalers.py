@@ -0,0 +1,187 @@
+"""
+Scaler Preprocessor Plugins
+
+Feature scalers backed by scikit-learn. Besides the PreprocessorPlugin
+interface they offer transform_inplace, which the preprocessing pipeline
+uses to scale pool chunks without allocating new arrays.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+import logging
+
+from interfaces.base import PreprocessorPlugin
+from utils.sparse import is_sparse
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+logger = logging.getLogger(__name__)
+
+class StandardScalerPreprocessor(PreprocessorPlugin):
+    """
+    Standard Scaler
+    
+    Removes the mean and scales each feature to unit variance. Sparse
+    features are only scaled, since centering would make them dense.
+    """
+    
+    PLUGIN_NAME = "standard_scaler"
+    SUPPORTS_SPARSE = True
+    
+    def __init__(self, with_mean: Optional[bool] = None, with_std: bool = True):
+        """
+        Initialize the scaler.
+        
+        Args:
+            with_mean: Center features before scaling (default: only dense features)
+            with_std: Scale features to unit variance
+        """
+        self.with_mean = with_mean
+        self.scaler = StandardScaler(with_mean=with_mean is not False, with_std=with_std)
+    
+    def fit(self, X: np.ndarray) -> 'StandardScalerPreprocessor':
+        """
+        Fit the scaler on training data.
+        
+        Args:
+            X: Training features
+        
+        Returns:
+            Self for method chaining
+        
+        Raises:
+            ValueError: If with_mean is set for sparse features
+        """
+        if is_sparse(X):
+            if self.with_mean:
+                raise ValueError("standard_scaler cannot center sparse features; "
+                                 "leave with_mean unset or set it to false")
+            self.scaler.set_params(with_mean=False)
+        self.scaler.fit(X)
+        return self
+    
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scale features.
+        
+        Args:
+            X: Features to transform
+        
+        Returns:
+            Scaled features
+        """
+        return self.scaler.transform(X)
+    
+    def transform_inplace(self, X: np.ndarray) -> None:
+        """
+        Scale a float array in place.
+        
+        Args:
+            X: Features to overwrite with their scaled values
+        """
+        if self.scaler.with_mean:
+            X -= self.scaler.mean_
+        if self.scaler.with_std:
+            X /= self.scaler.scale_
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit the scaler and scale features.
+        
+        Args:
+            X: Features to fit and transform
+        
+        Returns:
+            Scaled features
+        """
+        return self.fit(X).transform(X)
+    
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Undo the scaling.
+        
+        Args:
+            X: Scaled features
+        
+        Returns:
+            Original features
+        """
+        return self.scaler.inverse_transform(X)
+
+class MinMaxScalerPreprocessor(PreprocessorPlugin):
+    """
+    Min-Max Scaler
+    
+    Maps each feature linearly onto a fixed range. Dense features only:
+    shifting sparse features would make them dense.
+    """
+    
+    PLUGIN_NAME = "min_max_scaler"
+    SUPPORTS_SPARSE = False
+    
+    def __init__(self, feature_range: Tuple[float, float] = (0.0, 1.0)):
+        """
+        Initialize the scaler.
+        
+        Args:
+            feature_range: Target (min, max) of every feature
+        """
+        self.scaler = MinMaxScaler(feature_range=tuple(feature_range))
+    
+    def fit(self, X: np.ndarray) -> 'MinMaxScalerPreprocessor':
+        """
+        Fit the scaler on training data.
+        
+        Args:
+            X: Training features
+        
+        Returns:
+            Self for method chaining
+        """
+        self.scaler.fit(X)
+        return self
+    
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Scale features.
+        
+        Args:
+            X: Features to transform
+        
+        Returns:
+            Scaled features
+        """
+        return self.scaler.transform(X)
+    
+    def transform_inplace(self, X: np.ndarray) -> None:
+        """
+        Scale a float array in place.
+        
+        Args:
+            X: Features to overwrite with their scaled values
+        """
+        X *= self.scaler.scale_
+        X += self.scaler.min_
+    
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Fit the scaler and scale features.
+        
+        Args:
+            X: Features to fit and transform
+        
+        Returns:
+            Scaled features
+        """
+        return self.scaler.fit_transform(X)
+    
+    def inverse_transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Undo the scaling.
+        
+        Args:
+            X: Scaled features
+        
+        Returns:
+            Original features
+        """
+        return self.scaler.inverse_transform(X)
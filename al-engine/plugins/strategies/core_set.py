@@ -0,0 +1,173 @@
+"""
+Core-Set Strategy Plugin
+
+k-center greedy selection: repeatedly picks the pool point farthest from
+everything labeled or already picked, so batches cover the feature space
+instead of clustering around one uncertain region.
+
+Each pool point's squared distance to its nearest labeled point is kept in
+an array and updated incrementally, in blocked vectorized passes, with only
+the points labeled since the previous query. The greedy picks walk the
+candidates in the same blocks, so only one block is cast to float at a time.
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional
+import logging
+
+from interfaces.base import QueryStrategyPlugin, ModelPlugin
+from utils.sparse import as_float, to_dense, row_sq_norms
+from utils.streaming import iter_chunk_bounds
+
+logger = logging.getLogger(__name__)
+
+class CoreSetStrategy(QueryStrategyPlugin):
+    """
+    Core-Set (k-center greedy) Query Strategy
+    
+    Selects samples that maximize coverage of the unlabeled pool.
+    Requires the labeled features as the X_labeled keyword argument.
+    """
+    
+    PLUGIN_NAME = "core_set"
+    
+    def __init__(self, block_size: int = 8192):
+        """
+        Initialize the core-set strategy.
+        
+        Args:
+            block_size: Pool rows per block in distance passes
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, got {block_size}")
+        
+        self.block_size = block_size
+        self._pool: Optional[np.ndarray] = None
+        self._pool_sq_norms: Optional[np.ndarray] = None
+        self._min_distances: Optional[np.ndarray] = None
+        self._n_labeled_seen = 0
+    
+    def _reset(self, X_unlabeled: np.ndarray) -> None:
+        """Start tracking a new pool."""
+        self._pool = X_unlabeled
+        self._pool_sq_norms = np.empty(X_unlabeled.shape[0], dtype=np.float64)
+        for start in range(0, X_unlabeled.shape[0], self.block_size):
+            block = as_float(X_unlabeled[start:start + self.block_size])
+            self._pool_sq_norms[start:start + self.block_size] = row_sq_norms(block)
+        self._min_distances = np.full(X_unlabeled.shape[0], np.inf)
+        self._n_labeled_seen = 0
+    
+    def update_min_distances(self, X_unlabeled: np.ndarray, X_labeled: np.ndarray) -> np.ndarray:
+        """
+        Bring the pool's min-distance array up to date with the labeled set.
+        
+        Only labeled rows added since the last call are processed; the pool
+        is walked in blocks of block_size rows, computing squared distances
+        as |x|^2 - 2 x.l + |l|^2 with one matrix product per block.
+        
+        Args:
+            X_unlabeled: Unlabeled data pool
+            X_labeled: All labeled features so far (rows are only appended)
+        
+        Returns:
+            Squared distance of each pool row to its nearest labeled row
+        """
+        if self._pool is not X_unlabeled or X_labeled.shape[0] < self._n_labeled_seen:
+            self._reset(X_unlabeled)
+        
+        new_labeled = as_float(X_labeled[self._n_labeled_seen:])
+        if new_labeled.shape[0] == 0:
+            return self._min_distances
+        
+        labeled_sq_norms = row_sq_norms(new_labeled)
+        for start in range(0, X_unlabeled.shape[0], self.block_size):
+            stop = start + self.block_size
+            block = as_float(X_unlabeled[start:stop])
+            
+            # Sparse products are densified per block only
+            distances = to_dense(block @ new_labeled.T)
+            distances *= -2.0
+            distances += self._pool_sq_norms[start:stop, None]
+            distances += labeled_sq_norms[None, :]
+            np.minimum(self._min_distances[start:stop], distances.min(axis=1),
+                       out=self._min_distances[start:stop])
+        
+        # Rounding can push squared distances of duplicates slightly below zero
+        np.maximum(self._min_distances, 0.0, out=self._min_distances)
+        self._n_labeled_seen = X_labeled.shape[0]
+        return self._min_distances
+    
+    def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray,
+                      n_samples: int, **kwargs) -> List[int]:
+        """
+        Select samples by k-center greedy.
+        
+        Args:
+            model: Trained model (unused; selection is purely geometric)
+            X_unlabeled: Pool of unlabeled samples
+            n_samples: Number of samples to select
+            **kwargs: "X_labeled" (required) and optional "candidate_indices"
+                restricting the choice to those pool rows
+        
+        Returns:
+            Positions of selected samples (into candidate_indices if given),
+            in greedy order
+        """
+        X_labeled = kwargs.get("X_labeled")
+        if X_labeled is None:
+            raise ValueError("Core-set strategy requires the labeled features (X_labeled)")
+        
+        candidate_indices = kwargs.get("candidate_indices")
+        min_distances = self.update_min_distances(X_unlabeled, X_labeled)
+        
+        if candidate_indices is None:
+            candidate_indices = np.arange(X_unlabeled.shape[0])
+        candidate_indices = np.asarray(candidate_indices)
+        
+        n_samples = min(n_samples, len(candidate_indices))
+        if n_samples <= 0:
+            return []
+        
+        # Greedy picks update a copy; the pool array only tracks real labels
+        distances = min_distances[candidate_indices].copy()
+        candidate_sq_norms = self._pool_sq_norms[candidate_indices]
+        
+        # Candidates fitting in one block are cast once, larger sets one block per pick
+        blocks = list(iter_chunk_bounds(len(candidate_indices), self.block_size))
+        X_block = as_float(X_unlabeled[candidate_indices]) if len(blocks) == 1 else None
+        
+        selected = []
+        selection_scores = np.empty(n_samples)
+        for i in range(n_samples):
+            position = int(np.argmax(distances))
+            selected.append(position)
+            selection_scores[i] = distances[position]
+            
+            center = as_float(X_unlabeled[candidate_indices[position:position + 1]])
+            for start, stop in blocks:
+                block = X_block if X_block is not None else as_float(X_unlabeled[candidate_indices[start:stop]])
+                to_center = to_dense(block @ center.T).ravel()
+                to_center *= -2.0
+                to_center += candidate_sq_norms[start:stop]
+                to_center += candidate_sq_norms[position]
+                np.minimum(distances[start:stop], to_center, out=distances[start:stop])
+            distances[position] = -np.inf
+        
+        # Report the distance of each pick to its nearest labeled or earlier pick
+        self.selection_scores = np.sqrt(np.maximum(selection_scores, 0.0))
+        return selected
+    
+    def get_strategy_info(self) -> Dict[str, Any]:
+        """
+        Get information about the query strategy.
+        
+        Returns:
+            Strategy metadata
+        """
+        return {
+            "name": self.PLUGIN_NAME,
+            "description": "k-center greedy core-set selection for diverse batches",
+            "block_size": self.block_size,
+            "labeled_seen": self._n_labeled_seen,
+            "pool_size": self._pool.shape[0] if self._pool is not None else 0
+        }
@@ -0,0 +1,177 @@
+"""
+Information-Density Strategy Plugin
+
+Weights model uncertainty by how representative a sample is of the pool,
+so isolated outliers (e.g. noisy synthetic samples) stop winning queries.
+Representativeness comes from a kNN density index that is built once per
+pool, in the background, and persisted next to the dataset; after new
+labels only the uncertainty factor is recomputed.
+"""
+
+import numpy as np
+import os
+import threading
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional
+import logging
+
+from interfaces.base import QueryStrategyPlugin, ModelPlugin
+from utils.density_index import DensityIndex
+from utils.uncertainty import SCORING_FUNCTIONS, uncertainty_scores, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+class InformationDensityStrategy(QueryStrategyPlugin):
+    """
+    Information-Density Query Strategy
+    
+    Scores samples as uncertainty * density ** beta.
+    """
+    
+    PLUGIN_NAME = "information_density"
+    
+    def __init__(self, method: str = "least_confidence", beta: float = 1.0,
+                 n_neighbors: int = 10, block_size: int = 4096, n_jobs: Optional[int] = None,
+                 index_dir: Optional[str] = None, wait_for_index: bool = False):
+        """
+        Initialize the information-density strategy.
+        
+        Args:
+            method: Uncertainty scoring method ("least_confidence", "margin", "entropy")
+            beta: Weight of the density factor (0 is plain uncertainty sampling)
+            n_neighbors: Neighbours averaged per density score
+            block_size: Pool rows per neighbour query block
+            n_jobs: Threads building the index (defaults to the CPU count)
+            index_dir: Directory for persisted indexes (defaults to the dataset's
+                directory, then AL_ENGINE_INDEX_DIR; unset keeps indexes in memory)
+            wait_for_index: Block queries until the index is built instead of
+                falling back to plain uncertainty meanwhile
+        """
+        if method not in SCORING_FUNCTIONS:
+            raise ValueError(f"Unknown uncertainty method '{method}'. Available: {list(SCORING_FUNCTIONS.keys())}")
+        
+        self.method = method
+        self.beta = beta
+        self.index = DensityIndex(n_neighbors=n_neighbors, block_size=block_size, n_jobs=n_jobs)
+        self.index_dir = index_dir
+        self.wait_for_index = wait_for_index
+        
+        self._pool: Optional[np.ndarray] = None
+        self._densities: Optional[Future] = None
+    
+    def prepare_pool(self, X_unlabeled: np.ndarray, dataset_dir: Optional[str] = None) -> None:
+        """
+        Start building (or loading) the density index for a pool in the background.
+        
+        Args:
+            X_unlabeled: Unlabeled data pool
+            dataset_dir: Directory of the dataset files, if any
+        """
+        index_dir = self.index_dir or dataset_dir or os.getenv("AL_ENGINE_INDEX_DIR")
+        future = Future()
+        
+        def build() -> None:
+            try:
+                future.set_result(self.index.load_or_build(X_unlabeled, index_dir))
+            except Exception as e:
+                logger.error(f"Error building density index: {e}")
+                future.set_exception(e)
+        
+        self._pool = X_unlabeled
+        self._densities = future
+        threading.Thread(target=build, name="al-density-index", daemon=True).start()
+    
+    def _get_densities(self, X_unlabeled: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Get the pool's density scores.
+        
+        Returns:
+            Density scores, or None while a background build is still running
+            or after it failed
+        """
+        if self._pool is not X_unlabeled or self._densities is None:
+            self.prepare_pool(X_unlabeled)
+        
+        if not self._densities.done() and not self.wait_for_index:
+            return None
+        if self._densities.exception() is not None:
+            return None
+        return self._densities.result()
+    
+    def score_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Compute density-weighted uncertainty scores.
+        
+        Args:
+            model: Trained model providing predict_proba
+            X_unlabeled: Rows to score
+            **kwargs: Optional precomputed "probabilities" for the rows and
+                "pool" with "indices", when the rows are a subset of a pool
+        
+        Returns:
+            Scores (n_samples,)
+        """
+        probabilities = kwargs.get("probabilities")
+        if probabilities is None:
+            probabilities = model.predict_proba(X_unlabeled)
+        scores = uncertainty_scores(probabilities, self.method)
+        
+        pool = kwargs.get("pool", X_unlabeled)
+        densities = self._get_densities(pool)
+        if densities is None:
+            logger.info("Density index unavailable, scoring by uncertainty only")
+            return scores
+        
+        indices = kwargs.get("indices")
+        if indices is not None:
+            densities = densities[indices]
+        return scores * densities ** self.beta
+    
+    def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray,
+                      n_samples: int, **kwargs) -> List[int]:
+        """
+        Select the samples with the highest density-weighted uncertainty.
+        
+        Args:
+            model: Trained model providing predict_proba
+            X_unlabeled: Pool of unlabeled samples
+            n_samples: Number of samples to select
+            **kwargs: Optional "candidate_indices" restricting the choice to
+                those pool rows and precomputed "probabilities" for them
+        
+        Returns:
+            Positions of selected samples (into candidate_indices if given),
+            best first
+        """
+        candidate_indices = kwargs.get("candidate_indices")
+        X_candidates = X_unlabeled if candidate_indices is None else X_unlabeled[candidate_indices]
+        
+        scores = self.score_samples(model, X_candidates, probabilities=kwargs.get("probabilities"),
+                                    pool=X_unlabeled, indices=candidate_indices)
+        selected = top_k_indices(scores, n_samples)
+        self.selection_scores = scores[selected]
+        return selected.tolist()
+    
+    def get_strategy_info(self) -> Dict[str, Any]:
+        """
+        Get information about the query strategy.
+        
+        Returns:
+            Strategy metadata
+        """
+        if self._densities is None:
+            index_status = "not_built"
+        elif not self._densities.done():
+            index_status = "building"
+        else:
+            index_status = "failed" if self._densities.exception() else "ready"
+        
+        return {
+            "name": self.PLUGIN_NAME,
+            "method": self.method,
+            "description": "Selects uncertain samples from dense regions of the pool",
+            "beta": self.beta,
+            "n_neighbors": self.index.n_neighbors,
+            "index_status": index_status,
+            "available_methods": list(SCORING_FUNCTIONS.keys())
+        }
@@ -0,0 +1,213 @@
+"""
+Query-by-Committee Strategy Plugin
+
+Trains a committee of heterogeneous model plugins on the labeled set and
+selects the samples the committee disagrees on most. Members are fitted on
+parallel worker threads and only refit when the model was updated.
+"""
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import logging
+
+from interfaces.base import QueryStrategyPlugin, ModelPlugin
+from plugin_registry import registry
+from utils.uncertainty import entropy, top_k_indices, vote_fractions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMMITTEE = [
+    {"type": "sklearn", "parameters": {"estimator": "random_forest", "n_estimators": 50, "random_state": 0}},
+    {"type": "sklearn", "parameters": {"estimator": "extra_trees", "n_estimators": 50, "random_state": 0}},
+    {"type": "sklearn", "parameters": {"estimator": "logistic_regression", "max_iter": 1000}},
+    {"type": "sklearn", "parameters": {"estimator": "naive_bayes"}}
+]
+
+def vote_entropy(committee_probabilities: np.ndarray) -> np.ndarray:
+    """
+    Entropy of the committee's hard votes.
+    
+    Args:
+        committee_probabilities: Stacked member probabilities (n_members, n_samples, n_classes)
+    
+    Returns:
+        Disagreement scores (n_samples,)
+    """
+    votes = np.argmax(committee_probabilities, axis=2)
+    return entropy(vote_fractions(votes, committee_probabilities.shape[2]))
+
+def kl_to_consensus(committee_probabilities: np.ndarray) -> np.ndarray:
+    """
+    Mean KL divergence of each member's distribution from the consensus.
+    
+    Args:
+        committee_probabilities: Stacked member probabilities (n_members, n_samples, n_classes)
+    
+    Returns:
+        Disagreement scores (n_samples,)
+    """
+    consensus = committee_probabilities.mean(axis=0)
+    
+    ratio = np.ones_like(committee_probabilities)
+    np.divide(committee_probabilities, consensus[None, :, :], out=ratio, where=committee_probabilities > 0)
+    log_ratio = np.log(ratio)
+    
+    return np.einsum("mij,mij->i", committee_probabilities, log_ratio) / committee_probabilities.shape[0]
+
+DISAGREEMENT_FUNCTIONS = {
+    "vote_entropy": vote_entropy,
+    "kl_divergence": kl_to_consensus
+}
+
+class QueryByCommitteeStrategy(QueryStrategyPlugin):
+    """
+    Query-by-Committee Strategy
+    
+    Selects samples with the highest committee disagreement. Requires the
+    labeled set as the X_labeled and y_labeled keyword arguments.
+    
+    The worker threads are started on the first query and reused by later
+    ones; they exit when the strategy is discarded.
+    """
+    
+    PLUGIN_NAME = "query_by_committee"
+    
+    def __init__(self, committee: Optional[List[Dict[str, Any]]] = None,
+                 disagreement: str = "vote_entropy", n_jobs: Optional[int] = None):
+        """
+        Initialize the query-by-committee strategy.
+        
+        Args:
+            committee: Member configurations, each with a model plugin "type"
+                and "parameters" (defaults to four heterogeneous scikit-learn models)
+            disagreement: "vote_entropy" or "kl_divergence"
+            n_jobs: Worker threads for fitting and scoring (defaults to committee size)
+        """
+        if disagreement not in DISAGREEMENT_FUNCTIONS:
+            raise ValueError(f"Unknown disagreement measure '{disagreement}'. Available: {list(DISAGREEMENT_FUNCTIONS.keys())}")
+        
+        self.committee_config = committee or DEFAULT_COMMITTEE
+        self.members: List[ModelPlugin] = [
+            registry.get_model(member.get("type", "sklearn"), **member.get("parameters", {}))
+            for member in self.committee_config
+        ]
+        if len(self.members) < 2:
+            raise ValueError("A committee needs at least two members")
+        
+        self.disagreement = disagreement
+        self.n_jobs = n_jobs or len(self.members)
+        self._fitted_keys: List[Optional[tuple]] = [None] * len(self.members)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.refits = 0
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker threads fitting and scoring the members, shared by all queries."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.n_jobs, thread_name_prefix="al-committee")
+        return self._executor
+    
+    def _fit_committee(self, X_labeled: np.ndarray, y_labeled: np.ndarray,
+                       model_version: Optional[int] = None) -> None:
+        """
+        Fit members that have not seen the current labeled set.
+        
+        The labeled set is identified by the model version it was trained
+        into together with its size, so a label that was rejected and
+        replaced by another one still triggers a refit. Without a model
+        version only the size is compared.
+        """
+        fit_key = (model_version, len(y_labeled))
+        stale = [i for i, key in enumerate(self._fitted_keys) if key != fit_key]
+        if not stale:
+            return
+        
+        futures = {i: self.executor.submit(self.members[i].fit, X_labeled, y_labeled) for i in stale}
+        for i, future in futures.items():
+            future.result()
+            self._fitted_keys[i] = fit_key
+        self.refits += len(stale)
+    
+    def _committee_probabilities(self, X: np.ndarray, classes: np.ndarray) -> np.ndarray:
+        """
+        Stack member probabilities on a shared class axis.
+        
+        Returns:
+            Committee probabilities (n_members, n_samples, n_classes)
+        """
+        stacked = np.zeros((len(self.members), X.shape[0], len(classes)))
+        futures = [self.executor.submit(member.predict_proba, X) for member in self.members]
+        
+        for i, (member, future) in enumerate(zip(self.members, futures)):
+            columns = np.searchsorted(classes, member.classes_)
+            stacked[i][:, columns] = future.result()
+        
+        return stacked
+    
+    def score_committee(self, X: np.ndarray, X_labeled: np.ndarray, y_labeled: np.ndarray,
+                        model_version: Optional[int] = None) -> np.ndarray:
+        """
+        Fit the committee if needed and score disagreement on X.
+        
+        Args:
+            X: Samples to score
+            X_labeled: Labeled features
+            y_labeled: Labels
+            model_version: Version of the model trained on the labeled set
+        
+        Returns:
+            Disagreement scores (n_samples,)
+        """
+        classes = np.unique(y_labeled)
+        
+        self._fit_committee(X_labeled, y_labeled, model_version)
+        committee_probabilities = self._committee_probabilities(X, classes)
+        
+        return DISAGREEMENT_FUNCTIONS[self.disagreement](committee_probabilities)
+    
+    def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray,
+                      n_samples: int, **kwargs) -> List[int]:
+        """
+        Select the samples with the highest committee disagreement.
+        
+        Args:
+            model: Trained model (unused; the committee is trained separately)
+            X_unlabeled: Pool of unlabeled samples
+            n_samples: Number of samples to select
+            **kwargs: "X_labeled" and "y_labeled" (required), optional
+                "candidate_indices" restricting the choice to those pool rows
+                and optional "model_version" of the labeled set
+        
+        Returns:
+            Positions of selected samples (into candidate_indices if given),
+            most disagreed-on first
+        """
+        X_labeled = kwargs.get("X_labeled")
+        y_labeled = kwargs.get("y_labeled")
+        if X_labeled is None or y_labeled is None:
+            raise ValueError("Query-by-committee requires the labeled set (X_labeled, y_labeled)")
+        
+        candidate_indices = kwargs.get("candidate_indices")
+        X_candidates = X_unlabeled if candidate_indices is None else X_unlabeled[candidate_indices]
+        
+        scores = self.score_committee(X_candidates, X_labeled, np.asarray(y_labeled), kwargs.get("model_version"))
+        selected = top_k_indices(scores, n_samples)
+        self.selection_scores = scores[selected]
+        return selected.tolist()
+    
+    def get_strategy_info(self) -> Dict[str, Any]:
+        """
+        Get information about the query strategy.
+        
+        Returns:
+            Strategy metadata
+        """
+        return {
+            "name": self.PLUGIN_NAME,
+            "description": "Selects samples with the highest committee disagreement",
+            "disagreement": self.disagreement,
+            "available_disagreements": list(DISAGREEMENT_FUNCTIONS.keys()),
+            "committee": [member.get_params().get("estimator", type(member).__name__) for member in self.members],
+            "refits": self.refits
+        }
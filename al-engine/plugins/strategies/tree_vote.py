@@ -0,0 +1,147 @@
+"""
+Tree-Vote Strategy Plugin
+
+Treats the trees of the experiment's fitted forest (RandomForestClassifier
+or any ensemble exposing ``estimators_``) as a committee: per-tree votes are
+stacked into one integer array and reduced with a single bincount, giving
+committee disagreement at roughly the cost of one predict and without
+training any extra models.
+"""
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import logging
+
+from interfaces.base import QueryStrategyPlugin, ModelPlugin
+from utils.sparse import is_sparse, as_float
+from utils.uncertainty import entropy, top_k_indices, vote_fractions
+
+logger = logging.getLogger(__name__)
+
+def _majority_disagreement(fractions: np.ndarray) -> np.ndarray:
+    """Share of trees not voting for the majority class."""
+    return 1.0 - fractions.max(axis=1)
+
+VOTE_MEASURES = {
+    "vote_entropy": entropy,
+    "disagreement": _majority_disagreement
+}
+
+class TreeVoteStrategy(QueryStrategyPlugin):
+    """
+    Tree-Vote Query Strategy
+    
+    Selects the samples the trees of the forest disagree on most.
+    """
+    
+    PLUGIN_NAME = "tree_vote"
+    
+    def __init__(self, method: str = "vote_entropy", n_jobs: Optional[int] = None):
+        """
+        Initialize the tree-vote strategy.
+        
+        Args:
+            method: "vote_entropy" or "disagreement" (1 - majority vote share)
+            n_jobs: Threads for per-tree predictions (defaults to one)
+        """
+        if method not in VOTE_MEASURES:
+            raise ValueError(f"Unknown vote measure '{method}'. Available: {list(VOTE_MEASURES.keys())}")
+        
+        self.method = method
+        self.n_jobs = n_jobs or 1
+    
+    @staticmethod
+    def _get_forest(model):
+        """Unwrap the fitted tree ensemble from a learner."""
+        # Forests have an "estimator" attribute of their own (the tree template),
+        # so only unwrap learners that are not ensembles themselves
+        forest = model if hasattr(model, "estimators_") else getattr(model, "estimator", model)
+        if not hasattr(forest, "estimators_"):
+            raise ValueError(f"Tree-vote strategy needs a fitted tree ensemble, got {type(forest).__name__}")
+        return forest
+    
+    def tree_votes(self, model, X: np.ndarray) -> np.ndarray:
+        """
+        Stack the class votes of every tree.
+        
+        Args:
+            model: Fitted forest (or learner wrapping one)
+            X: Samples to vote on
+        
+        Returns:
+            Class index votes (n_trees, n_samples)
+        """
+        forest = self._get_forest(model)
+        
+        # Trees expect float32 input; convert once and skip per-tree validation
+        # (sparse input is validated per tree, which keeps its index format right)
+        sparse = is_sparse(X)
+        X = as_float(X, np.float32) if sparse else np.ascontiguousarray(X, dtype=np.float32)
+        votes = np.empty((len(forest.estimators_), X.shape[0]), dtype=np.intp)
+        
+        def predict_tree(i):
+            # Sub-estimators predict encoded class indices
+            votes[i] = forest.estimators_[i].predict(X, check_input=sparse)
+        
+        if self.n_jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.n_jobs, thread_name_prefix="al-trees") as executor:
+                list(executor.map(predict_tree, range(len(forest.estimators_))))
+        else:
+            for i in range(len(forest.estimators_)):
+                predict_tree(i)
+        
+        return votes
+    
+    def score_samples(self, model, X_unlabeled: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Compute tree disagreement scores.
+        
+        Args:
+            model: Fitted forest (or learner wrapping one)
+            X_unlabeled: Samples to score
+            **kwargs: Ignored
+        
+        Returns:
+            Disagreement scores (n_samples,)
+        """
+        forest = self._get_forest(model)
+        fractions = vote_fractions(self.tree_votes(forest, X_unlabeled), len(forest.classes_))
+        return VOTE_MEASURES[self.method](fractions)
+    
+    def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray,
+                      n_samples: int, **kwargs) -> List[int]:
+        """
+        Select the samples with the highest tree disagreement.
+        
+        Args:
+            model: Fitted forest (or learner wrapping one)
+            X_unlabeled: Pool of unlabeled samples
+            n_samples: Number of samples to select
+            **kwargs: Optional "candidate_indices" restricting the choice to those pool rows
+        
+        Returns:
+            Positions of selected samples (into candidate_indices if given),
+            most disagreed-on first
+        """
+        candidate_indices = kwargs.get("candidate_indices")
+        X_candidates = X_unlabeled if candidate_indices is None else X_unlabeled[candidate_indices]
+        
+        scores = self.score_samples(model, X_candidates)
+        selected = top_k_indices(scores, n_samples)
+        self.selection_scores = scores[selected]
+        return selected.tolist()
+    
+    def get_strategy_info(self) -> Dict[str, Any]:
+        """
+        Get information about the query strategy.
+        
+        Returns:
+            Strategy metadata
+        """
+        return {
+            "name": self.PLUGIN_NAME,
+            "method": self.method,
+            "description": "Selects samples the trees of the forest disagree on most",
+            "available_methods": list(VOTE_MEASURES.keys())
+        }
@@ -0,0 +1,88 @@
+"""
+Uncertainty Sampling Strategy Plugin
+
+Built-in uncertainty sampling that scores the pool from a single
+``predict_proba`` matrix with least-confidence, margin or entropy and
+selects the top-k samples without a full sort. Does not require modAL.
+"""
+
+import numpy as np
+from typing import Dict, Any, List
+import logging
+
+from interfaces.base import QueryStrategyPlugin, ModelPlugin
+from utils.uncertainty import SCORING_FUNCTIONS, uncertainty_scores, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+class UncertaintySamplingStrategy(QueryStrategyPlugin):
+    """
+    Uncertainty Sampling Query Strategy
+    
+    Selects the samples the model is least certain about.
+    """
+    
+    PLUGIN_NAME = "uncertainty_sampling"
+    
+    def __init__(self, method: str = "least_confidence"):
+        """
+        Initialize the uncertainty sampling strategy.
+        
+        Args:
+            method: Scoring method ("least_confidence", "margin", "entropy")
+        """
+        if method not in SCORING_FUNCTIONS:
+            raise ValueError(f"Unknown uncertainty method '{method}'. Available: {list(SCORING_FUNCTIONS.keys())}")
+        
+        self.method = method
+    
+    def score_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray, **kwargs) -> np.ndarray:
+        """
+        Compute uncertainty scores for the pool.
+        
+        Args:
+            model: Trained model providing predict_proba
+            X_unlabeled: Pool of unlabeled samples
+            **kwargs: Optional precomputed "probabilities" for X_unlabeled
+        
+        Returns:
+            Uncertainty scores (n_samples,)
+        """
+        probabilities = kwargs.get("probabilities")
+        if probabilities is None:
+            probabilities = model.predict_proba(X_unlabeled)
+        
+        return uncertainty_scores(probabilities, self.method)
+    
+    def select_samples(self, model: ModelPlugin, X_unlabeled: np.ndarray,
+                      n_samples: int, **kwargs) -> List[int]:
+        """
+        Select the most uncertain samples.
+        
+        Args:
+            model: Trained model providing predict_proba
+            X_unlabeled: Pool of unlabeled samples
+            n_samples: Number of samples to select
+            **kwargs: Optional precomputed "probabilities" for X_unlabeled
+        
+        Returns:
+            Indices of selected samples, most uncertain first
+        """
+        scores = self.score_samples(model, X_unlabeled, **kwargs)
+        selected = top_k_indices(scores, n_samples)
+        self.selection_scores = scores[selected]
+        return selected.tolist()
+    
+    def get_strategy_info(self) -> Dict[str, Any]:
+        """
+        Get information about the query strategy.
+        
+        Returns:
+            Strategy metadata
+        """
+        return {
+            "name": self.PLUGIN_NAME,
+            "method": self.method,
+            "description": "Selects samples with the highest model uncertainty",
+            "available_methods": list(SCORING_FUNCTIONS.keys())
+        }
@@ -5,13 +5,17 @@ This service orchestrates the active learning workflow using the plugin system.
 It manages experiments, coordinates between plugins, and provides a unified interface.
 """
 
-import numpy as np
-from typing import Dict, Any, List, Optional
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 import logging
 from datetime import datetime
 
-from interfaces.base import ALFrameworkPlugin, SampleInfo
 from plugin_registry import registry
+from services.experiment_session import ExperimentSession
+from utils.snapshot_io import list_snapshots, recover_directory
+from utils.label_journal import JOURNAL_SUFFIX, LabelJournal, list_journals
 
 logger = logging.getLogger(__name__)
 
@@ -20,25 +24,83 @@ class ALEngineService:
     Main AL Engine Service
     
     This service manages active learning experiments using the plugin architecture.
-    It coordinates between framework, model, strategy, and dataset plugins.
+    It keeps a registry of experiment sessions, each with its own framework
+    plugin instance and lock, sharing one worker pool for CPU-bound work.
+    
+    Calls without an experiment_id act on the most recently initialized
+    experiment, matching the single-experiment API.
     """
     
-    def __init__(self):
-        """Initialize the AL Engine service."""
-        self.current_framework: Optional[ALFrameworkPlugin] = None
-        self.experiment_config: Optional[Dict[str, Any]] = None
-        self.experiment_id: Optional[str] = None
-        self.current_sample_index: int = 0
-        self.unlabeled_indices: List[int] = []
-        self.labeled_indices: List[int] = []
-        self.experiment_state = "idle"  # idle, initialized, training, querying
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize the AL Engine service.
+        
+        Args:
+            max_workers: Size of the worker pool running plugin work
+                (defaults to the AL_ENGINE_WORKERS environment variable or 4)
+        """
+        self.experiments: Dict[str, ExperimentSession] = {}
+        self.default_experiment_id: Optional[str] = None
+        
+        # CPU-bound plugin work (fit, predict_proba, metrics) runs in this pool
+        # so the event loop keeps serving /health and /status during retrains
+        if max_workers is None:
+            max_workers = int(os.getenv("AL_ENGINE_WORKERS", "4"))
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="al-engine")
+        
+        # Snapshots are kept in <snapshot_dir>/<experiment_id>. Setting
+        # AL_ENGINE_SNAPSHOT_DIR makes experiments persistent: every label is
+        # journaled to <snapshot_dir>/<experiment_id>.journal and every
+        # experiment is snapshotted on shutdown
+        self.snapshot_dir = os.getenv("AL_ENGINE_SNAPSHOT_DIR", "snapshots")
+        self.persistent = bool(os.getenv("AL_ENGINE_SNAPSHOT_DIR"))
         
         logger.info("AL Engine service initialized")
     
+    def _get_session(self, experiment_id: Optional[str] = None) -> ExperimentSession:
+        """
+        Look up an experiment session.
+        
+        Args:
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
+        Returns:
+            Experiment session
+        
+        Raises:
+            ValueError: If the experiment does not exist
+        """
+        if experiment_id is None:
+            experiment_id = self.default_experiment_id
+            if experiment_id is None:
+                raise ValueError("No experiment initialized")
+        
+        if experiment_id not in self.experiments:
+            raise ValueError(f"Experiment {experiment_id} not found")
+        
+        return self.experiments[experiment_id]
+    
+    def _create_session(self, experiment_id: str) -> ExperimentSession:
+        """Create a session, with a label journal if experiments are persistent."""
+        journal = None
+        if self.persistent:
+            journal = LabelJournal(self.snapshot_path(experiment_id) + JOURNAL_SUFFIX)
+        return ExperimentSession(experiment_id, self.executor, journal=journal)
+    
+    async def _discard_session(self, experiment_id: str, delete_journal: bool = False) -> None:
+        """Stop and unregister a session, dropping its buffered labels."""
+        session = self.experiments.pop(experiment_id, None)
+        if session:
+            await session.stop()
+            await session.close_journal(delete=delete_journal)
+    
     async def initialize_experiment(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Initialize a new AL experiment.
         
+        Re-initializing an existing experiment id replaces only that
+        experiment; other experiments keep running.
+        
         Args:
             config: Experiment configuration containing:
                 - experiment_id: Unique experiment identifier
@@ -46,277 +108,124 @@ class ALEngineService:
                 - model: Model configuration
                 - query_strategy: Query strategy configuration
                 - dataset: Dataset configuration
-                
+                - update_strategy: Retrain policy ("immediate" or "micro_batch")
+        
         Returns:
             Initialization result
         """
         try:
-            logger.info("Initializing AL experiment")
-            
-            # Store experiment configuration
-            self.experiment_config = config
-            self.experiment_id = config.get("experiment_id", f"exp_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            
-            # Get framework configuration
-            framework_config = config.get("al_framework", {})
-            framework_type = framework_config.get("type", "sklearn")
+            experiment_id = config.get("experiment_id") or f"exp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            if self.persistent:
+                # The id names the experiment's journal and snapshot files
+                self.snapshot_path(experiment_id)
             
-            # Initialize framework plugin
-            self.current_framework = registry.get_framework(framework_type)
-            self.current_framework.initialize(config)
+            # Drop labels buffered for a previous run of the same experiment
+            await self._discard_session(experiment_id)
             
-            # Perform initial training
-            dataset_config = config.get("dataset", {})
-            initial_training_result = await self._perform_initial_training(dataset_config)
+            session = self._create_session(experiment_id)
+            self.experiments[experiment_id] = session
+            self.default_experiment_id = experiment_id
             
-            if initial_training_result["status"] == "success":
-                self.experiment_state = "initialized"
-                logger.info(f"Experiment {self.experiment_id} initialized successfully")
-                
-                return {
-                    "status": "success",
-                    "experiment_id": self.experiment_id,
-                    "framework": framework_type,
-                    "initial_training": initial_training_result,
-                    "available_plugins": registry.list_available()
-                }
-            else:
-                self.experiment_state = "error"
-                return {
-                    "status": "error",
-                    "error": "Initial training failed",
-                    "details": initial_training_result
-                }
-                
+            return await session.initialize(config)
+        
         except Exception as e:
             logger.error(f"Experiment initialization failed: {str(e)}")
-            self.experiment_state = "error"
             return {
                 "status": "error",
                 "error": str(e)
             }
     
-    async def _perform_initial_training(self, dataset_config: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_next_sample(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Perform initial training (warm start) on the dataset.
+        Get the next most informative sample for labeling.
         
         Args:
-            dataset_config: Dataset configuration
-            
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
         Returns:
-            Training result
+            Sample information for labeling
         """
         try:
-            # For now, use the framework's built-in dataset loading
-            # In the future, this will use dataset plugins
-            
-            # The framework plugin handles initial training internally
-            # This is a placeholder for when we have separate dataset plugins
-            
-            # Get initial training data from framework
-            if hasattr(self.current_framework, 'X_train') and hasattr(self.current_framework, 'y_train'):
-                X_train = self.current_framework.X_train
-                y_train = self.current_framework.y_train
-                
-                # Perform initial training
-                result = self.current_framework.train_initial_model(X_train, y_train)
-                
-                # Initialize unlabeled indices
-                if hasattr(self.current_framework, 'X_unlabeled'):
-                    self.unlabeled_indices = list(range(len(self.current_framework.X_unlabeled)))
-                    self.labeled_indices = []
-                
-                return result
-            else:
-                return {
-                    "status": "error",
-                    "error": "Framework does not provide training data"
-                }
-                
+            return await self._get_session(experiment_id).get_next_sample()
         except Exception as e:
-            logger.error(f"Initial training failed: {str(e)}")
+            logger.error(f"Failed to get next sample: {str(e)}")
             return {
                 "status": "error",
                 "error": str(e)
             }
     
-    async def get_next_sample(self) -> Dict[str, Any]:
+    async def get_next_samples(self, n_samples: int = 1, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get the next most informative sample for labeling.
+        Get the k most informative samples for labeling in one query.
+        
+        Args:
+            n_samples: Number of samples to return
+            experiment_id: Experiment identifier (defaults to the latest experiment)
         
         Returns:
-            Sample information for labeling
+            Ranked sample information for labeling
         """
         try:
-            if not self.current_framework:
-                raise ValueError("No experiment initialized")
-            
-            if self.experiment_state not in ["initialized", "training"]:
-                raise ValueError(f"Invalid experiment state: {self.experiment_state}")
-            
-            if not self.unlabeled_indices:
-                return {
-                    "status": "no_samples",
-                    "message": "No unlabeled samples available"
-                }
-            
-            self.experiment_state = "querying"
-            
-            # Get unlabeled data
-            X_unlabeled = self.current_framework.X_unlabeled[self.unlabeled_indices]
-            
-            # Query for most informative sample
-            selected_indices = self.current_framework.query_samples(X_unlabeled, n_samples=1)
-            
-            if not selected_indices:
-                return {
-                    "status": "error",
-                    "error": "Query strategy returned no samples"
-                }
-            
-            # Map back to original indices
-            original_index = self.unlabeled_indices[selected_indices[0]]
-            sample_features = X_unlabeled[selected_indices[0]]
-            
-            # Get predictions and uncertainty
-            predictions, uncertainties = self.current_framework.predict(sample_features.reshape(1, -1))
-            
-            # Create sample info
-            sample_info = {
-                "sample_id": f"sample_{original_index}",
-                "sample_index": original_index,
-                "features": self._format_features(sample_features),
-                "uncertainty_score": float(uncertainties[0]) if len(uncertainties) > 0 else 0.0,
-                "predicted_label": int(predictions[0]) if len(predictions) > 0 else 0,
-                "metadata": {
-                    "experiment_id": self.experiment_id,
-                    "query_timestamp": datetime.now().isoformat(),
-                    "remaining_unlabeled": len(self.unlabeled_indices) - 1
-                }
-            }
-            
-            # Store current sample for labeling
-            self.current_sample_index = original_index
-            
-            self.experiment_state = "initialized"
-            
-            return {
-                "status": "success",
-                "sample": sample_info
-            }
-            
+            return await self._get_session(experiment_id).get_next_samples(n_samples)
         except Exception as e:
-            logger.error(f"Failed to get next sample: {str(e)}")
-            self.experiment_state = "error"
+            logger.error(f"Failed to get next samples: {str(e)}")
             return {
                 "status": "error",
                 "error": str(e)
             }
     
-    def _format_features(self, features: np.ndarray) -> Dict[str, float]:
-        """
-        Format feature array as a dictionary.
-        
-        Args:
-            features: Feature array
-            
-        Returns:
-            Dictionary of feature names to values
-        """
-        # For wine dataset, use known feature names
-        wine_feature_names = [
-            'alcohol', 'malic_acid', 'ash', 'alcalinity_of_ash', 'magnesium',
-            'total_phenols', 'flavanoids', 'nonflavanoid_phenols', 'proanthocyanins',
-            'color_intensity', 'hue', 'od280/od315_of_diluted_wines', 'proline'
-        ]
-        
-        if len(features) == len(wine_feature_names):
-            return {name: float(value) for name, value in zip(wine_feature_names, features)}
-        else:
-            return {f"feature_{i}": float(value) for i, value in enumerate(features)}
-    
-    async def submit_label(self, sample_id: str, label: int) -> Dict[str, Any]:
+    async def submit_label(self, sample_id: str, label: int, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Submit a label for a sample and update the model.
         
         Args:
             sample_id: ID of the sample being labeled
             label: Label assigned to the sample
-            
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
         Returns:
             Update result
         """
         try:
-            if not self.current_framework:
-                raise ValueError("No experiment initialized")
-            
-            # Extract sample index from sample_id
-            sample_index = int(sample_id.split("_")[-1])
-            
-            if sample_index not in self.unlabeled_indices:
-                raise ValueError(f"Sample {sample_id} is not in unlabeled pool")
-            
-            self.experiment_state = "training"
-            
-            # Get sample features
-            unlabeled_pool_index = self.unlabeled_indices.index(sample_index)
-            X_new = self.current_framework.X_unlabeled[sample_index:sample_index+1]
-            y_new = np.array([label])
-            
-            # Update model with new label
-            update_result = self.current_framework.update_model(X_new, y_new)
-            
-            # Update indices
-            self.unlabeled_indices.remove(sample_index)
-            self.labeled_indices.append(sample_index)
-            
-            # Get updated metrics
-            metrics = self.current_framework.get_metrics()
-            
-            self.experiment_state = "initialized"
-            
+            return await self._get_session(experiment_id).submit_label(sample_id, label)
+        except Exception as e:
+            logger.error(f"Failed to submit label: {str(e)}")
             return {
-                "status": "success",
-                "sample_id": sample_id,
-                "label": label,
-                "update_result": update_result,
-                "metrics": metrics.__dict__,
-                "remaining_unlabeled": len(self.unlabeled_indices),
-                "total_labeled": len(self.labeled_indices)
+                "status": "error",
+                "error": str(e)
             }
-            
+    
+    async def flush_labels(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Apply all buffered labels of an experiment to its model now.
+        
+        Args:
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
+        Returns:
+            Flush result
+        """
+        try:
+            return await self._get_session(experiment_id).flush_labels()
         except Exception as e:
-            logger.error(f"Failed to submit label: {str(e)}")
-            self.experiment_state = "error"
+            logger.error(f"Failed to flush labels: {str(e)}")
             return {
                 "status": "error",
                 "error": str(e)
             }
     
-    async def get_metrics(self) -> Dict[str, Any]:
+    async def get_metrics(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get current model performance metrics.
         
+        Args:
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
         Returns:
             Current metrics
         """
         try:
-            if not self.current_framework:
-                raise ValueError("No experiment initialized")
-            
-            metrics = self.current_framework.get_metrics()
-            
-            return {
-                "status": "success",
-                "metrics": metrics.__dict__,
-                "experiment_info": {
-                    "experiment_id": self.experiment_id,
-                    "state": self.experiment_state,
-                    "labeled_samples": len(self.labeled_indices),
-                    "unlabeled_samples": len(self.unlabeled_indices)
-                }
-            }
-            
+            return await self._get_session(experiment_id).get_metrics()
         except Exception as e:
             logger.error(f"Failed to get metrics: {str(e)}")
             return {
@@ -324,33 +233,33 @@ class ALEngineService:
                 "error": str(e)
             }
     
-    async def get_status(self) -> Dict[str, Any]:
+    async def get_status(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Get AL engine status and configuration.
+        Get AL engine or experiment status and configuration.
+        
+        Args:
+            experiment_id: Experiment identifier. Without it the status of the
+                latest experiment is returned together with all experiment ids.
         
         Returns:
             Engine status
         """
         try:
-            status = {
-                "status": "success",
-                "engine_state": self.experiment_state,
-                "experiment_id": self.experiment_id,
-                "experiment_config": self.experiment_config,
-                "available_plugins": registry.list_available()
-            }
+            if experiment_id is not None:
+                return await self._get_session(experiment_id).get_status()
             
-            if self.current_framework:
-                framework_state = self.current_framework.get_state()
-                status["framework_state"] = framework_state
-                
-                if self.experiment_state in ["initialized", "training", "querying"]:
-                    status["experiment_info"] = {
-                        "labeled_samples": len(self.labeled_indices),
-                        "unlabeled_samples": len(self.unlabeled_indices),
-                        "total_samples": len(self.labeled_indices) + len(self.unlabeled_indices)
-                    }
+            if self.default_experiment_id is None:
+                status = {
+                    "status": "success",
+                    "engine_state": "idle",
+                    "experiment_id": None,
+                    "experiment_config": None,
+                    "available_plugins": registry.list_available()
+                }
+            else:
+                status = await self._get_session().get_status()
             
+            status["experiments"] = list(self.experiments.keys())
             return status
             
         except Exception as e:
@@ -360,24 +269,57 @@ class ALEngineService:
                 "error": str(e)
             }
     
-    async def reset(self) -> Dict[str, Any]:
+    async def list_experiments(self) -> Dict[str, Any]:
+        """
+        List all experiments hosted by this engine.
+        
+        Returns:
+            Experiment summaries
+        """
+        return {
+            "status": "success",
+            "experiments": [session.get_summary() for session in self.experiments.values()],
+            "default_experiment_id": self.default_experiment_id
+        }
+    
+    async def reset(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Reset the AL engine state.
+        Reset one experiment, or the whole AL engine.
+        
+        Args:
+            experiment_id: Experiment to remove. Without it all experiments are removed.
         
         Returns:
             Reset result
         """
         try:
+            if experiment_id is not None:
+                logger.info(f"Resetting experiment {experiment_id}")
+                self._get_session(experiment_id)
+                
+                # Stop background retraining, drop buffered labels and persisted state
+                await self._discard_session(experiment_id, delete_journal=self.persistent)
+                if self.persistent:
+                    shutil.rmtree(self.snapshot_path(experiment_id), ignore_errors=True)
+                
+                if self.default_experiment_id == experiment_id:
+                    self.default_experiment_id = next(reversed(list(self.experiments)), None)
+                
+                return {
+                    "status": "success",
+                    "message": f"Experiment {experiment_id} reset successfully"
+                }
+            
             logger.info("Resetting AL engine")
             
+            # Stop background retraining, drop buffered labels and persisted state
+            for experiment_id in list(self.experiments):
+                await self._discard_session(experiment_id, delete_journal=self.persistent)
+                if self.persistent:
+                    shutil.rmtree(self.snapshot_path(experiment_id), ignore_errors=True)
+            
             # Reset state
-            self.current_framework = None
-            self.experiment_config = None
-            self.experiment_id = None
-            self.current_sample_index = 0
-            self.unlabeled_indices = []
-            self.labeled_indices = []
-            self.experiment_state = "idle"
+            self.default_experiment_id = None
             
             return {
                 "status": "success",
@@ -389,4 +331,117 @@ class ALEngineService:
             return {
                 "status": "error",
                 "error": str(e)
-            } 
\ No newline at end of file
+            }
+    
+    def snapshot_path(self, experiment_id: str) -> str:
+        """
+        Get the snapshot directory of an experiment.
+        
+        Args:
+            experiment_id: Experiment identifier
+        
+        Returns:
+            Snapshot directory path
+        
+        Raises:
+            ValueError: If the id cannot be used as a directory name
+        """
+        if not experiment_id or experiment_id in (".", "..") or "/" in experiment_id or os.sep in experiment_id:
+            raise ValueError(f"Invalid experiment id for a snapshot: {experiment_id!r}")
+        return os.path.join(self.snapshot_dir, experiment_id)
+    
+    async def snapshot(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Write a binary snapshot of an experiment.
+        
+        Args:
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
+        Returns:
+            Snapshot result
+        """
+        try:
+            session = self._get_session(experiment_id)
+            return await session.save_snapshot(self.snapshot_path(session.experiment_id))
+        except Exception as e:
+            logger.error(f"Failed to snapshot experiment: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def restore(self, experiment_id: str) -> Dict[str, Any]:
+        """
+        Restore an experiment from its snapshot and label journal, replacing
+        any running copy.
+        
+        Args:
+            experiment_id: Experiment identifier
+        
+        Returns:
+            Restore result
+        """
+        try:
+            path = self.snapshot_path(experiment_id)
+            # Move the previous snapshot back if a crash interrupted a snapshot swap
+            recover_directory(path)
+            has_journal = self.persistent and os.path.exists(path + JOURNAL_SUFFIX)
+            if not os.path.isdir(path) and not has_journal:
+                raise ValueError(f"No snapshot of experiment {experiment_id} in {self.snapshot_dir}")
+            
+            # The running copy must release the journal before it is reopened
+            await self._discard_session(experiment_id)
+            
+            session = self._create_session(experiment_id)
+            result = await session.recover(path)
+            if result["status"] != "success":
+                await session.close_journal()
+                return result
+            
+            self.experiments[experiment_id] = session
+            self.default_experiment_id = experiment_id
+            return result
+        
+        except Exception as e:
+            logger.error(f"Failed to restore experiment {experiment_id}: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def snapshot_all(self) -> Dict[str, Any]:
+        """
+        Snapshot every experiment hosted by this engine.
+        
+        Returns:
+            Snapshot results keyed by experiment id
+        """
+        results = {experiment_id: await self.snapshot(experiment_id) for experiment_id in list(self.experiments)}
+        return {
+            "status": "success" if all(r["status"] == "success" for r in results.values()) else "error",
+            "snapshots": results
+        }
+    
+    async def restore_all(self) -> Dict[str, Any]:
+        """
+        Recover every experiment with a snapshot or journal in the snapshot directory.
+        
+        Returns:
+            Restore results keyed by experiment id
+        """
+        experiment_ids = sorted(set(list_snapshots(self.snapshot_dir)) | set(list_journals(self.snapshot_dir)))
+        results = {experiment_id: await self.restore(experiment_id) for experiment_id in experiment_ids}
+        return {
+            "status": "success" if all(r["status"] == "success" for r in results.values()) else "error",
+            "restored": results
+        }
+    
+    async def shutdown(self) -> None:
+        """Apply buffered labels, stop background retraining and the worker pool."""
+        for session in self.experiments.values():
+            await session.stop(flush=True)
+        if self.persistent:
+            await self.snapshot_all()
+        for session in self.experiments.values():
+            await session.close_journal()
+        self.executor.shutdown(wait=False)
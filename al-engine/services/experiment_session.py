@@ -0,0 +1,929 @@
+"""
+Experiment Session
+
+State and workflow of a single active learning experiment: its framework
+plugin, unlabeled pool, labeled set, retrain scheduler and lock.
+"""
+
+import asyncio
+import functools
+import os
+import time
+import numpy as np
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Callable
+import logging
+from datetime import datetime
+
+from interfaces.base import ALFrameworkPlugin, SampleInfo
+from plugin_registry import registry
+from utils.unlabeled_pool import UnlabeledPool
+from utils.candidate_sampling import CandidateSampler
+from utils.snapshot_io import MANIFEST_NAME, atomic_directory, save_array, load_array, save_manifest, load_manifest
+from utils.label_journal import LabelJournal
+from utils.sparse import is_sparse, nonzero_entries
+from services.retrain_scheduler import RetrainPolicy, RetrainScheduler
+
+logger = logging.getLogger(__name__)
+
+class ExperimentSession:
+    """
+    A single active learning experiment.
+    
+    Each session owns its own framework plugin instance and a lock that
+    serializes work on it, so several sessions can run side by side in
+    one engine without sharing model state.
+    """
+    
+    def __init__(self, experiment_id: str, executor: Executor, journal: Optional[LabelJournal] = None):
+        """
+        Initialize an experiment session.
+        
+        Args:
+            experiment_id: Unique experiment identifier
+            executor: Worker pool running CPU-bound plugin work
+            journal: Optional write-ahead journal recording every label
+        """
+        self.experiment_id = experiment_id
+        self.executor = executor
+        self.journal = journal
+        self.current_framework: Optional[ALFrameworkPlugin] = None
+        self.experiment_config: Optional[Dict[str, Any]] = None
+        self.current_sample_index: int = 0
+        self.unlabeled_pool = UnlabeledPool(0)
+        self.labeled_indices: List[int] = []
+        self.retrain_scheduler: Optional[RetrainScheduler] = None
+        self.candidate_sampler: Optional[CandidateSampler] = None
+        self.experiment_state = "idle"  # idle, initialized, training, querying
+        self.last_metrics: Dict[str, Any] = {}
+        self.created_at = datetime.now().isoformat()
+        self._experiment_lock: Optional[asyncio.Lock] = None
+    
+    @property
+    def experiment_lock(self) -> asyncio.Lock:
+        """Lock serializing all work on the experiment's framework plugin."""
+        if self._experiment_lock is None:
+            self._experiment_lock = asyncio.Lock()
+        return self._experiment_lock
+    
+    async def _run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking plugin call in the worker pool.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+        
+        Returns:
+            Result of the call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+    
+    async def initialize(self, config: Dict[str, Any], resume_journal: bool = False) -> Dict[str, Any]:
+        """
+        Initialize the AL experiment.
+        
+        Args:
+            config: Experiment configuration containing:
+                - al_framework: Framework configuration
+                - model: Model configuration
+                - query_strategy: Query strategy configuration
+                - candidate_sampling: Optional approximate query mode
+                  (type "random" or "stratified", size, refresh_every)
+                - dataset: Dataset configuration
+                - update_strategy: Retrain policy ("immediate" or "micro_batch")
+            resume_journal: Keep the existing journal (crash recovery) instead
+                of starting a new one
+        
+        Returns:
+            Initialization result
+        """
+        try:
+            logger.info(f"Initializing AL experiment {self.experiment_id}")
+            
+            if self.journal and not resume_journal:
+                await self._run_blocking(self.journal.reset, self.experiment_id, config, self.created_at)
+            
+            # Parse retrain policy
+            retrain_policy = RetrainPolicy.from_config(config.get("update_strategy"))
+            self.retrain_scheduler = RetrainScheduler(retrain_policy, self._apply_label_batch, self._return_rejected)
+            self.candidate_sampler = CandidateSampler.from_config(config.get("candidate_sampling"))
+            
+            async with self.experiment_lock:
+                # Store experiment configuration
+                self.experiment_config = config
+                
+                # Get framework configuration
+                framework_config = config.get("al_framework", {})
+                framework_type = framework_config.get("type", "sklearn")
+                
+                # Initialize framework plugin
+                self.current_framework = registry.get_framework(framework_type)
+                await self._run_blocking(self.current_framework.initialize, config)
+                
+                # Perform initial training
+                dataset_config = config.get("dataset", {})
+                initial_training_result = await self._perform_initial_training(dataset_config)
+            
+            if initial_training_result["status"] == "success":
+                self.experiment_state = "initialized"
+                logger.info(f"Experiment {self.experiment_id} initialized successfully")
+                
+                return {
+                    "status": "success",
+                    "experiment_id": self.experiment_id,
+                    "framework": framework_type,
+                    "initial_training": initial_training_result,
+                    "available_plugins": registry.list_available()
+                }
+            else:
+                self.experiment_state = "error"
+                return {
+                    "status": "error",
+                    "error": "Initial training failed",
+                    "details": initial_training_result
+                }
+        
+        except Exception as e:
+            logger.error(f"Experiment initialization failed: {str(e)}")
+            self.experiment_state = "error"
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def _perform_initial_training(self, dataset_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform initial training (warm start) on the dataset.
+        
+        Args:
+            dataset_config: Dataset configuration
+        
+        Returns:
+            Training result
+        """
+        try:
+            # For now, use the framework's built-in dataset loading
+            # In the future, this will use dataset plugins
+            
+            # The framework plugin handles initial training internally
+            # This is a placeholder for when we have separate dataset plugins
+            
+            # Get initial training data from framework
+            if hasattr(self.current_framework, 'X_train') and hasattr(self.current_framework, 'y_train'):
+                X_train = self.current_framework.X_train
+                y_train = self.current_framework.y_train
+                
+                # Perform initial training
+                result = await self._run_blocking(self.current_framework.train_initial_model, X_train, y_train)
+                
+                # Initialize unlabeled pool
+                if hasattr(self.current_framework, 'X_unlabeled'):
+                    self.unlabeled_pool = UnlabeledPool(self.current_framework.X_unlabeled.shape[0])
+                    self.labeled_indices = []
+                
+                self.last_metrics = result.get("initial_metrics", {})
+                return result
+            else:
+                return {
+                    "status": "error",
+                    "error": "Framework does not provide training data"
+                }
+        
+        except Exception as e:
+            logger.error(f"Initial training failed: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def get_next_sample(self) -> Dict[str, Any]:
+        """
+        Get the next most informative sample for labeling.
+        
+        Returns:
+            Sample information for labeling
+        """
+        result = await self.get_next_samples(n_samples=1)
+        
+        if result["status"] != "success":
+            return result
+        
+        sample_info = result["samples"][0]
+        
+        return {
+            "status": "success",
+            "sample": sample_info
+        }
+    
+    async def get_next_samples(self, n_samples: int = 1) -> Dict[str, Any]:
+        """
+        Get the k most informative samples for labeling in one query.
+        
+        The unlabeled pool is scored once and the top k samples are returned
+        in the query strategy's order (e.g. greedy order for core-set), with
+        the strategy's own score as uncertainty_score, so a team of
+        annotators can work from a single query instead of one pool scoring
+        pass per label.
+        
+        Args:
+            n_samples: Number of samples to return
+        
+        Returns:
+            Ranked sample information for labeling
+        """
+        try:
+            if not self.current_framework:
+                raise ValueError("No experiment initialized")
+            
+            if n_samples < 1:
+                return {
+                    "status": "error",
+                    "error": f"n_samples must be at least 1, got {n_samples}"
+                }
+            
+            async with self.experiment_lock:
+                if self.experiment_state not in ["initialized", "training"]:
+                    raise ValueError(f"Invalid experiment state: {self.experiment_state}")
+                
+                if len(self.unlabeled_pool) == 0:
+                    return {
+                        "status": "no_samples",
+                        "message": "No unlabeled samples available"
+                    }
+                
+                self.experiment_state = "querying"
+                
+                # Queued labels keep removing rows from the pool on the event
+                # loop while the query runs; the snapshot view stays intact
+                with self.unlabeled_pool.snapshot() as pool_indices:
+                    if self.candidate_sampler:
+                        candidate_indices = self.candidate_sampler.sample(self.unlabeled_pool, n_samples)
+                        approximation = self.candidate_sampler.get_info(len(self.unlabeled_pool), len(candidate_indices))
+                    else:
+                        candidate_indices = pool_indices
+                        approximation = None
+                    n_samples = min(n_samples, len(candidate_indices))
+                    
+                    # Query for the most informative samples (single pool scoring pass)
+                    selected_indices, predictions, uncertainties = await self._run_blocking(
+                        self._query_pool, candidate_indices, n_samples
+                    )
+                
+                self.experiment_state = "initialized"
+            
+            # Drop rows that were labeled while the query was running
+            still_unlabeled = self.unlabeled_pool.mask[selected_indices]
+            selected_indices = selected_indices[still_unlabeled]
+            if len(uncertainties) == len(still_unlabeled):
+                predictions = predictions[still_unlabeled]
+                uncertainties = uncertainties[still_unlabeled]
+            
+            if len(selected_indices) == 0:
+                return {
+                    "status": "error",
+                    "error": "Query strategy returned no samples"
+                }
+            
+            query_timestamp = datetime.now().isoformat()
+            remaining_unlabeled = len(self.unlabeled_pool) - len(selected_indices)
+            
+            samples = []
+            for rank, original_index in enumerate(selected_indices.tolist()):
+                features = self.current_framework.X_unlabeled[original_index]
+                
+                samples.append({
+                    "sample_id": f"sample_{original_index}",
+                    "sample_index": original_index,
+                    "features": self._format_features(features),
+                    "uncertainty_score": float(uncertainties[rank]) if len(uncertainties) > rank else 0.0,
+                    "predicted_label": int(predictions[rank]) if len(predictions) > rank else 0,
+                    "metadata": {
+                        "experiment_id": self.experiment_id,
+                        "query_timestamp": query_timestamp,
+                        "query_rank": rank,
+                        "remaining_unlabeled": remaining_unlabeled
+                    }
+                })
+                if approximation:
+                    samples[-1]["metadata"]["approximation"] = approximation
+            
+            # Store current sample for labeling
+            self.current_sample_index = samples[0]["sample_index"]
+            
+            result = {
+                "status": "success",
+                "samples": samples,
+                "count": len(samples)
+            }
+            if approximation:
+                result["approximation"] = approximation
+            return result
+        
+        except Exception as e:
+            logger.error(f"Failed to get next samples: {str(e)}")
+            self.experiment_state = "error"
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    def _query_pool(self, candidate_indices: np.ndarray, n_samples: int):
+        """
+        Select samples from the pool and predict them (runs in the worker pool).
+        
+        Args:
+            candidate_indices: Unlabeled pool rows to choose from
+            n_samples: Number of samples to select
+        
+        Returns:
+            Tuple of (selected pool indices in the strategy's order,
+            predictions, scores)
+        """
+        selected_positions = self.current_framework.query_samples(
+            self.current_framework.X_unlabeled, n_samples=n_samples, candidate_indices=candidate_indices
+        )
+        
+        if not selected_positions:
+            return np.array([], dtype=np.intp), np.array([]), np.array([])
+        
+        # Map back to original indices
+        selected_indices = candidate_indices[selected_positions]
+        
+        # Get predictions and uncertainties from the cached pool scores
+        predictions, uncertainties = self.current_framework.predict_pool(selected_indices)
+        
+        # Report the query strategy's own scores where it provides them
+        query_scores = self.current_framework.query_scores
+        if query_scores is not None and len(query_scores) == len(selected_indices):
+            uncertainties = np.asarray(query_scores, dtype=np.float64)
+        
+        return selected_indices, predictions, uncertainties
+    
+    def _format_features(self, features: np.ndarray) -> Dict[str, float]:
+        """
+        Format feature array as a dictionary.
+        
+        Sparse rows only list their non-zero features.
+        
+        Args:
+            features: Feature array, or sparse matrix holding one row
+        
+        Returns:
+            Dictionary of feature names to values
+        """
+        if is_sparse(features):
+            return {f"feature_{i}": value for i, value in nonzero_entries(features)}
+        
+        # For wine dataset, use known feature names
+        wine_feature_names = [
+            'alcohol', 'malic_acid', 'ash', 'alcalinity_of_ash', 'magnesium',
+            'total_phenols', 'flavanoids', 'nonflavanoid_phenols', 'proanthocyanins',
+            'color_intensity', 'hue', 'od280/od315_of_diluted_wines', 'proline'
+        ]
+        
+        if len(features) == len(wine_feature_names):
+            return {name: float(value) for name, value in zip(wine_feature_names, features)}
+        else:
+            return {f"feature_{i}": float(value) for i, value in enumerate(features)}
+    
+    async def submit_label(self, sample_id: str, label: int) -> Dict[str, Any]:
+        """
+        Submit a label for a sample and update the model.
+        
+        Args:
+            sample_id: ID of the sample being labeled
+            label: Label assigned to the sample
+        
+        Returns:
+            Update result
+        """
+        try:
+            if not self.current_framework:
+                raise ValueError("No experiment initialized")
+            
+            # Extract sample index from sample_id
+            sample_index = int(sample_id.split("_")[-1])
+            
+            if sample_index not in self.unlabeled_pool:
+                raise ValueError(f"Sample {sample_id} is not in unlabeled pool")
+            
+            if self.retrain_scheduler and not self.retrain_scheduler.policy.is_immediate:
+                return self._queue_label(sample_id, sample_index, label)
+            
+            async with self.experiment_lock:
+                if sample_index not in self.unlabeled_pool:
+                    raise ValueError(f"Sample {sample_id} was labeled concurrently")
+                
+                self.experiment_state = "training"
+                
+                # Journal first, so the label survives a crash during the update
+                if self.journal:
+                    self.journal.append(sample_index, label)
+                
+                # Get sample features
+                X_new = self.current_framework.X_unlabeled[sample_index:sample_index+1]
+                y_new = np.array([label])
+                
+                # Update model with new label and get updated metrics
+                try:
+                    update_result, metrics = await self._run_blocking(self._update_model, X_new, y_new)
+                except Exception as e:
+                    update_result = {"status": "error", "error": str(e)}
+                
+                if update_result.get("status") != "success":
+                    # Like a rejected micro-batch label, the sample stays unlabeled
+                    if self.journal:
+                        self.journal.append_rejection(sample_index)
+                    self.experiment_state = "initialized"
+                    return {
+                        "status": "error",
+                        "sample_id": sample_id,
+                        "label": label,
+                        "error": update_result.get("error"),
+                        "update_result": update_result
+                    }
+                
+                # Update indices
+                self.unlabeled_pool.remove(sample_index)
+                self.labeled_indices.append(sample_index)
+                
+                self.experiment_state = "initialized"
+            
+            return {
+                "status": "success",
+                "sample_id": sample_id,
+                "label": label,
+                "update_result": update_result,
+                "metrics": metrics,
+                "model_version": self.current_framework.model_version,
+                "remaining_unlabeled": len(self.unlabeled_pool),
+                "total_labeled": len(self.labeled_indices)
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to submit label: {str(e)}")
+            self.experiment_state = "error"
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    def _queue_label(self, sample_id: str, sample_index: int, label: int) -> Dict[str, Any]:
+        """
+        Buffer a label for the next micro-batch model update.
+        
+        The sample leaves the unlabeled pool immediately so it is not queried
+        again; the model is updated later by the retrain scheduler.
+        
+        Args:
+            sample_id: ID of the sample being labeled
+            sample_index: Pool index of the sample
+            label: Label assigned to the sample
+        
+        Returns:
+            Queueing result with an estimate of the model version the label
+            will land in
+        """
+        if self.journal:
+            self.journal.append(sample_index, label)
+        self.unlabeled_pool.remove(sample_index)
+        self.labeled_indices.append(sample_index)
+        
+        model_version = self.current_framework.model_version
+        pending_labels = self.retrain_scheduler.add(sample_index, label)
+        
+        return {
+            "status": "success",
+            "sample_id": sample_id,
+            "label": label,
+            "queued": True,
+            "pending_labels": pending_labels,
+            "model_version": model_version,
+            "estimated_model_version": self.retrain_scheduler.estimated_model_version(model_version),
+            "metrics": self.last_metrics,
+            "remaining_unlabeled": len(self.unlabeled_pool),
+            "total_labeled": len(self.labeled_indices)
+        }
+    
+    async def _apply_label_batch(self, sample_indices: List[int], labels: List[int]) -> Dict[str, Any]:
+        """
+        Apply a micro-batch of buffered labels to the model.
+        
+        Args:
+            sample_indices: Pool indices of the labeled samples
+            labels: Labels in the same order
+        
+        Returns:
+            Model update result
+        """
+        async with self.experiment_lock:
+            X_new = self.current_framework.X_unlabeled[sample_indices]
+            y_new = np.asarray(labels)
+            
+            update_result, _ = await self._run_blocking(self._update_model, X_new, y_new)
+        
+        logger.info(f"Applied micro-batch of {len(labels)} labels, model version {self.current_framework.model_version}")
+        return update_result
+    
+    def _return_rejected(self, sample_indices: List[int], labels: List[int], error: str) -> None:
+        """
+        Put samples whose labels were rejected back into the unlabeled pool.
+        
+        They can then be queried and labeled again.
+        
+        Args:
+            sample_indices: Pool indices of the rejected labels
+            labels: Rejected labels
+            error: Why the labels were rejected
+        """
+        for sample_index in sample_indices:
+            # Journaled, so recovery does not replay the rejected label
+            if self.journal:
+                self.journal.append_rejection(sample_index)
+            if sample_index not in self.unlabeled_pool:
+                self.unlabeled_pool.add(sample_index)
+            if sample_index in self.labeled_indices:
+                self.labeled_indices.remove(sample_index)
+        logger.warning(f"Returned {len(sample_indices)} samples with rejected labels to the pool of "
+                       f"experiment {self.experiment_id}: {error}")
+    
+    def _update_model(self, X_new: np.ndarray, y_new: np.ndarray):
+        """
+        Update the model and compute metrics (runs in the worker pool).
+        
+        Args:
+            X_new: New training features
+            y_new: New training labels
+        
+        Returns:
+            Tuple of (update result, metrics dict)
+        """
+        update_result = self.current_framework.update_model(X_new, y_new)
+        metrics = self.current_framework.get_metrics().__dict__
+        self.last_metrics = metrics
+        
+        return update_result, metrics
+    
+    async def flush_labels(self) -> Dict[str, Any]:
+        """
+        Apply all buffered labels to the model now.
+        
+        Returns:
+            Flush result
+        """
+        try:
+            if not self.current_framework:
+                raise ValueError("No experiment initialized")
+            
+            update_result = await self.retrain_scheduler.flush(retry_all=True) if self.retrain_scheduler else None
+            
+            return {
+                "status": "success" if update_result is None else update_result.get("status", "error"),
+                "update_result": update_result,
+                "model_version": self.current_framework.model_version
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to flush labels: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get current model performance metrics.
+        
+        Returns:
+            Current metrics
+        """
+        try:
+            if not self.current_framework:
+                raise ValueError("No experiment initialized")
+            
+            async with self.experiment_lock:
+                metrics = await self._run_blocking(self.current_framework.get_metrics)
+            
+            return {
+                "status": "success",
+                "metrics": metrics.__dict__,
+                "experiment_info": {
+                    "experiment_id": self.experiment_id,
+                    "state": self.experiment_state,
+                    "labeled_samples": len(self.labeled_indices),
+                    "unlabeled_samples": len(self.unlabeled_pool),
+                    "model_version": self.current_framework.model_version
+                }
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to get metrics: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        Get experiment status and configuration.
+        
+        Returns:
+            Experiment status
+        """
+        try:
+            status = {
+                "status": "success",
+                "engine_state": self.experiment_state,
+                "experiment_id": self.experiment_id,
+                "experiment_config": self.experiment_config,
+                "created_at": self.created_at,
+                "available_plugins": registry.list_available()
+            }
+            
+            if self.current_framework:
+                framework_state = self.current_framework.get_state()
+                status["framework_state"] = framework_state
+                
+                if self.experiment_state in ["initialized", "training", "querying"]:
+                    status["experiment_info"] = {
+                        "labeled_samples": len(self.labeled_indices),
+                        "unlabeled_samples": len(self.unlabeled_pool),
+                        "total_samples": len(self.labeled_indices) + len(self.unlabeled_pool),
+                        "model_version": self.current_framework.model_version
+                    }
+                
+                if self.retrain_scheduler:
+                    status["retraining"] = self.retrain_scheduler.get_stats()
+                if self.journal:
+                    status["journal"] = self.journal.get_stats()
+            
+            return status
+        
+        except Exception as e:
+            logger.error(f"Failed to get status: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get a short summary of the experiment for listings.
+        
+        Returns:
+            Experiment summary
+        """
+        return {
+            "experiment_id": self.experiment_id,
+            "state": self.experiment_state,
+            "created_at": self.created_at,
+            "labeled_samples": len(self.labeled_indices),
+            "unlabeled_samples": len(self.unlabeled_pool),
+            "model_version": self.current_framework.model_version if self.current_framework else 0
+        }
+    
+    async def save_snapshot(self, directory: str) -> Dict[str, Any]:
+        """
+        Write a binary snapshot of the experiment.
+        
+        Buffered labels are applied first; labels queued while the snapshot
+        is written are stored with it and requeued on restore.
+        
+        Args:
+            directory: Snapshot directory (replaced atomically)
+        
+        Returns:
+            Snapshot result
+        """
+        try:
+            if not self.current_framework:
+                raise ValueError("No experiment initialized")
+            
+            started = time.perf_counter()
+            if self.retrain_scheduler:
+                await self.retrain_scheduler.flush()
+            
+            async with self.experiment_lock:
+                # Copy on the event loop, where queued labels are added
+                labeled_indices = np.asarray(self.labeled_indices, dtype=np.intp)
+                pending_indices = self.retrain_scheduler.queued_indices if self.retrain_scheduler else []
+                pending_labels = self.retrain_scheduler.queued_labels if self.retrain_scheduler else []
+                manifest = {
+                    "experiment_id": self.experiment_id,
+                    "experiment_config": self.experiment_config,
+                    "framework": self.experiment_config.get("al_framework", {}).get("type", "sklearn"),
+                    "created_at": self.created_at,
+                    "current_sample_index": self.current_sample_index,
+                    "last_metrics": self.last_metrics,
+                    "pending_indices": pending_indices,
+                    "pending_labels": pending_labels,
+                    "journal_seq": self.journal.last_seq if self.journal else 0,
+                    "snapshot_at": datetime.now().isoformat()
+                }
+                
+                await self._run_blocking(self._write_snapshot, directory, manifest, labeled_indices)
+            
+            # Labels up to the snapshot no longer need to be replayed
+            if self.journal:
+                await self._run_blocking(self.journal.compact, manifest["journal_seq"])
+            
+            return {
+                "status": "success",
+                "experiment_id": self.experiment_id,
+                "path": directory,
+                "model_version": self.current_framework.model_version,
+                "labeled_samples": len(labeled_indices),
+                "pending_labels": len(pending_indices),
+                "duration_seconds": time.perf_counter() - started
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to snapshot experiment {self.experiment_id}: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    def _write_snapshot(self, directory: str, manifest: Dict[str, Any], labeled_indices: np.ndarray) -> None:
+        """Write session state and the framework snapshot (runs in the worker pool)."""
+        with atomic_directory(directory) as tmp_directory:
+            self.current_framework.save_snapshot(os.path.join(tmp_directory, "framework"))
+            save_array(tmp_directory, "labeled_indices", labeled_indices)
+            save_manifest(tmp_directory, manifest)
+        
+        # Point the framework state at the final location, not the temporary one
+        self.current_framework.snapshot_path = os.path.join(directory, "framework")
+    
+    async def load_snapshot(self, directory: str) -> Dict[str, Any]:
+        """
+        Restore the experiment from a snapshot written by save_snapshot.
+        
+        Args:
+            directory: Snapshot directory
+        
+        Returns:
+            Restore result
+        """
+        try:
+            started = time.perf_counter()
+            manifest = load_manifest(directory)
+            config = manifest["experiment_config"]
+            
+            self.retrain_scheduler = RetrainScheduler(
+                RetrainPolicy.from_config(config.get("update_strategy")), self._apply_label_batch,
+                self._return_rejected
+            )
+            self.candidate_sampler = CandidateSampler.from_config(config.get("candidate_sampling"))
+            
+            async with self.experiment_lock:
+                self.experiment_config = config
+                self.created_at = manifest["created_at"]
+                self.current_framework = registry.get_framework(manifest["framework"])
+                await self._run_blocking(self.current_framework.load_snapshot, os.path.join(directory, "framework"))
+                
+                self.unlabeled_pool = UnlabeledPool(self.current_framework.X_unlabeled.shape[0])
+                self.labeled_indices = load_array(directory, "labeled_indices").tolist()
+                # Removing in labeling order reproduces the pool's index layout
+                for index in self.labeled_indices:
+                    self.unlabeled_pool.remove(index)
+                
+                self.current_sample_index = manifest["current_sample_index"]
+                self.last_metrics = manifest["last_metrics"]
+                self.experiment_state = "initialized"
+            
+            for index, label in zip(manifest["pending_indices"], manifest["pending_labels"]):
+                self.retrain_scheduler.add(index, label)
+            
+            logger.info(f"Experiment {self.experiment_id} restored from {directory}")
+            return {
+                "status": "success",
+                "experiment_id": self.experiment_id,
+                "path": directory,
+                "model_version": self.current_framework.model_version,
+                "labeled_samples": len(self.labeled_indices),
+                "unlabeled_samples": len(self.unlabeled_pool),
+                "pending_labels": len(manifest["pending_indices"]),
+                "duration_seconds": time.perf_counter() - started
+            }
+        
+        except Exception as e:
+            logger.error(f"Failed to restore experiment {self.experiment_id}: {str(e)}")
+            self.experiment_state = "error"
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def recover(self, snapshot_directory: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Recover the experiment after a restart or crash.
+        
+        Restores the snapshot if it belongs to the journal's experiment run,
+        otherwise re-initializes from the config in the journal header, then
+        replays the journaled labels newer than that state as one model update.
+        
+        Args:
+            snapshot_directory: Snapshot directory, if any
+        
+        Returns:
+            Recovery result
+        """
+        try:
+            header, records = await self._run_blocking(self.journal.open) if self.journal else (None, [])
+            
+            snapshot_manifest = None
+            if snapshot_directory and os.path.isfile(os.path.join(snapshot_directory, MANIFEST_NAME)):
+                snapshot_manifest = load_manifest(snapshot_directory)
+            
+            if snapshot_manifest and (header is None or header["created_at"] == snapshot_manifest["created_at"]):
+                result = await self.load_snapshot(snapshot_directory)
+                replay_after = snapshot_manifest.get("journal_seq", 0)
+                if result["status"] == "success" and self.journal and header is None:
+                    await self._run_blocking(self.journal.reset, self.experiment_id, self.experiment_config, self.created_at)
+            elif header is not None:
+                # The journal belongs to a newer run than the snapshot (or there is none)
+                self.created_at = header["created_at"]
+                result = await self.initialize(header["config"], resume_journal=True)
+                replay_after = 0
+            else:
+                raise ValueError(f"No snapshot or journal to recover experiment {self.experiment_id} from")
+            
+            if result["status"] != "success":
+                return result
+            
+            result["replayed_labels"] = await self._replay_labels(
+                [record for record in records if record["seq"] > replay_after]
+            )
+            result["labeled_samples"] = len(self.labeled_indices)
+            result["model_version"] = self.current_framework.model_version
+            return result
+        
+        except Exception as e:
+            logger.error(f"Failed to recover experiment {self.experiment_id}: {str(e)}")
+            self.experiment_state = "error"
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def _replay_labels(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Apply journaled labels with a single model update.
+        
+        Only the last label of each sample counts, and a rejection record
+        drops the label before it. Labels that cannot be applied are isolated, retried or rejected by
+        the retrain scheduler, like a failed micro-batch.
+        
+        Args:
+            records: Journal label and rejection records in sequence order
+        
+        Returns:
+            Number of labels applied
+        """
+        last_labels: Dict[int, int] = {}
+        for record in records:
+            # Popping first keeps the samples in the order of their last label
+            last_labels.pop(record["sample_index"], None)
+            if record["type"] == "label":
+                last_labels[record["sample_index"]] = record["label"]
+        
+        sample_indices, labels = [], []
+        for sample_index, label in last_labels.items():
+            if sample_index in self.unlabeled_pool:
+                self.unlabeled_pool.remove(sample_index)
+                self.labeled_indices.append(sample_index)
+                sample_indices.append(sample_index)
+                labels.append(label)
+        
+        if not sample_indices:
+            return 0
+        
+        await self.retrain_scheduler.apply(sample_indices, labels)
+        if self.retrain_scheduler.retry_batches:
+            self.retrain_scheduler.start()
+        
+        logger.info(f"Replayed {len(labels)} journaled labels for experiment {self.experiment_id}")
+        return len(labels)
+    
+    async def close_journal(self, delete: bool = False) -> None:
+        """
+        Commit and close the label journal.
+        
+        Args:
+            delete: Remove the journal file (the experiment is discarded)
+        """
+        if self.journal:
+            await self._run_blocking(self.journal.close, delete)
+    
+    async def stop(self, flush: bool = False) -> None:
+        """
+        Stop background retraining for this experiment.
+        
+        Args:
+            flush: Apply buffered labels before stopping
+        """
+        if self.retrain_scheduler:
+            await self.retrain_scheduler.stop(flush=flush)
\ No newline at end of file
@@ -0,0 +1,369 @@
+"""
+Retrain Scheduler for AL Engine
+
+Buffers submitted labels and applies them to the model in micro-batches
+from a background task, according to a configurable retrain policy.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Seconds before the first retry of a failed batch; doubles per attempt
+RETRY_BACKOFF_SECONDS = 1.0
+
+# Rejected labels kept for get_stats()
+MAX_REPORTED_REJECTIONS = 50
+
+@dataclass
+class RetrainPolicy:
+    """
+    When buffered labels are applied to the model.
+    
+    With type "immediate" every label retrains the model synchronously.
+    With type "micro_batch" labels are buffered and flushed as soon as any
+    configured trigger fires:
+        - batch_size: N labels are buffered
+        - interval_seconds: the oldest buffered label is T seconds old
+        - idle_seconds: no new label arrived for T seconds
+    
+    A batch that fails with a transient error is retried separately from
+    labels arriving later, up to max_retries times, then rejected.
+    """
+    type: str = "immediate"
+    batch_size: Optional[int] = None
+    interval_seconds: Optional[float] = None
+    idle_seconds: Optional[float] = None
+    max_retries: int = 3
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "RetrainPolicy":
+        """
+        Build a retrain policy from the experiment's update_strategy config.
+        
+        Args:
+            config: Update strategy configuration
+        
+        Returns:
+            RetrainPolicy instance
+        """
+        config = config or {}
+        if isinstance(config, str):
+            config = {"type": config}
+        
+        policy_type = config.get("type", "immediate")
+        if policy_type not in ("immediate", "micro_batch"):
+            raise ValueError(f"Unknown update strategy '{policy_type}'. Available: ['immediate', 'micro_batch']")
+        
+        policy = cls(
+            type=policy_type,
+            batch_size=config.get("batch_size"),
+            interval_seconds=config.get("interval_seconds"),
+            idle_seconds=config.get("idle_seconds"),
+            max_retries=config.get("max_retries", 3)
+        )
+        
+        # A micro-batch policy without any trigger flushes every 10 labels
+        if policy.type == "micro_batch" and not any(
+            [policy.batch_size, policy.interval_seconds, policy.idle_seconds]
+        ):
+            policy.batch_size = 10
+        
+        return policy
+    
+    @property
+    def is_immediate(self) -> bool:
+        """Whether labels are applied synchronously one by one."""
+        return self.type == "immediate"
+
+class RetrainScheduler:
+    """
+    Background micro-batch retraining.
+    
+    Labels are buffered with add(); a background task applies the buffer
+    through the apply_batch callback whenever the policy says it is due.
+    
+    A failed batch never holds back labels that arrive later:
+        - Deterministic failures (the callback reports "retryable": False or
+          raises ValueError, e.g. a label of an unknown class) are narrowed
+          down by applying the batch's labels one by one; the labels that
+          still fail are rejected.
+        - Other failures are retried as a separate batch with exponential
+          backoff and rejected after policy.max_retries attempts.
+    Rejected labels are reported through get_stats() and the on_rejected
+    callback.
+    """
+    
+    def __init__(self, policy: RetrainPolicy,
+                 apply_batch: Callable[[List[int], List[int]], Awaitable[Dict[str, Any]]],
+                 on_rejected: Optional[Callable[[List[int], List[int], str], None]] = None):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            policy: Retrain policy
+            apply_batch: Async callback applying (sample_indices, labels) to the model
+            on_rejected: Optional callback receiving (sample_indices, labels, error)
+                of labels that will not be applied
+        """
+        self.policy = policy
+        self.apply_batch = apply_batch
+        self.on_rejected = on_rejected
+        self.pending_indices: List[int] = []
+        self.pending_labels: List[int] = []
+        self.retry_batches: List[Dict[str, Any]] = []
+        self.rejected: List[Dict[str, Any]] = []
+        self.flush_in_progress = False
+        self.batches_applied = 0
+        self.labels_applied = 0
+        self.labels_rejected = 0
+        self.last_flush_result: Optional[Dict[str, Any]] = None
+        
+        self._first_pending_at: Optional[float] = None
+        self._last_label_at: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+    
+    @property
+    def queued_indices(self) -> List[int]:
+        """Pool indices of all labels not yet applied (retries first)."""
+        return [index for batch in self.retry_batches for index in batch["indices"]] + self.pending_indices
+    
+    @property
+    def queued_labels(self) -> List[int]:
+        """Labels in the same order as queued_indices."""
+        return [label for batch in self.retry_batches for label in batch["labels"]] + self.pending_labels
+    
+    def add(self, sample_index: int, label: int) -> int:
+        """
+        Buffer a label for the next micro-batch.
+        
+        Args:
+            sample_index: Pool index of the labeled sample
+            label: Assigned label
+        
+        Returns:
+            Number of buffered labels
+        """
+        now = time.monotonic()
+        if not self.pending_indices:
+            self._first_pending_at = now
+        self._last_label_at = now
+        
+        self.pending_indices.append(sample_index)
+        self.pending_labels.append(label)
+        
+        self.start()
+        self._wakeup.set()
+        return len(self.pending_indices)
+    
+    def is_due(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether buffered labels or a failed batch should be applied now.
+        
+        Args:
+            now: Monotonic timestamp (defaults to the current time)
+        
+        Returns:
+            True if any policy trigger fired or a retry is due
+        """
+        return self._seconds_until_due(now) == 0.0
+    
+    def _seconds_until_due(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next trigger or retry, or None if nothing is queued."""
+        now = time.monotonic() if now is None else now
+        waits = [batch["retry_at"] - now for batch in self.retry_batches]
+        
+        if self.pending_indices:
+            if self.policy.batch_size and len(self.pending_indices) >= self.policy.batch_size:
+                waits.append(0.0)
+            if self.policy.interval_seconds is not None:
+                waits.append(self._first_pending_at + self.policy.interval_seconds - now)
+            if self.policy.idle_seconds is not None:
+                waits.append(self._last_label_at + self.policy.idle_seconds - now)
+        
+        if not waits:
+            return None
+        return max(0.0, min(waits))
+    
+    def estimated_model_version(self, current_version: int) -> int:
+        """
+        Estimate the model version that the currently buffered labels will land in.
+        
+        This assumes the next flush applies them in one update. A batch
+        that fails is applied label by label (one version per label) or
+        retried after later updates, so the label then lands in a later
+        version, or in none if it is rejected.
+        
+        Args:
+            current_version: Version of the model currently serving queries
+        
+        Returns:
+            Model version after the next flush, if it succeeds
+        """
+        return current_version + (2 if self.flush_in_progress else 1)
+    
+    async def _call(self, indices: List[int], labels: List[int]) -> Dict[str, Any]:
+        """Run the apply_batch callback, turning exceptions into error results."""
+        try:
+            return await self.apply_batch(indices, labels)
+        except ValueError as e:
+            return {"status": "error", "error": str(e), "retryable": False}
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+    
+    def _reject(self, indices: List[int], labels: List[int], error: str) -> None:
+        """Give up on labels and report them."""
+        logger.error(f"Rejecting {len(indices)} labels that cannot be applied: {error}")
+        self.labels_rejected += len(indices)
+        self.rejected.extend(
+            {"sample_index": index, "label": label, "error": error} for index, label in zip(indices, labels)
+        )
+        del self.rejected[:-MAX_REPORTED_REJECTIONS]
+        if self.on_rejected:
+            self.on_rejected(indices, labels, error)
+    
+    async def apply(self, indices: List[int], labels: List[int], attempts: int = 0) -> Dict[str, Any]:
+        """
+        Apply a batch of labels now, isolating, retrying or rejecting on failure.
+        
+        Args:
+            indices: Pool indices of the labeled samples
+            labels: Labels in the same order
+            attempts: Failed attempts of this batch so far
+        
+        Returns:
+            Result of the apply_batch callback; for a batch applied label by
+            label, a summary with labels_applied and labels_rejected
+        """
+        result = await self._call(indices, labels)
+        
+        if result.get("status") == "success":
+            self.batches_applied += 1
+            self.labels_applied += len(indices)
+            return result
+        
+        if not result.get("retryable", True):
+            if len(indices) == 1:
+                self._reject(indices, labels, result.get("error"))
+                return result
+            
+            # One bad label fails the whole batch; apply the labels one by one
+            logger.warning(f"Micro-batch of {len(indices)} labels failed, applying labels individually: {result.get('error')}")
+            applied_before, rejected_before = self.labels_applied, self.labels_rejected
+            for index, label in zip(indices, labels):
+                await self.apply([index], [label], attempts)
+            labels_applied = self.labels_applied - applied_before
+            return {
+                "status": "success" if labels_applied else "error",
+                "labels_applied": labels_applied,
+                "labels_rejected": self.labels_rejected - rejected_before,
+                "error": result.get("error")
+            }
+        
+        attempts += 1
+        if attempts >= self.policy.max_retries:
+            self._reject(indices, labels, f"Failed after {attempts} attempts: {result.get('error')}")
+        else:
+            delay = RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+            logger.error(f"Micro-batch update failed, retrying {len(indices)} labels in {delay:.0f}s: {result.get('error')}")
+            self.retry_batches.append({
+                "indices": indices, "labels": labels,
+                "attempts": attempts, "retry_at": time.monotonic() + delay
+            })
+        return result
+    
+    async def flush(self, retry_all: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Apply all buffered labels as one batch, then any failed batch due for a retry.
+        
+        Args:
+            retry_all: Retry failed batches now even if their backoff has not passed
+        
+        Returns:
+            Result of the last batch applied, or None if nothing was applied
+        """
+        now = time.monotonic()
+        retries = [batch for batch in self.retry_batches if retry_all or batch["retry_at"] <= now]
+        if not self.pending_indices and not retries:
+            return None
+        
+        self.retry_batches = [batch for batch in self.retry_batches if not (retry_all or batch["retry_at"] <= now)]
+        result = None
+        
+        self.flush_in_progress = True
+        try:
+            if self.pending_indices:
+                indices, labels = self.pending_indices, self.pending_labels
+                self.pending_indices, self.pending_labels = [], []
+                self._first_pending_at = None
+                result = await self.apply(indices, labels)
+            
+            for batch in retries:
+                result = await self.apply(batch["indices"], batch["labels"], batch["attempts"])
+        finally:
+            self.flush_in_progress = False
+        
+        self.last_flush_result = result
+        return result
+    
+    def start(self) -> None:
+        """Start the background flush task if it is not running."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self, flush: bool = False) -> None:
+        """
+        Stop the background task, letting an in-flight batch finish.
+        
+        Args:
+            flush: Apply buffered labels and retry failed batches before returning
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        
+        if flush:
+            await self.flush(retry_all=True)
+    
+    async def _run(self) -> None:
+        """Wait for policy triggers and retries, and flush."""
+        while not self._stopping:
+            timeout = self._seconds_until_due()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            
+            if self._stopping:
+                break
+            
+            if self.is_due():
+                await self.flush()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+        
+        Returns:
+            Dict with policy, pending, retrying, applied and rejected label counts
+        """
+        return {
+            "policy": self.policy.__dict__,
+            "pending_labels": len(self.pending_indices),
+            "retrying_labels": sum(len(batch["indices"]) for batch in self.retry_batches),
+            "flush_in_progress": self.flush_in_progress,
+            "batches_applied": self.batches_applied,
+            "labels_applied": self.labels_applied,
+            "labels_rejected": self.labels_rejected,
+            "rejected": list(self.rejected)
+        }
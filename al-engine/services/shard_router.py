@@ -0,0 +1,384 @@
+"""
+Shard Router for AL Engine
+
+Spreads experiments over several worker processes. Each shard process runs
+its own ALEngineService (and thus its own worker pool and interpreter lock);
+experiments are assigned to shards by a stable hash of their id, so all
+requests for one experiment land on the same process.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import threading
+import zlib
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+import logging
+
+from plugin_registry import registry
+from services.al_engine_service import ALEngineService
+from utils.snapshot_io import list_snapshots
+from utils.label_journal import list_journals
+
+logger = logging.getLogger(__name__)
+
+def _run_shard(conn, max_workers: Optional[int]) -> None:
+    """
+    Shard process entry point.
+    
+    Receives (request_id, method, args, kwargs) messages on the pipe, runs them
+    concurrently against a local ALEngineService and sends back
+    (request_id, ok, result) replies. A None message stops the shard.
+    
+    Args:
+        conn: Child end of the shard pipe
+        max_workers: Worker pool size of the shard's engine
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    async def serve():
+        registry.auto_discover_plugins()
+        registry.warm_up_from_env()
+        service = ALEngineService(max_workers=max_workers)
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        
+        async def handle(request_id, method, args, kwargs):
+            try:
+                result = await getattr(service, method)(*args, **kwargs)
+                conn.send((request_id, True, result))
+            except Exception as e:
+                conn.send((request_id, False, f"{type(e).__name__}: {e}"))
+        
+        while True:
+            message = await loop.run_in_executor(None, conn.recv)
+            if message is None:
+                break
+            task = loop.create_task(handle(*message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await service.shutdown()
+    
+    try:
+        asyncio.run(serve())
+    finally:
+        conn.close()
+
+class _Shard:
+    """Parent-side handle of one shard process."""
+    
+    def __init__(self, index: int, max_workers: Optional[int]):
+        context = multiprocessing.get_context("spawn")
+        self.index = index
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_run_shard, args=(child_conn, max_workers),
+            name=f"al-engine-shard-{index}", daemon=True
+        )
+        self.pending: Dict[int, Future] = {}
+        self._request_ids = itertools.count()
+        self._send_lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Start the shard process and the reply reader thread."""
+        self.process.start()
+        self._reader = threading.Thread(target=self._read_replies, name=f"{self.process.name}-reader", daemon=True)
+        self._reader.start()
+    
+    def _read_replies(self) -> None:
+        """Resolve pending requests with replies from the shard process."""
+        while True:
+            try:
+                request_id, ok, result = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            
+            future = self.pending.pop(request_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(result)
+            else:
+                future.set_exception(RuntimeError(result))
+        
+        # Fail everything still waiting on a dead shard
+        for future in list(self.pending.values()):
+            future.set_exception(RuntimeError(f"Shard {self.index} stopped"))
+        self.pending.clear()
+    
+    async def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Run an ALEngineService method in the shard process.
+        
+        Args:
+            method: Service method name
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+        
+        Returns:
+            Method result
+        """
+        if not self.process.is_alive():
+            raise RuntimeError(f"Shard {self.index} stopped")
+        
+        request_id = next(self._request_ids)
+        future = Future()
+        self.pending[request_id] = future
+        try:
+            with self._send_lock:
+                self.conn.send((request_id, method, args, kwargs))
+        except (OSError, EOFError) as e:
+            # The shard died after the liveness check; no reply will come
+            self.pending.pop(request_id, None)
+            raise RuntimeError(f"Shard {self.index} stopped: {e}")
+        return await asyncio.wrap_future(future)
+    
+    def stop(self, timeout: float = 30.0) -> None:
+        """Ask the shard process to shut down and wait for it."""
+        if not self.process.is_alive():
+            return
+        try:
+            with self._send_lock:
+                self.conn.send(None)
+        except (OSError, EOFError):
+            # Died after the liveness check
+            return
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+
+class ShardedALEngineService:
+    """
+    AL Engine Service spreading experiments over worker processes.
+    
+    Exposes the same async API as ALEngineService. Every experiment lives in
+    exactly one shard process, picked by crc32(experiment_id) % n_shards, so
+    CPU-bound work of different experiments runs in parallel.
+    """
+    
+    def __init__(self, n_shards: int, max_workers: Optional[int] = None):
+        """
+        Initialize the sharded service.
+        
+        Args:
+            n_shards: Number of shard processes
+            max_workers: Worker pool size of each shard's engine
+        """
+        if n_shards < 1:
+            raise ValueError(f"n_shards must be at least 1, got {n_shards}")
+        
+        self.shards = [_Shard(index, max_workers) for index in range(n_shards)]
+        self.default_experiment_id: Optional[str] = None
+        # Experiment ids in initialization order, like ALEngineService.experiments
+        self.experiment_order: List[str] = []
+        self.started = False
+        
+        logger.info(f"Sharded AL Engine service initialized with {n_shards} shards")
+    
+    def start(self) -> None:
+        """Start all shard processes."""
+        if self.started:
+            return
+        for shard in self.shards:
+            shard.start()
+        self.started = True
+    
+    def _shard_for(self, experiment_id: Optional[str]) -> _Shard:
+        """
+        Find the shard owning an experiment.
+        
+        Args:
+            experiment_id: Experiment identifier (defaults to the latest experiment)
+        
+        Returns:
+            Shard handle
+        
+        Raises:
+            ValueError: If no experiment id is given and none was initialized
+        """
+        if experiment_id is None:
+            experiment_id = self.default_experiment_id
+            if experiment_id is None:
+                raise ValueError("No experiment initialized")
+        
+        return self.shards[zlib.crc32(experiment_id.encode("utf-8")) % len(self.shards)]
+    
+    def _set_default(self, experiment_id: str) -> None:
+        """Make an experiment the most recent one and the default."""
+        if experiment_id in self.experiment_order:
+            self.experiment_order.remove(experiment_id)
+        self.experiment_order.append(experiment_id)
+        self.default_experiment_id = experiment_id
+    
+    async def _call(self, experiment_id: Optional[str], method: str, *args, **kwargs) -> Dict[str, Any]:
+        """Forward a keyed call to the owning shard, reporting failures as error dicts."""
+        try:
+            if experiment_id is None:
+                experiment_id = self.default_experiment_id
+            shard = self._shard_for(experiment_id)
+            return await shard.call(method, *args, experiment_id=experiment_id, **kwargs)
+        except Exception as e:
+            logger.error(f"Shard call {method} failed: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def initialize_experiment(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Initialize a new AL experiment in its shard."""
+        try:
+            # The id decides the shard, so it must be fixed before routing
+            config = dict(config)
+            config["experiment_id"] = config.get("experiment_id") or f"exp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            
+            result = await self._shard_for(config["experiment_id"]).call("initialize_experiment", config)
+            if result.get("status") == "success":
+                self._set_default(config["experiment_id"])
+            return result
+        
+        except Exception as e:
+            logger.error(f"Experiment initialization failed: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
+    async def get_next_sample(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get the next most informative sample for labeling."""
+        return await self._call(experiment_id, "get_next_sample")
+    
+    async def get_next_samples(self, n_samples: int = 1, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get the k most informative samples for labeling in one query."""
+        return await self._call(experiment_id, "get_next_samples", n_samples)
+    
+    async def submit_label(self, sample_id: str, label: int, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Submit a label for a sample and update the model."""
+        return await self._call(experiment_id, "submit_label", sample_id, label)
+    
+    async def flush_labels(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Apply all buffered labels of an experiment to its model now."""
+        return await self._call(experiment_id, "flush_labels")
+    
+    async def get_metrics(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get current model performance metrics."""
+        return await self._call(experiment_id, "get_metrics")
+    
+    async def get_status(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get AL engine or experiment status and configuration."""
+        if experiment_id is not None:
+            return await self._call(experiment_id, "get_status")
+        
+        if self.default_experiment_id is None:
+            status = {
+                "status": "success",
+                "engine_state": "idle",
+                "experiment_id": None,
+                "experiment_config": None,
+                "available_plugins": registry.list_available()
+            }
+        else:
+            status = await self._call(None, "get_status")
+        
+        listing = await self.list_experiments()
+        status["experiments"] = [summary["experiment_id"] for summary in listing["experiments"]]
+        status["shards"] = len(self.shards)
+        return status
+    
+    async def list_experiments(self) -> Dict[str, Any]:
+        """List all experiments hosted by all shards."""
+        listings = await asyncio.gather(*(shard.call("list_experiments") for shard in self.shards))
+        
+        experiments: List[Dict[str, Any]] = []
+        for shard, listing in zip(self.shards, listings):
+            for summary in listing["experiments"]:
+                summary["shard"] = shard.index
+                experiments.append(summary)
+        
+        return {
+            "status": "success",
+            "experiments": experiments,
+            "default_experiment_id": self.default_experiment_id
+        }
+    
+    async def reset(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Reset one experiment, or every shard."""
+        if experiment_id is not None:
+            result = await self._call(experiment_id, "reset")
+            if result.get("status") == "success":
+                if experiment_id in self.experiment_order:
+                    self.experiment_order.remove(experiment_id)
+                # Fall back to the most recent remaining experiment, as ALEngineService does
+                if self.default_experiment_id == experiment_id:
+                    self.default_experiment_id = self.experiment_order[-1] if self.experiment_order else None
+            return result
+        
+        results = await asyncio.gather(*(shard.call("reset") for shard in self.shards), return_exceptions=True)
+        self.experiment_order = []
+        self.default_experiment_id = None
+        
+        errors = [str(r) if isinstance(r, Exception) else r.get("error") for r in results
+                  if isinstance(r, Exception) or r.get("status") != "success"]
+        if errors:
+            return {
+                "status": "error",
+                "error": "; ".join(errors)
+            }
+        return {
+            "status": "success",
+            "message": "AL engine reset successfully"
+        }
+    
+    async def snapshot(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Write a binary snapshot of an experiment."""
+        return await self._call(experiment_id, "snapshot")
+    
+    async def restore(self, experiment_id: str) -> Dict[str, Any]:
+        """Restore an experiment from its snapshot in its shard."""
+        result = await self._call(experiment_id, "restore")
+        if result.get("status") == "success":
+            self._set_default(experiment_id)
+        return result
+    
+    async def snapshot_all(self) -> Dict[str, Any]:
+        """Snapshot every experiment of every shard."""
+        results = await asyncio.gather(*(shard.call("snapshot_all") for shard in self.shards))
+        
+        snapshots: Dict[str, Any] = {}
+        for result in results:
+            snapshots.update(result["snapshots"])
+        return {
+            "status": "success" if all(r["status"] == "success" for r in results) else "error",
+            "snapshots": snapshots
+        }
+    
+    async def restore_all(self) -> Dict[str, Any]:
+        """Recover every experiment with a snapshot or journal, each in its own shard."""
+        snapshot_dir = os.getenv("AL_ENGINE_SNAPSHOT_DIR", "snapshots")
+        experiment_ids = sorted(set(list_snapshots(snapshot_dir)) | set(list_journals(snapshot_dir)))
+        results = await asyncio.gather(*(self._call(experiment_id, "restore") for experiment_id in experiment_ids))
+        
+        # Record restores in id order, not completion order, like ALEngineService.restore_all
+        for experiment_id, result in zip(experiment_ids, results):
+            if result.get("status") == "success":
+                self._set_default(experiment_id)
+        
+        restored = dict(zip(experiment_ids, results))
+        return {
+            "status": "success" if all(r["status"] == "success" for r in results) else "error",
+            "restored": restored
+        }
+    
+    async def shutdown(self) -> None:
+        """Flush buffered labels and stop all shard processes."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, shard.stop) for shard in self.shards))
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the AL engine tests.
+
+The engine imports its packages relative to the al-engine directory, so the
+tests put it on sys.path and discover plugins from there.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+ENGINE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ENGINE_DIR not in sys.path:
+    sys.path.insert(0, ENGINE_DIR)
+
+from plugin_registry import registry
+
+registry.auto_discover_plugins(os.path.join(ENGINE_DIR, "plugins"))
+
+@pytest.fixture
+def executor():
+    """Worker pool for experiment sessions."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
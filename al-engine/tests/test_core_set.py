@@ -0,0 +1,72 @@
+"""
+Tests for the core-set (k-center greedy) strategy.
+"""
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from plugins.strategies.core_set import CoreSetStrategy
+
+def make_pool(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(300, 5)), rng.normal(size=(8, 5))
+
+def brute_force_k_center(X_pool, X_labeled, n_samples, candidates):
+    """Reference k-center greedy with explicit distance matrices."""
+    centers = list(X_labeled)
+    selected = []
+    for _ in range(n_samples):
+        distances = np.linalg.norm(X_pool[candidates][:, None, :] - np.array(centers)[None, :, :], axis=2).min(axis=1)
+        distances[selected] = -np.inf
+        position = int(np.argmax(distances))
+        selected.append(position)
+        centers.append(X_pool[candidates[position]])
+    return selected
+
+@pytest.mark.parametrize("block_size", [1, 7, 8192])
+def test_matches_brute_force(block_size):
+    X_pool, X_labeled = make_pool()
+    strategy = CoreSetStrategy(block_size=block_size)
+    
+    selected = strategy.select_samples(None, X_pool, 10, X_labeled=X_labeled)
+    
+    assert selected == brute_force_k_center(X_pool, X_labeled, 10, np.arange(len(X_pool)))
+    distances = np.linalg.norm(X_pool[selected[0]] - X_labeled, axis=1).min()
+    assert strategy.selection_scores[0] == pytest.approx(distances)
+    assert np.all(np.diff(strategy.selection_scores) <= 1e-12)
+
+def test_candidate_positions_index_into_candidates():
+    X_pool, X_labeled = make_pool(1)
+    candidates = np.arange(0, 300, 3)
+    
+    selected = CoreSetStrategy(block_size=16).select_samples(
+        None, X_pool, 5, X_labeled=X_labeled, candidate_indices=candidates
+    )
+    
+    assert selected == brute_force_k_center(X_pool, X_labeled, 5, candidates)
+
+def test_incremental_labels_match_fresh_strategy():
+    X_pool, X_labeled = make_pool(2)
+    incremental = CoreSetStrategy(block_size=32)
+    incremental.select_samples(None, X_pool, 3, X_labeled=X_labeled[:4])
+    
+    selected = incremental.select_samples(None, X_pool, 6, X_labeled=X_labeled)
+    
+    assert incremental.get_strategy_info()["labeled_seen"] == 8
+    assert selected == CoreSetStrategy(block_size=32).select_samples(None, X_pool, 6, X_labeled=X_labeled)
+
+def test_sparse_pool_matches_dense():
+    X_pool, X_labeled = make_pool(3)
+    X_pool[np.abs(X_pool) < 0.8] = 0.0
+    
+    dense = CoreSetStrategy(block_size=50).select_samples(None, X_pool, 8, X_labeled=X_labeled)
+    strategy = CoreSetStrategy(block_size=50)
+    sparse = strategy.select_samples(None, sp.csr_matrix(X_pool), 8, X_labeled=sp.csr_matrix(X_labeled))
+    
+    assert sparse == dense
+    assert strategy.get_strategy_info()["pool_size"] == 300
+
+def test_requires_labeled_features():
+    with pytest.raises(ValueError):
+        CoreSetStrategy().select_samples(None, np.zeros((3, 2)), 1)
@@ -0,0 +1,100 @@
+"""
+Tests for the group-committed label journal.
+"""
+
+from utils.label_journal import LabelJournal, list_journals
+
+def write_labels(path, labels):
+    journal = LabelJournal(path)
+    journal.reset("e1", {"model": {"type": "random_forest"}}, "run-1")
+    for sample_index, label in labels:
+        journal.append(sample_index, label)
+    journal.close()
+    return journal
+
+def test_records_survive_reopen(tmp_path):
+    path = str(tmp_path / "e1.journal")
+    write_labels(path, [(3, 0), (7, 1)])
+    
+    journal = LabelJournal(path)
+    header, records = journal.open()
+    
+    assert header["experiment_id"] == "e1"
+    assert header["created_at"] == "run-1"
+    assert [(record["sample_index"], record["label"]) for record in records] == [(3, 0), (7, 1)]
+    assert journal.append(9, 2) == 3
+    journal.close()
+    
+    assert [record["seq"] for record in LabelJournal(path).read()[1]] == [1, 2, 3]
+
+def test_open_drops_torn_tail(tmp_path):
+    path = str(tmp_path / "e1.journal")
+    write_labels(path, [(3, 0), (7, 1)])
+    with open(path, "ab") as f:
+        f.write(b'{"type": "label", "seq": 3, "sampl')
+    
+    journal = LabelJournal(path)
+    _, records = journal.open()
+    
+    assert [record["seq"] for record in records] == [1, 2]
+    assert journal.last_seq == 2
+    
+    # Appends continue after the truncated tail
+    journal.append(9, 2)
+    journal.close()
+    _, records, valid_bytes = LabelJournal(path).read()
+    assert [record["sample_index"] for record in records] == [3, 7, 9]
+    assert valid_bytes == (tmp_path / "e1.journal").stat().st_size
+
+def test_compact_keeps_header_and_newer_records(tmp_path):
+    path = str(tmp_path / "e1.journal")
+    journal = LabelJournal(path)
+    journal.reset("e1", {}, "run-1")
+    for sample_index in range(5):
+        journal.append(sample_index, 0)
+    journal.append_rejection(4)
+    
+    journal.compact(3)
+    journal.append(8, 1)
+    journal.close()
+    
+    header, records, _ = LabelJournal(path).read()
+    assert header["created_at"] == "run-1"
+    assert [(record["type"], record["seq"]) for record in records] == [
+        ("label", 4), ("label", 5), ("reject", 6), ("label", 7)
+    ]
+
+def test_reset_discards_old_records(tmp_path):
+    path = str(tmp_path / "e1.journal")
+    write_labels(path, [(3, 0)])
+    
+    journal = LabelJournal(path)
+    journal.reset("e1", {}, "run-2")
+    journal.close(delete=False)
+    
+    header, records, _ = journal.read()
+    assert header["created_at"] == "run-2"
+    assert records == []
+    assert journal.last_seq == 0
+
+def test_sync_waits_for_group_commit(tmp_path):
+    path = str(tmp_path / "e1.journal")
+    journal = LabelJournal(path)
+    journal.reset("e1", {}, "run-1")
+    for sample_index in range(20):
+        journal.append(sample_index, 1)
+    
+    assert journal.sync() == 20
+    assert len(journal.read()[1]) == 20
+    assert journal.commits <= 20
+    journal.close(delete=True)
+    
+    assert list_journals(str(tmp_path)) == []
+
+def test_list_journals(tmp_path):
+    write_labels(str(tmp_path / "b.journal"), [])
+    write_labels(str(tmp_path / "a.journal"), [])
+    (tmp_path / "a").mkdir()
+    
+    assert list_journals(str(tmp_path)) == ["a", "b"]
+    assert list_journals(str(tmp_path / "missing")) == []
@@ -0,0 +1,96 @@
+"""
+Tests for the query-by-committee strategy.
+"""
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+
+from plugin_registry import registry
+from plugins.strategies.query_by_committee import (
+    DEFAULT_COMMITTEE, QueryByCommitteeStrategy, kl_to_consensus, vote_entropy
+)
+from utils.uncertainty import entropy
+
+@pytest.fixture
+def data():
+    X, y = make_classification(n_samples=260, n_features=6, n_informative=4, n_classes=3, random_state=0)
+    return X[:60], y[:60], X[60:]
+
+def reference_scores(X_labeled, y_labeled, X_pool, disagreement):
+    """Fit the default committee one member at a time and score disagreement."""
+    classes = np.unique(y_labeled)
+    stacked = []
+    for member in DEFAULT_COMMITTEE:
+        model = registry.get_model(member["type"], **member["parameters"]).fit(X_labeled, y_labeled)
+        probabilities = np.zeros((X_pool.shape[0], len(classes)))
+        probabilities[:, np.searchsorted(classes, model.classes_)] = model.predict_proba(X_pool)
+        stacked.append(probabilities)
+    return disagreement(np.stack(stacked))
+
+@pytest.mark.parametrize("name, disagreement", [("vote_entropy", vote_entropy), ("kl_divergence", kl_to_consensus)])
+def test_selection_matches_sequential_committee(data, name, disagreement):
+    X_labeled, y_labeled, X_pool = data
+    strategy = QueryByCommitteeStrategy(disagreement=name)
+    
+    selected = strategy.select_samples(None, X_pool, 10, X_labeled=X_labeled, y_labeled=y_labeled)
+    
+    scores = reference_scores(X_labeled, y_labeled, X_pool, disagreement)
+    np.testing.assert_allclose(strategy.selection_scores, np.sort(scores)[::-1][:10])
+    np.testing.assert_allclose(scores[selected], strategy.selection_scores)
+
+def test_candidate_positions_index_into_candidates(data):
+    X_labeled, y_labeled, X_pool = data
+    candidates = np.arange(0, X_pool.shape[0], 4)
+    
+    selected = QueryByCommitteeStrategy().select_samples(
+        None, X_pool, 5, X_labeled=X_labeled, y_labeled=y_labeled, candidate_indices=candidates
+    )
+    
+    scores = reference_scores(X_labeled, y_labeled, X_pool[candidates], vote_entropy)
+    assert all(0 <= position < len(candidates) for position in selected)
+    np.testing.assert_allclose(np.sort(scores[selected]), np.sort(scores)[-5:])
+
+def test_members_refit_only_after_model_update(data):
+    X_labeled, y_labeled, X_pool = data
+    strategy = QueryByCommitteeStrategy()
+    executor_before = strategy.executor
+    
+    def query(n_labeled, model_version):
+        strategy.select_samples(
+            None, X_pool, 3, X_labeled=X_labeled[:n_labeled], y_labeled=y_labeled[:n_labeled],
+            model_version=model_version
+        )
+        return strategy.refits
+    
+    assert query(50, 1) == 4
+    assert query(50, 1) == 4
+    # A rejected label replaced by another one: same size, new model version
+    assert query(50, 2) == 8
+    assert query(60, 3) == 12
+    assert strategy.executor is executor_before
+
+def test_refit_falls_back_to_labeled_set_size(data):
+    X_labeled, y_labeled, X_pool = data
+    strategy = QueryByCommitteeStrategy()
+    
+    for n_labeled, refits in ((40, 4), (40, 4), (45, 8)):
+        strategy.select_samples(None, X_pool, 3, X_labeled=X_labeled[:n_labeled], y_labeled=y_labeled[:n_labeled])
+        assert strategy.refits == refits
+
+def test_disagreement_measures():
+    agree = np.array([[[0.9, 0.1], [0.2, 0.8]]] * 3)
+    split = np.array([[[0.9, 0.1]], [[0.1, 0.9]]])
+    
+    np.testing.assert_allclose(vote_entropy(agree), [0.0, 0.0])
+    np.testing.assert_allclose(kl_to_consensus(agree), [0.0, 0.0], atol=1e-12)
+    np.testing.assert_allclose(vote_entropy(split), entropy(np.array([[0.5, 0.5]])))
+    assert kl_to_consensus(split)[0] > 0
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        QueryByCommitteeStrategy(disagreement="variance")
+    with pytest.raises(ValueError):
+        QueryByCommitteeStrategy(committee=[DEFAULT_COMMITTEE[0]])
+    with pytest.raises(ValueError):
+        QueryByCommitteeStrategy().select_samples(None, np.zeros((3, 2)), 1)
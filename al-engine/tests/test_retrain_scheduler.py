@@ -0,0 +1,122 @@
+"""
+Tests for micro-batch retraining: policies, isolation, retries and rejection.
+"""
+
+import asyncio
+
+import pytest
+
+import services.retrain_scheduler as retrain_scheduler
+from services.retrain_scheduler import RetrainPolicy, RetrainScheduler
+
+class FakeModel:
+    """apply_batch callback recording applied batches and failing on demand."""
+    
+    def __init__(self, bad_labels=(), transient_failures=0):
+        self.bad_labels = set(bad_labels)
+        self.transient_failures = transient_failures
+        self.batches = []
+        self.rejected = []
+    
+    async def apply(self, indices, labels):
+        if self.transient_failures:
+            self.transient_failures -= 1
+            return {"status": "error", "error": "worker crashed"}
+        if self.bad_labels & set(labels):
+            return {"status": "error", "error": "unknown class", "retryable": False}
+        self.batches.append(list(indices))
+        return {"status": "success"}
+    
+    def on_rejected(self, indices, labels, error):
+        self.rejected.append((list(indices), error))
+
+def make_scheduler(model, **policy):
+    return RetrainScheduler(RetrainPolicy(type="micro_batch", **policy), model.apply, model.on_rejected)
+
+def test_policy_from_config():
+    assert RetrainPolicy.from_config(None).is_immediate
+    assert RetrainPolicy.from_config("micro_batch").batch_size == 10
+    assert RetrainPolicy.from_config({"type": "micro_batch", "idle_seconds": 2}).batch_size is None
+    with pytest.raises(ValueError):
+        RetrainPolicy.from_config({"type": "nightly"})
+
+def test_batch_size_trigger_flushes_in_background():
+    model = FakeModel()
+    
+    async def run():
+        scheduler = make_scheduler(model, batch_size=3)
+        for index in range(7):
+            scheduler.add(index, 0)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.05)
+        pending = scheduler.queued_indices
+        await scheduler.stop(flush=True)
+        return scheduler, pending
+    
+    scheduler, pending = asyncio.run(run())
+    
+    assert model.batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert pending == [6]
+    assert scheduler.get_stats()["labels_applied"] == 7
+
+def test_bad_label_is_isolated_and_rejected():
+    model = FakeModel(bad_labels={9})
+    scheduler = make_scheduler(model, batch_size=10)
+    
+    result = asyncio.run(scheduler.apply([1, 2, 3], [0, 9, 1]))
+    
+    assert result["status"] == "success"
+    assert result["labels_applied"] == 2
+    assert result["labels_rejected"] == 1
+    assert model.batches == [[1], [3]]
+    assert model.rejected == [([2], "unknown class")]
+    assert scheduler.get_stats()["rejected"] == [{"sample_index": 2, "label": 9, "error": "unknown class"}]
+
+def test_transient_failure_is_retried_separately(monkeypatch):
+    monkeypatch.setattr(retrain_scheduler, "RETRY_BACKOFF_SECONDS", 0.0)
+    model = FakeModel(transient_failures=1)
+    
+    async def run():
+        scheduler = make_scheduler(model, batch_size=10)
+        scheduler.add(1, 0)
+        scheduler.add(2, 0)
+        await scheduler.flush()
+        assert scheduler.get_stats()["retrying_labels"] == 2
+        
+        # Labels arriving later are not held back by the failed batch
+        scheduler.add(3, 1)
+        await scheduler.flush()
+        await scheduler.stop()
+        return scheduler
+    
+    scheduler = asyncio.run(run())
+    
+    assert model.batches == [[3], [1, 2]]
+    assert scheduler.retry_batches == []
+    assert model.rejected == []
+
+def test_batch_is_rejected_after_max_retries():
+    model = FakeModel(transient_failures=3)
+    scheduler = make_scheduler(model, batch_size=10, max_retries=3)
+    
+    async def run():
+        await scheduler.apply([1, 2], [0, 1])
+        for _ in range(2):
+            await scheduler.flush(retry_all=True)
+    
+    asyncio.run(run())
+    
+    assert model.batches == []
+    assert scheduler.retry_batches == []
+    assert model.rejected == [([1, 2], "Failed after 3 attempts: worker crashed")]
+    assert scheduler.get_stats()["labels_rejected"] == 2
+
+def test_apply_batch_exceptions_are_classified():
+    async def invalid(indices, labels):
+        raise ValueError("bad features")
+    
+    scheduler = RetrainScheduler(RetrainPolicy(type="micro_batch", batch_size=2), invalid)
+    asyncio.run(scheduler.apply([5], [0]))
+    
+    assert scheduler.get_stats()["rejected"][0]["error"] == "bad features"
+    assert scheduler.retry_batches == []
@@ -0,0 +1,84 @@
+"""
+Tests for recovering an experiment session from its label journal.
+"""
+
+import asyncio
+
+from services.experiment_session import ExperimentSession
+from utils.label_journal import LabelJournal
+
+ONLINE_CONFIG = {
+    "al_framework": {"type": "online"},
+    "model": {"type": "sgd", "classes": [0, 1, 2], "parameters": {"random_state": 0}},
+    "update_strategy": {"type": "micro_batch", "batch_size": 1}
+}
+
+def test_recover_replays_relabel_after_rejection(tmp_path, executor):
+    journal_path = str(tmp_path / "e1.journal")
+    
+    async def label_then_crash():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        assert (await session.initialize(ONLINE_CONFIG))["status"] == "success"
+        
+        # 99 is not a model class, so the update rejects it and returns the sample
+        assert (await session.submit_label("sample_5", 99))["status"] == "success"
+        await session.retrain_scheduler.flush()
+        assert 5 in session.unlabeled_pool
+        assert session.retrain_scheduler.get_stats()["rejected"][0]["label"] == 99
+        
+        assert (await session.submit_label("sample_5", 2))["status"] == "success"
+        await session.retrain_scheduler.flush()
+        assert 5 not in session.unlabeled_pool
+        
+        # Crash: the journal is committed but the session is never closed
+        session.journal.sync()
+        await session.stop()
+        return session.current_framework.model_version, len(session.unlabeled_pool)
+    
+    async def recover():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        result = await session.recover()
+        await session.stop()
+        await session.close_journal()
+        return session, result
+    
+    model_version, unlabeled = asyncio.run(label_then_crash())
+    session, result = asyncio.run(recover())
+    
+    assert result["status"] == "success"
+    assert result["replayed_labels"] == 1
+    assert session.labeled_indices == [5]
+    assert 5 not in session.unlabeled_pool
+    assert len(session.unlabeled_pool) == unlabeled
+    assert session.retrain_scheduler.get_stats()["rejected"] == []
+
+def test_immediate_rejection_keeps_sample_unlabeled(tmp_path, executor):
+    journal_path = str(tmp_path / "e1.journal")
+    config = {**ONLINE_CONFIG, "update_strategy": {"type": "immediate"}}
+    
+    async def label():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        assert (await session.initialize(config))["status"] == "success"
+        model_version = session.current_framework.model_version
+        
+        result = await session.submit_label("sample_5", 99)
+        assert result["status"] == "error"
+        assert 5 in session.unlabeled_pool
+        assert session.labeled_indices == []
+        assert session.current_framework.model_version == model_version
+        
+        assert (await session.submit_label("sample_5", 1))["status"] == "success"
+        assert 5 not in session.unlabeled_pool
+        session.journal.sync()
+    
+    async def recover():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        result = await session.recover()
+        await session.close_journal()
+        return session, result
+    
+    asyncio.run(label())
+    session, result = asyncio.run(recover())
+    
+    assert result["replayed_labels"] == 1
+    assert session.labeled_indices == [5]
@@ -0,0 +1,127 @@
+"""
+Tests for binary experiment snapshots.
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from services.experiment_session import ExperimentSession
+from utils.label_journal import LabelJournal
+from utils.snapshot_io import (
+    atomic_directory, recover_directory, save_array, load_array, save_object, load_object,
+    save_manifest, load_manifest, list_snapshots
+)
+
+SEEDED_CONFIG = {"model": {"type": "random_forest", "parameters": {"random_state": 0}}}
+
+def test_arrays_objects_and_manifest_round_trip(tmp_path):
+    directory = str(tmp_path / "snap")
+    dense = np.arange(12, dtype=np.float32).reshape(3, 4)
+    sparse = sp.random(5, 6, density=0.3, format="csr", random_state=0)
+    
+    with atomic_directory(directory) as tmp_directory:
+        save_array(tmp_directory, "dense", dense)
+        save_array(tmp_directory, "sparse", sparse)
+        save_array(tmp_directory, "missing", None)
+        save_object(tmp_directory, "params", {"classes": [0, 1, 2]})
+        save_manifest(tmp_directory, {"model_version": 3})
+    
+    mapped = load_array(directory, "dense", mmap=True)
+    assert isinstance(mapped, np.memmap)
+    assert mapped.dtype == np.float32
+    np.testing.assert_array_equal(mapped, dense)
+    assert (load_array(directory, "sparse") != sparse).nnz == 0
+    assert load_array(directory, "missing") is None
+    assert load_object(directory, "params") == {"classes": [0, 1, 2]}
+    assert load_manifest(directory) == {"model_version": 3}
+    assert list_snapshots(str(tmp_path)) == ["snap"]
+
+def test_failed_write_keeps_previous_snapshot(tmp_path):
+    directory = str(tmp_path / "snap")
+    with atomic_directory(directory) as tmp_directory:
+        save_manifest(tmp_directory, {"model_version": 1})
+    
+    with pytest.raises(RuntimeError):
+        with atomic_directory(directory) as tmp_directory:
+            save_manifest(tmp_directory, {"model_version": 2})
+            raise RuntimeError("disk full")
+    
+    assert load_manifest(directory) == {"model_version": 1}
+    assert os.listdir(tmp_path) == ["snap"]
+
+def test_recover_directory_restores_interrupted_swap(tmp_path):
+    directory = str(tmp_path / "snap")
+    with atomic_directory(directory) as tmp_directory:
+        save_manifest(tmp_directory, {"model_version": 1})
+    
+    # Another process crashed after moving the old snapshot aside
+    os.rename(directory, f"{directory}.old-999999-1")
+    
+    assert recover_directory(directory)
+    assert load_manifest(directory) == {"model_version": 1}
+    assert os.listdir(tmp_path) == ["snap"]
+
+def test_session_snapshot_round_trip(tmp_path, executor):
+    directory = str(tmp_path / "e1")
+    
+    async def label_and_snapshot():
+        session = ExperimentSession("e1", executor)
+        assert (await session.initialize(SEEDED_CONFIG))["status"] == "success"
+        for label in (0, 1, 2, 1):
+            sample_id = (await session.get_next_sample())["sample"]["sample_id"]
+            assert (await session.submit_label(sample_id, label))["status"] == "success"
+        
+        assert (await session.save_snapshot(directory))["status"] == "success"
+        picks = await session.get_next_samples(5)
+        return session, picks
+    
+    async def restore():
+        session = ExperimentSession("e1", executor)
+        result = await session.load_snapshot(directory)
+        picks = await session.get_next_samples(5)
+        return session, result, picks
+    
+    original, original_picks = asyncio.run(label_and_snapshot())
+    restored, result, restored_picks = asyncio.run(restore())
+    
+    assert result["status"] == "success"
+    assert restored.labeled_indices == original.labeled_indices
+    assert sorted(restored.unlabeled_pool.indices.tolist()) == sorted(original.unlabeled_pool.indices.tolist())
+    assert restored.current_framework.model_version == original.current_framework.model_version
+    assert [sample["sample_id"] for sample in restored_picks["samples"]] == \
+        [sample["sample_id"] for sample in original_picks["samples"]]
+    assert [sample["uncertainty_score"] for sample in restored_picks["samples"]] == \
+        [sample["uncertainty_score"] for sample in original_picks["samples"]]
+
+def test_recover_replays_labels_newer_than_snapshot(tmp_path, executor):
+    directory = str(tmp_path / "e1")
+    journal_path = str(tmp_path / "e1.journal")
+    
+    async def label_snapshot_and_crash():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        assert (await session.initialize(SEEDED_CONFIG))["status"] == "success"
+        for sample_index, label in ((10, 0), (60, 1)):
+            assert (await session.submit_label(f"sample_{sample_index}", label))["status"] == "success"
+        assert (await session.save_snapshot(directory))["status"] == "success"
+        
+        assert (await session.submit_label("sample_100", 2))["status"] == "success"
+        session.journal.sync()
+        return session.current_framework.model_version
+    
+    async def recover():
+        session = ExperimentSession("e1", executor, journal=LabelJournal(journal_path))
+        result = await session.recover(directory)
+        await session.close_journal()
+        return session, result
+    
+    model_version = asyncio.run(label_snapshot_and_crash())
+    session, result = asyncio.run(recover())
+    
+    assert result["status"] == "success"
+    assert result["replayed_labels"] == 1
+    assert result["model_version"] == model_version
+    assert session.labeled_indices == [10, 60, 100]
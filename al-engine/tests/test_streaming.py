@@ -0,0 +1,76 @@
+"""
+Tests for chunked top-k pool scoring.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from services.experiment_session import ExperimentSession
+from utils.streaming import TopKAccumulator, iter_chunk_bounds, stream_top_k
+
+def full_top_k(scores, k):
+    """Reference selection: full descending argsort."""
+    order = np.argsort(-scores, kind="stable")[:k]
+    return order, scores[order]
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000, 5000])
+@pytest.mark.parametrize("n_jobs", [1, 3])
+def test_stream_top_k_matches_full_argsort(chunk_size, n_jobs):
+    scores = np.random.default_rng(42).random(2500)
+    
+    positions, top_scores = stream_top_k(
+        lambda start, stop: scores[start:stop], len(scores), 25, chunk_size=chunk_size, n_jobs=n_jobs
+    )
+    expected_positions, expected_scores = full_top_k(scores, 25)
+    
+    np.testing.assert_array_equal(positions, expected_positions)
+    np.testing.assert_array_equal(top_scores, expected_scores)
+
+def test_stream_top_k_with_ties_returns_best_scores():
+    scores = np.round(np.random.default_rng(0).random(1000), 1)
+    
+    positions, top_scores = stream_top_k(lambda start, stop: scores[start:stop], len(scores), 40, chunk_size=64)
+    
+    np.testing.assert_array_equal(top_scores, full_top_k(scores, 40)[1])
+    np.testing.assert_array_equal(scores[positions], top_scores)
+    assert len(set(positions.tolist())) == 40
+
+def test_stream_top_k_with_k_above_n():
+    scores = np.array([0.2, 0.9, 0.5])
+    
+    positions, top_scores = stream_top_k(lambda start, stop: scores[start:stop], 3, 10, chunk_size=2)
+    
+    assert positions.tolist() == [1, 2, 0]
+    assert top_scores.tolist() == [0.9, 0.5, 0.2]
+
+def test_stream_top_k_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        stream_top_k(lambda start, stop: np.zeros(stop - start), 10, 1, chunk_size=0)
+
+def test_accumulator_holds_at_most_k_entries():
+    accumulator = TopKAccumulator(3)
+    for start in range(0, 20, 5):
+        accumulator.push(np.arange(start, start + 5), np.arange(start, start + 5, dtype=np.float64))
+        assert len(accumulator.scores) <= 3
+    
+    assert accumulator.result()[0].tolist() == [19, 18, 17]
+
+def test_iter_chunk_bounds():
+    assert list(iter_chunk_bounds(10, 4)) == [(0, 4), (4, 8), (8, 10)]
+    assert list(iter_chunk_bounds(0, 4)) == []
+
+def test_streaming_query_matches_whole_pool_query(executor):
+    config = {"model": {"type": "random_forest", "parameters": {"random_state": 0}}}
+    
+    async def query(scoring):
+        session = ExperimentSession("e1", executor)
+        assert (await session.initialize({**config, **scoring}))["status"] == "success"
+        result = await session.get_next_samples(10)
+        return [sample["uncertainty_score"] for sample in result["samples"]]
+    
+    whole_pool = asyncio.run(query({}))
+    streamed = asyncio.run(query({"scoring": {"chunk_size": 16, "n_jobs": 2}}))
+    
+    assert streamed == pytest.approx(whole_pool)
@@ -0,0 +1,96 @@
+"""
+Tests for the array-backed unlabeled pool.
+"""
+
+import numpy as np
+import pytest
+
+from utils.unlabeled_pool import UnlabeledPool
+
+def test_remove_swaps_last_index_into_freed_slot():
+    pool = UnlabeledPool(5)
+    
+    pool.remove(1)
+    
+    assert pool.indices.tolist() == [0, 4, 2, 3]
+    assert len(pool) == 4
+    assert 1 not in pool
+    assert pool.mask.tolist() == [True, False, True, True, True]
+
+def test_contains_rejects_out_of_range_rows():
+    pool = UnlabeledPool(3)
+    
+    assert 0 in pool
+    assert 2 in pool
+    assert -1 not in pool
+    assert 3 not in pool
+
+def test_remove_twice_raises():
+    pool = UnlabeledPool(3)
+    pool.remove(2)
+    
+    with pytest.raises(KeyError):
+        pool.remove(2)
+
+def test_add_restores_removed_rows():
+    pool = UnlabeledPool(6)
+    for index in (4, 0, 5):
+        pool.remove(index)
+    
+    pool.add(0)
+    pool.add(0)
+    
+    assert len(pool) == 4
+    assert sorted(pool.indices.tolist()) == [0, 1, 2, 3]
+    assert pool.mask.tolist() == [True, True, True, True, False, False]
+    with pytest.raises(KeyError):
+        pool.add(6)
+
+def test_random_removals_match_a_set():
+    rng = np.random.default_rng(0)
+    pool = UnlabeledPool(200)
+    remaining = set(range(200))
+    
+    for index in rng.permutation(200)[:150]:
+        pool.remove(int(index))
+        remaining.discard(int(index))
+        if rng.random() < 0.2:
+            returned = int(rng.integers(200))
+            pool.add(returned)
+            remaining.add(returned)
+    
+    assert sorted(pool.indices.tolist()) == sorted(remaining)
+    assert np.flatnonzero(pool.mask).tolist() == sorted(remaining)
+    assert all((index in pool) == (index in remaining) for index in range(200))
+
+def test_iter_chunks_covers_every_unlabeled_row():
+    pool = UnlabeledPool(10)
+    pool.remove(3)
+    
+    chunks = list(pool.iter_chunks(4))
+    
+    assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+    assert sorted(np.concatenate(chunks).tolist()) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+def test_snapshot_view_survives_removals():
+    pool = UnlabeledPool(6)
+    
+    with pool.snapshot() as indices:
+        pool.remove(0)
+        pool.remove(3)
+        pool.add(0)
+        assert indices.tolist() == [0, 1, 2, 3, 4, 5]
+    
+    assert sorted(pool.indices.tolist()) == [0, 1, 2, 4, 5]
+    assert pool.mask.tolist() == [True, True, True, False, True, True]
+
+def test_snapshot_is_not_copied_without_changes():
+    pool = UnlabeledPool(4)
+    
+    with pool.snapshot() as indices:
+        pass
+    pool.remove(1)
+    
+    # No copy was made, so the released view sees the swap-remove
+    assert np.shares_memory(indices, pool.indices)
+    assert indices.tolist() == [0, 3, 2, 1]
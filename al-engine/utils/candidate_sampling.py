@@ -0,0 +1,199 @@
+"""
+Candidate Sampling for AL Engine
+
+Approximate queries over huge pools: instead of scoring every unlabeled row,
+each query scores a random or stratified candidate subset of fixed size, so
+query latency stays constant as the pool grows.
+"""
+
+import time
+import numpy as np
+from typing import Any, Dict, Optional
+
+from utils.unlabeled_pool import UnlabeledPool
+
+class CandidateSampler:
+    """
+    Draws candidate subsets of the unlabeled pool.
+    
+    Methods:
+        - random: uniform sample of the unlabeled rows
+        - stratified: equal share from each of n_strata contiguous row ranges,
+          so every region of the pool (e.g. source files, time periods) is
+          represented in each subset
+    
+    A drawn subset is reused for refresh_every queries (and at most
+    refresh_seconds), minus rows labeled meanwhile, then redrawn. It is
+    redrawn early once labeling leaves fewer rows than a query selects.
+    """
+    
+    METHODS = ("random", "stratified")
+    
+    def __init__(self, size: int, method: str = "random", refresh_every: int = 1,
+                 refresh_seconds: Optional[float] = None, n_strata: int = 10,
+                 seed: Optional[int] = None):
+        """
+        Initialize the candidate sampler.
+        
+        Args:
+            size: Number of candidates scored per query
+            method: "random" or "stratified"
+            refresh_every: Queries served from one subset before redrawing
+            refresh_seconds: Maximum age of a subset
+            n_strata: Number of row ranges for stratified sampling
+            seed: Random seed
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown candidate sampling method '{method}'. Available: {list(self.METHODS)}")
+        if size < 1:
+            raise ValueError(f"Candidate sample size must be at least 1, got {size}")
+        
+        self.size = size
+        self.method = method
+        self.refresh_every = max(1, refresh_every)
+        self.refresh_seconds = refresh_seconds
+        self.n_strata = max(1, n_strata)
+        self.rng = np.random.default_rng(seed)
+        
+        self._subset: Optional[np.ndarray] = None
+        self._drawn_at = 0.0
+        self._queries_served = 0
+        self.refreshes = 0
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["CandidateSampler"]:
+        """
+        Build a sampler from the experiment's candidate_sampling config.
+        
+        Args:
+            config: Candidate sampling configuration, or None for exact queries
+        
+        Returns:
+            CandidateSampler, or None if no subset size is configured
+        """
+        if not config or not config.get("size"):
+            return None
+        
+        return cls(
+            size=int(config["size"]),
+            method=config.get("type", "random"),
+            refresh_every=int(config.get("refresh_every", 1)),
+            refresh_seconds=config.get("refresh_seconds"),
+            n_strata=int(config.get("n_strata", 10)),
+            seed=config.get("seed")
+        )
+    
+    def _is_stale(self) -> bool:
+        """Whether the current subset must be redrawn."""
+        if self._subset is None or self._queries_served >= self.refresh_every:
+            return True
+        if self.refresh_seconds is not None and time.monotonic() - self._drawn_at >= self.refresh_seconds:
+            return True
+        return False
+    
+    def sample(self, pool: UnlabeledPool, n_samples: int = 1) -> np.ndarray:
+        """
+        Get the candidate rows for the next query.
+        
+        Args:
+            pool: Unlabeled pool
+            n_samples: Number of samples the query selects
+        
+        Returns:
+            Sorted unlabeled row indices (at most size)
+        """
+        if len(pool) <= self.size:
+            # Small pools are scored exactly
+            return pool.indices.copy()
+        
+        stale = self._is_stale()
+        if not stale:
+            # Drop rows labeled since the subset was drawn
+            self._subset = self._subset[pool.mask[self._subset]]
+            stale = len(self._subset) < max(1, min(n_samples, self.size))
+        
+        if stale:
+            self._subset = self._draw(pool)
+            self._drawn_at = time.monotonic()
+            self._queries_served = 0
+            self.refreshes += 1
+        
+        self._queries_served += 1
+        return self._subset
+    
+    def _draw(self, pool: UnlabeledPool) -> np.ndarray:
+        """Draw a new candidate subset."""
+        if self.method == "stratified":
+            subset = self._draw_stratified(pool)
+        else:
+            subset = self.rng.choice(pool.indices, size=self.size, replace=False)
+        
+        # Sorted rows keep reads from memory-mapped pools sequential
+        return np.sort(subset)
+    
+    def _draw_stratified(self, pool: UnlabeledPool) -> np.ndarray:
+        """
+        Draw an equal share of unlabeled rows from each contiguous row range.
+        
+        Rows are drawn by rejection against the pool mask, so the cost is
+        proportional to the subset size rather than the pool size.
+        """
+        mask = pool.mask
+        bounds = np.linspace(0, pool.size, self.n_strata + 1).astype(np.intp)
+        quotas = np.full(self.n_strata, self.size // self.n_strata)
+        quotas[:self.size % self.n_strata] += 1
+        
+        unlabeled_fraction = max(len(pool) / pool.size, 1e-3)
+        
+        strata = []
+        for (low, high), quota in zip(zip(bounds[:-1], bounds[1:]), quotas):
+            if high <= low or quota == 0:
+                continue
+            
+            if high - low <= 64 * quota:
+                # Small range: pick directly from its unlabeled rows
+                rows = low + np.flatnonzero(mask[low:high])
+                strata.append(self.rng.choice(rows, size=min(quota, len(rows)), replace=False))
+                continue
+            
+            chosen = np.array([], dtype=np.intp)
+            for _ in range(8):
+                draws = self.rng.integers(low, high, int(quota / unlabeled_fraction * 1.2) + 8)
+                draws = np.concatenate([chosen, draws[mask[draws]]])
+                # Deduplicate while keeping draw order, so the cut below stays uniform
+                _, first = np.unique(draws, return_index=True)
+                chosen = draws[np.sort(first)][:quota]
+                if len(chosen) >= quota:
+                    break
+            strata.append(chosen)
+        
+        subset = np.concatenate(strata) if strata else np.array([], dtype=np.intp)
+        
+        # Top up from the whole pool if sparse strata fell short
+        if len(subset) < self.size:
+            remaining = np.setdiff1d(pool.indices, subset)
+            extra = self.rng.choice(remaining, size=min(self.size - len(subset), len(remaining)), replace=False)
+            subset = np.concatenate([subset, extra])
+        
+        return subset
+    
+    def get_info(self, pool_size: int, n_candidates: int) -> Dict[str, Any]:
+        """
+        Describe the approximation of the last query.
+        
+        Args:
+            pool_size: Number of unlabeled rows
+            n_candidates: Number of candidates scored
+        
+        Returns:
+            Approximation metadata
+        """
+        return {
+            "method": self.method,
+            "candidates_scored": n_candidates,
+            "unlabeled_pool_size": pool_size,
+            "coverage": n_candidates / pool_size if pool_size else 1.0,
+            "exact": n_candidates >= pool_size,
+            "subset_queries": self._queries_served,
+            "subset_refreshes": self.refreshes
+        }
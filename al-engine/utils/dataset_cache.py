@@ -0,0 +1,220 @@
+"""
+Dataset Cache for AL Engine
+
+Content-addressed cache of prepared datasets. An entry is keyed by a hash of
+the dataset spec (source, split, seeds, synthetic sample count,
+preprocessing) and stores the resulting arrays as .npy files that are
+memory-mapped on load, plus pickles of fitted preprocessors. Entries are
+evicted least recently used first once the cache exceeds its disk budget.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+
+from utils.snapshot_io import (atomic_directory, save_array, load_array, save_object, load_object,
+                               save_manifest, load_manifest, MANIFEST_NAME)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the prepared arrays change for an unchanged spec
+CACHE_FORMAT_VERSION = 1
+
+class DatasetCache:
+    """
+    Disk cache of prepared dataset arrays with LRU eviction by size.
+    """
+    
+    def __init__(self, root: str, max_bytes: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            root: Cache directory
+            max_bytes: Disk budget; least recently used entries are evicted beyond it
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> Optional["DatasetCache"]:
+        """
+        Build the cache configured by AL_ENGINE_DATASET_CACHE_DIR and
+        AL_ENGINE_DATASET_CACHE_MB (default 2048).
+        
+        Returns:
+            DatasetCache, or None if no cache directory is set
+        """
+        root = os.getenv("AL_ENGINE_DATASET_CACHE_DIR")
+        if not root:
+            return None
+        max_mb = float(os.getenv("AL_ENGINE_DATASET_CACHE_MB", "2048"))
+        return cls(root, int(max_mb * 1024 * 1024))
+    
+    def key(self, spec: Dict[str, Any]) -> str:
+        """
+        Hash a dataset spec.
+        
+        Args:
+            spec: JSON-serializable description of how the dataset is prepared
+        
+        Returns:
+            Hex digest
+        """
+        canonical = json.dumps({"format": CACHE_FORMAT_VERSION, **spec}, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, spec: Dict[str, Any]) -> Optional[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+        """
+        Look up a prepared dataset.
+        
+        Args:
+            spec: Dataset spec
+        
+        Returns:
+            Tuple of (memory-mapped arrays, objects) by name, or None on a miss
+        """
+        path = os.path.join(self.root, self.key(spec))
+        try:
+            manifest = load_manifest(path)
+            arrays = {name: load_array(path, name, mmap=True) for name in manifest["arrays"]}
+            objects = {name: load_object(path, name) for name in manifest["objects"]}
+        except (OSError, ValueError, KeyError, EOFError) as e:
+            # Missing, evicted mid-read or written by another format version
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable dataset cache entry {path}: {e}")
+            self.misses += 1
+            return None
+        
+        # Directory mtime is the entry's last use for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return arrays, objects
+    
+    def put(self, spec: Dict[str, Any], arrays: Dict[str, Optional[np.ndarray]],
+            objects: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Store a prepared dataset and evict old entries beyond the budget.
+        
+        Args:
+            spec: Dataset spec
+            arrays: Arrays by name (None values are skipped)
+            objects: Picklable objects (e.g. fitted scalers) by name
+        
+        Returns:
+            Cache key of the entry
+        """
+        with self.create(spec) as directory:
+            for name, array in arrays.items():
+                save_array(directory, name, array)
+            for name, obj in (objects or {}).items():
+                save_object(directory, name, obj)
+        return self.key(spec)
+    
+    @contextmanager
+    def create(self, spec: Dict[str, Any]) -> Iterator[str]:
+        """
+        Write an entry file by file, e.g. to fill large arrays in chunks
+        through create_array instead of building them in memory.
+        
+        Yields a temporary directory to write <name>.npy and <name>.pkl
+        files into; when the block completes the entry is committed and old
+        entries beyond the budget are evicted.
+        
+        Args:
+            spec: Dataset spec
+        
+        Yields:
+            Directory to write into
+        """
+        key = self.key(spec)
+        with atomic_directory(os.path.join(self.root, key)) as directory:
+            yield directory
+            
+            files = sorted(os.listdir(directory))
+            save_manifest(directory, {
+                "spec": spec,
+                "arrays": [name[:-4] for name in files if name.endswith((".npy", ".npz"))],
+                "objects": [name[:-4] for name in files if name.endswith(".pkl")]
+            })
+        
+        self.evict(keep=key)
+    
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """List complete entries as (last used, size in bytes, key)."""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        
+        for key in os.listdir(self.root):
+            path = os.path.join(self.root, key)
+            if not os.path.isfile(os.path.join(path, MANIFEST_NAME)):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+                entries.append((os.stat(path).st_mtime, size, key))
+            except OSError:
+                continue
+        return entries
+    
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove least recently used entries until the cache fits its budget.
+        
+        Args:
+            keep: Key never to evict (the entry just written)
+        
+        Returns:
+            Evicted keys
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            evicted = []
+            
+            for _, size, key in entries:
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                # Running experiments keep reading their mapped files after removal
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+                total -= size
+                evicted.append(key)
+            
+            self.evictions += len(evicted)
+        
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} dataset cache entries, {total} bytes remain")
+        return evicted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with location, budget, size and hit counts
+        """
+        entries = self._entries()
+        return {
+            "root": self.root,
+            "max_bytes": self.max_bytes,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,136 @@
+"""
+kNN Density Index for AL Engine
+
+Scores how representative each pool row is from the mean distance to its
+k nearest neighbours in the pool. The pool never changes during an
+experiment, so the scores are computed once, in blocks queried on parallel
+threads, and persisted as a .npy file keyed by a fingerprint of the pool
+content; later sessions on the same pool load them instead of rebuilding.
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+
+from utils.sparse import is_sparse
+from utils.streaming import iter_chunk_bounds
+
+logger = logging.getLogger(__name__)
+
+class DensityIndex:
+    """
+    Builds, persists and loads per-row kNN density scores for a pool.
+    
+    Density is 1 / (1 + mean distance to the k nearest other pool rows), so
+    rows in dense regions score close to 1 and isolated outliers close to 0.
+    """
+    
+    def __init__(self, n_neighbors: int = 10, block_size: int = 4096, n_jobs: Optional[int] = None):
+        """
+        Initialize the density index.
+        
+        Args:
+            n_neighbors: Neighbours averaged per row
+            block_size: Pool rows per neighbour query block
+            n_jobs: Threads querying blocks (defaults to the CPU count)
+        """
+        if n_neighbors < 1:
+            raise ValueError(f"n_neighbors must be at least 1, got {n_neighbors}")
+        
+        self.n_neighbors = n_neighbors
+        self.block_size = max(1, block_size)
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+    
+    def fingerprint(self, X: np.ndarray) -> str:
+        """
+        Identify a pool by its content and the index parameters.
+        
+        Args:
+            X: Pool features
+        
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{X.shape}|{X.dtype}|sparse={is_sparse(X)}|k={self.n_neighbors}".encode())
+        if is_sparse(X):
+            X = X.tocsr()
+            for part in (X.indptr, X.indices, X.data):
+                digest.update(np.ascontiguousarray(part).tobytes())
+            return digest.hexdigest()
+        
+        for start, stop in iter_chunk_bounds(len(X), self.block_size):
+            digest.update(np.ascontiguousarray(X[start:stop]).tobytes())
+        return digest.hexdigest()
+    
+    def build(self, X: np.ndarray) -> np.ndarray:
+        """
+        Compute density scores for every pool row.
+        
+        Args:
+            X: Pool features
+        
+        Returns:
+            Density scores (n_samples,)
+        """
+        n_rows = X.shape[0]
+        n_neighbors = min(self.n_neighbors, n_rows - 1)
+        densities = np.ones(n_rows, dtype=np.float64)
+        if n_neighbors < 1:
+            return densities
+        
+        # One extra neighbour, since each row finds itself at distance zero
+        neighbours = NearestNeighbors(n_neighbors=n_neighbors + 1).fit(X)
+        
+        def query_block(bounds) -> None:
+            start, stop = bounds
+            block = X[start:stop]
+            distances, _ = neighbours.kneighbors(block if is_sparse(block) else np.asarray(block))
+            densities[start:stop] = 1.0 / (1.0 + distances[:, 1:].mean(axis=1))
+        
+        # Tree and brute-force queries release the GIL, so blocks run in parallel
+        with ThreadPoolExecutor(max_workers=self.n_jobs, thread_name_prefix="al-density") as executor:
+            list(executor.map(query_block, iter_chunk_bounds(n_rows, self.block_size)))
+        
+        return densities
+    
+    def load_or_build(self, X: np.ndarray, index_dir: Optional[str] = None) -> np.ndarray:
+        """
+        Load persisted density scores for the pool, building them if missing.
+        
+        Args:
+            X: Pool features
+            index_dir: Directory holding index files (None keeps them in memory only)
+        
+        Returns:
+            Density scores (n_samples,)
+        """
+        if not index_dir:
+            return self.build(X)
+        
+        path = os.path.join(index_dir, f"density_{self.fingerprint(X)}.npy")
+        if os.path.exists(path):
+            densities = np.load(path)
+            if len(densities) == X.shape[0]:
+                logger.info(f"Loaded density index {path}")
+                return densities
+            logger.warning(f"Ignoring density index {path} with {len(densities)} rows, pool has {X.shape[0]}")
+        
+        densities = self.build(X)
+        
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            # Write then rename, so concurrent sessions never read a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, densities)
+            os.replace(tmp_path, path)
+            logger.info(f"Saved density index {path}")
+        except OSError as e:
+            logger.warning(f"Could not persist density index to {index_dir}: {e}")
+        
+        return densities
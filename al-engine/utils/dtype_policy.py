@@ -0,0 +1,99 @@
+"""
+Dtype Policy for AL Engine
+
+Per-experiment element types of the large arrays: the training features,
+the unlabeled pool (which can be stored more compactly than the features
+models train on) and the class probability matrices used for scoring.
+
+Pools are scanned by every query, so halving their element size halves the
+memory traffic of scoring. Steps that need more precision upcast only the
+rows they work on: preprocessors are fitted and applied in float64 chunk by
+chunk, newly labeled rows are upcast to the feature dtype before training,
+and scikit-learn upcasts float16 input on prediction.
+"""
+
+from typing import Any, Dict, Optional, Union
+import numpy as np
+
+from utils.sparse import is_sparse, as_float
+
+FEATURE_DTYPES = ("float32", "float64")
+STORAGE_DTYPES = ("float16", "float32", "float64")
+SCORE_DTYPES = ("float32", "float64")
+
+def _validate(name: str, value: str, allowed) -> np.dtype:
+    """Parse a dtype name from the configuration."""
+    if value not in allowed:
+        raise ValueError(f"Unsupported {name} dtype '{value}'. Available: {list(allowed)}")
+    return np.dtype(value)
+
+class DtypePolicy:
+    """
+    Element types of an experiment's features, pool and probabilities.
+    """
+    
+    def __init__(self, features: str = "float64", storage: Optional[str] = None,
+                 scores: str = "float64", configured: bool = False):
+        """
+        Initialize the policy.
+        
+        Args:
+            features: Dtype of the training set and of new labeled rows
+            storage: Dtype the unlabeled pool is stored in (defaults to features)
+            scores: Dtype of cached class probabilities and uncertainty scores
+            configured: Whether the experiment set the policy explicitly; pools
+                served directly by dataset plugins are only converted if so
+        """
+        self.features = _validate("feature", features, FEATURE_DTYPES)
+        self.storage = _validate("storage", storage, STORAGE_DTYPES) if storage else self.features
+        self.scores = _validate("score", scores, SCORE_DTYPES)
+        self.configured = configured
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "DtypePolicy":
+        """
+        Build the policy of an experiment configuration.
+        
+        The "dtype" entry is either one dtype name for features and scores
+        (e.g. "float32") or a dict with "features", "storage" and "scores".
+        
+        Args:
+            config: Experiment configuration
+        
+        Returns:
+            DtypePolicy (float64 throughout if the configuration sets none)
+        """
+        spec: Union[str, Dict[str, str], None] = (config or {}).get("dtype")
+        if spec is None:
+            return cls()
+        if isinstance(spec, str):
+            return cls(features=spec, scores=spec, configured=True)
+        return cls(
+            features=spec.get("features", "float64"),
+            storage=spec.get("storage"),
+            scores=spec.get("scores", spec.get("features", "float64")),
+            configured=True
+        )
+    
+    def as_features(self, X: np.ndarray) -> np.ndarray:
+        """Cast training rows to the feature dtype (no copy if they already match; sparse stays sparse)."""
+        return as_float(X, self.features)
+    
+    def as_storage(self, X: np.ndarray) -> np.ndarray:
+        """Cast pool rows to the storage dtype (no copy if they already match; sparse stays sparse)."""
+        if is_sparse(X) and self.storage == np.float16:
+            raise ValueError("scipy.sparse does not support float16; use float32 storage for sparse pools")
+        return as_float(X, self.storage)
+    
+    def as_scores(self, values: np.ndarray) -> np.ndarray:
+        """Cast probabilities or scores to the score dtype (no copy if they already match)."""
+        return np.asarray(values, dtype=self.scores)
+    
+    def get_spec(self) -> Dict[str, str]:
+        """
+        Describe the policy.
+        
+        Returns:
+            Dtype names of features, storage and scores
+        """
+        return {"features": self.features.name, "storage": self.storage.name, "scores": self.scores.name}
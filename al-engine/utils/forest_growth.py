@@ -0,0 +1,164 @@
+"""
+Incremental Forest Growth for AL Engine
+
+Refitting a random forest on the whole labeled set after every label makes
+each update slower than the last. With incremental growth, an update keeps
+the fitted trees and adds a few new ones (scikit-learn's warm_start) trained
+on the most recent labels. The oldest trees are retired so the ensemble never
+exceeds a fixed budget, and every N updates the forest is refitted from
+scratch on all labels so that early trees do not go stale.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ForestGrowthPolicy:
+    """
+    How a forest is updated with newly labeled samples.
+    
+    Fields:
+        - trees_per_update: trees added per update
+        - max_trees: ensemble budget (defaults to the model's n_estimators)
+        - recent_samples: most recent labels the new trees are trained on
+        - full_refit_every: updates between full refits on all labels
+    """
+    trees_per_update: int = 5
+    max_trees: Optional[int] = None
+    recent_samples: int = 256
+    full_refit_every: int = 20
+    
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ForestGrowthPolicy"]:
+        """
+        Build a growth policy from the model's "incremental" config.
+        
+        Args:
+            config: True for defaults, a dict of policy fields, or None/False
+        
+        Returns:
+            ForestGrowthPolicy instance, or None if incremental updates are off
+        """
+        if not config:
+            return None
+        if config is True:
+            config = {}
+        
+        policy = cls(**config)
+        if policy.trees_per_update < 1 or policy.recent_samples < 1 or policy.full_refit_every < 1:
+            raise ValueError("trees_per_update, recent_samples and full_refit_every must be positive")
+        return policy
+
+class ForestGrowth:
+    """
+    Applies a ForestGrowthPolicy to a scikit-learn forest.
+    
+    Works with any fitted ensemble exposing warm_start and estimators_
+    (RandomForestClassifier, ExtraTreesClassifier); other estimators are
+    always refitted in full.
+    """
+    
+    def __init__(self, policy: ForestGrowthPolicy, base_trees: int = 100,
+                 state: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the growth state.
+        
+        Args:
+            policy: Growth policy
+            base_trees: Number of trees of a full refit (the model's n_estimators)
+            state: Counters from get_stats() of a restored experiment
+        """
+        self.policy = policy
+        self.base_trees = base_trees
+        self.max_trees = policy.max_trees or base_trees
+        state = state or {}
+        self.updates_since_refit = state.get("updates_since_refit", 0)
+        self.incremental_updates = state.get("incremental_updates", 0)
+        self.full_refits = state.get("full_refits", 0)
+    
+    def _recent_rows(self, y: np.ndarray, n_new: int, classes: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Select the rows the new trees are trained on.
+        
+        The recent window is extended by the latest row of every class it
+        lacks, so the new trees predict the same classes as the old ones.
+        
+        Args:
+            y: All labels, oldest first
+            n_new: Number of labels added since the last update
+            classes: Classes the forest was fitted on
+        
+        Returns:
+            Row indices, or None if a new label is a class the forest has not
+            seen (which needs a full refit)
+        """
+        if not np.all(np.isin(y[len(y) - n_new:], classes)):
+            return None
+        
+        start = max(0, len(y) - max(self.policy.recent_samples, n_new))
+        recent = np.arange(start, len(y))
+        
+        missing = np.setdiff1d(classes, y[start:])
+        if len(missing):
+            latest = [np.flatnonzero(y[:start] == label)[-1] for label in missing]
+            recent = np.concatenate([np.asarray(latest), recent])
+        return recent
+    
+    def update(self, estimator, X: np.ndarray, y: np.ndarray, n_new: int) -> str:
+        """
+        Update a fitted forest with the labeled set.
+        
+        Args:
+            estimator: Fitted scikit-learn estimator
+            X: All labeled features, oldest first
+            y: All labels, oldest first
+            n_new: Number of labels at the end of y added since the last update
+        
+        Returns:
+            "incremental" if trees were added, "full" if the estimator was refitted
+        """
+        self.updates_since_refit += 1
+        rows = None
+        if hasattr(estimator, "estimators_") and hasattr(estimator, "warm_start"):
+            if self.updates_since_refit < self.policy.full_refit_every:
+                rows = self._recent_rows(y, n_new, estimator.classes_)
+        
+        if rows is None:
+            if hasattr(estimator, "warm_start"):
+                estimator.set_params(warm_start=False, n_estimators=self.base_trees)
+            estimator.fit(X, y)
+            self.updates_since_refit = 0
+            self.full_refits += 1
+            logger.debug(f"Refitted forest on all {len(y)} labels")
+            return "full"
+        
+        n_trees = len(estimator.estimators_)
+        estimator.set_params(warm_start=True, n_estimators=n_trees + self.policy.trees_per_update)
+        estimator.fit(X[rows], y[rows])
+        
+        # Retire the oldest trees beyond the budget
+        if len(estimator.estimators_) > self.max_trees:
+            estimator.estimators_ = estimator.estimators_[-self.max_trees:]
+            estimator.set_params(n_estimators=self.max_trees)
+        
+        self.incremental_updates += 1
+        return "incremental"
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get growth statistics.
+        
+        Returns:
+            Dict with policy and update counters
+        """
+        return {
+            "policy": self.policy.__dict__,
+            "base_trees": self.base_trees,
+            "updates_since_refit": self.updates_since_refit,
+            "incremental_updates": self.incremental_updates,
+            "full_refits": self.full_refits
+        }
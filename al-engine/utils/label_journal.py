@@ -0,0 +1,309 @@
+"""
+Label Journal for AL Engine
+
+Append-only write-ahead log of the labels an experiment received, so labels
+survive crashes and reloads between snapshots. Each line is a JSON record:
+a header with the experiment config, then one record per label with a
+sequence number. A rejection record marks a label that the model update
+rejected, so the sample went back to the unlabeled pool.
+
+Appends only buffer the record and return; a writer thread commits all
+records buffered since its previous commit with one write and one fsync
+(group commit), so disk latency stays off the request path and bursts of
+labels share a single fsync.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+JOURNAL_SUFFIX = ".journal"
+
+def list_journals(root: str) -> List[str]:
+    """
+    List the experiment ids with a journal in a directory.
+    
+    Args:
+        root: Directory holding <experiment_id>.journal files
+    
+    Returns:
+        Sorted experiment ids
+    """
+    if not os.path.isdir(root):
+        return []
+    return sorted(name[:-len(JOURNAL_SUFFIX)] for name in os.listdir(root) if name.endswith(JOURNAL_SUFFIX))
+
+def _fsync_directory(path: str) -> None:
+    """Make a rename in a directory durable (best effort on platforms without directory fds)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+class LabelJournal:
+    """
+    Group-committed, append-only label journal of one experiment.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the journal (no file is touched until open or reset).
+        
+        Args:
+            path: Journal file path
+        """
+        self.path = path
+        self.last_seq = 0
+        self.durable_seq = 0
+        self.commits = 0
+        
+        self._buffer: List[str] = []
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._file = None
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+    
+    def read(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], int]:
+        """
+        Read the journal file.
+        
+        Reading stops at the first incomplete or corrupt line, which is the
+        torn tail of a write interrupted by a crash.
+        
+        Returns:
+            Tuple of (header, label and rejection records sorted by seq,
+            bytes of valid records)
+        """
+        header, records, valid_bytes = None, [], 0
+        if not os.path.exists(self.path):
+            return header, records, valid_bytes
+        
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+                
+                if record.get("type") == "header":
+                    header = record
+                elif record.get("type") in ("label", "reject"):
+                    records.append(record)
+        
+        records.sort(key=lambda record: record["seq"])
+        return header, records, valid_bytes
+    
+    def open(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Open an existing journal for appending, dropping a torn tail.
+        
+        Returns:
+            Tuple of (header, label and rejection records sorted by seq)
+        """
+        header, records, valid_bytes = self.read()
+        if os.path.exists(self.path) and os.path.getsize(self.path) > valid_bytes:
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_bytes)
+        
+        with self._io_lock:
+            self._reopen()
+        with self._cond:
+            self.last_seq = self.durable_seq = records[-1]["seq"] if records else 0
+        self._start_writer()
+        return header, records
+    
+    def reset(self, experiment_id: str, config: Dict[str, Any], created_at: str) -> None:
+        """
+        Start a new journal for a fresh experiment run, discarding old records.
+        
+        Args:
+            experiment_id: Experiment identifier
+            config: Experiment configuration, replayed if no snapshot exists
+            created_at: Identifier of the experiment run
+        """
+        header = {
+            "type": "header",
+            "experiment_id": experiment_id,
+            "created_at": created_at,
+            "config": config,
+            "journal_created_at": datetime.now().isoformat()
+        }
+        
+        with self._io_lock:
+            with self._cond:
+                self._buffer = []
+                self.last_seq = self.durable_seq = 0
+            self._rewrite([json.dumps(header, default=str) + "\n"])
+        self._start_writer()
+    
+    def append(self, sample_index: int, label: int) -> int:
+        """
+        Buffer a label record for the next group commit.
+        
+        Args:
+            sample_index: Pool index of the labeled sample
+            label: Assigned label
+        
+        Returns:
+            Sequence number of the record
+        """
+        return self._append({"type": "label", "sample_index": int(sample_index), "label": int(label)})
+    
+    def append_rejection(self, sample_index: int) -> int:
+        """
+        Buffer a record undoing the last label of a sample.
+        
+        Args:
+            sample_index: Pool index of the sample whose label was rejected
+        
+        Returns:
+            Sequence number of the record
+        """
+        return self._append({"type": "reject", "sample_index": int(sample_index)})
+    
+    def sync(self) -> int:
+        """
+        Wait until every record appended so far is on disk.
+        
+        Returns:
+            Last durable sequence number
+        """
+        with self._cond:
+            target = self.last_seq
+            while self.durable_seq < target and self._writer is not None and self._writer.is_alive():
+                self._cond.wait(timeout=1.0)
+            return self.durable_seq
+    
+    def compact(self, through_seq: int) -> None:
+        """
+        Drop records covered by a snapshot, keeping the header and newer labels.
+        
+        Args:
+            through_seq: Last sequence number contained in the snapshot
+        """
+        with self._io_lock:
+            self._commit_buffer()
+            header, records, _ = self.read()
+            lines = [json.dumps(header, default=str) + "\n"] if header else []
+            lines.extend(json.dumps(record) + "\n" for record in records if record["seq"] > through_seq)
+            self._rewrite(lines)
+    
+    def close(self, delete: bool = False) -> None:
+        """
+        Commit buffered records and stop the writer thread.
+        
+        Args:
+            delete: Remove the journal file afterwards
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        
+        with self._io_lock:
+            self._commit_buffer()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if delete and os.path.exists(self.path):
+                os.remove(self.path)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get journal statistics.
+        
+        Returns:
+            Dict with path, sequence numbers and commit count
+        """
+        return {
+            "path": self.path,
+            "last_seq": self.last_seq,
+            "durable_seq": self.durable_seq,
+            "commits": self.commits
+        }
+    
+    def _append(self, record: Dict[str, Any]) -> int:
+        """Number a record and buffer it for the next group commit."""
+        with self._cond:
+            self.last_seq += 1
+            self._buffer.append(json.dumps({**record, "seq": self.last_seq}) + "\n")
+            self._cond.notify_all()
+            return self.last_seq
+    
+    def _start_writer(self) -> None:
+        """Start the group commit thread if it is not running."""
+        with self._cond:
+            self._closed = False
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run, name=f"al-journal-{os.path.basename(self.path)}", daemon=True
+                )
+                self._writer.start()
+    
+    def _run(self) -> None:
+        """Commit buffered records until the journal is closed."""
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._cond.wait()
+                if not self._buffer:
+                    return
+            
+            with self._io_lock:
+                self._commit_buffer()
+    
+    def _commit_buffer(self) -> None:
+        """Write and fsync all buffered records as one commit (caller holds _io_lock)."""
+        with self._cond:
+            lines, self._buffer = self._buffer, []
+            seq = self.last_seq
+        if not lines:
+            return
+        
+        if self._file is None:
+            self._reopen()
+        self._file.write("".join(lines).encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        
+        with self._cond:
+            self.durable_seq = max(self.durable_seq, seq)
+            self.commits += 1
+            self._cond.notify_all()
+    
+    def _reopen(self) -> None:
+        """(Re)open the journal file for appending (caller holds _io_lock)."""
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, "ab")
+    
+    def _rewrite(self, lines: List[str]) -> None:
+        """Atomically replace the journal file with the given lines (caller holds _io_lock)."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write("".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.replace(tmp_path, self.path)
+        _fsync_directory(os.path.dirname(os.path.abspath(self.path)))
+        self._reopen()
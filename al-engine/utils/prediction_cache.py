@@ -0,0 +1,114 @@
+"""
+Prediction Cache for AL Engine
+
+Caches model outputs (pool probabilities, metrics) for a single experiment.
+Entries are keyed by name and tagged with the model version they were
+computed for, so bumping the version invalidates everything at once.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+class PredictionCache:
+    """
+    Per-experiment cache of model outputs keyed by model version.
+    
+    Only entries for the most recent model version are kept; storing an
+    entry for a newer version drops all entries of older versions.
+    """
+    
+    def __init__(self):
+        """Initialize an empty prediction cache."""
+        self.version: Optional[int] = None
+        self._entries: Dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str, version: int) -> Optional[Any]:
+        """
+        Get a cached entry for the given model version.
+        
+        Args:
+            key: Entry name (e.g., "pool_probabilities")
+            version: Model version the caller expects
+        
+        Returns:
+            Cached value, or None if missing or stale
+        """
+        if version != self.version or key not in self._entries:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return self._entries[key]
+    
+    def contains(self, key: str, version: int) -> bool:
+        """
+        Check for a fresh entry without counting a hit or miss.
+        
+        Args:
+            key: Entry name
+            version: Model version the caller expects
+        
+        Returns:
+            True if the entry is cached for this version
+        """
+        return version == self.version and key in self._entries
+    
+    def put(self, key: str, version: int, value: Any) -> None:
+        """
+        Store an entry computed with the given model version.
+        
+        Args:
+            key: Entry name
+            version: Model version the value was computed with
+            value: Value to cache
+        """
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+        
+        self._entries[key] = value
+    
+    def get_or_compute(self, key: str, version: int, compute: Callable[[], Any]) -> Any:
+        """
+        Get a cached entry or compute and store it.
+        
+        Args:
+            key: Entry name
+            version: Current model version
+            compute: Zero-argument callable producing the value
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, version)
+        if value is None:
+            value = compute()
+            self.put(key, version, value)
+        return value
+    
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop one entry, or all entries if no key is given.
+        
+        Args:
+            key: Entry name to drop
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with version, cached keys, hits and misses
+        """
+        return {
+            "version": self.version,
+            "keys": list(self._entries.keys()),
+            "hits": self.hits,
+            "misses": self.misses
+        }
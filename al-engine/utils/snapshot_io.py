@@ -0,0 +1,248 @@
+"""
+Snapshot I/O for AL Engine
+
+Helpers for binary experiment snapshots: a snapshot is a directory holding
+a small JSON manifest, one .npy file per large array (memory-mapped on
+load where the array is only read) and pickles for fitted estimators.
+Snapshots are written to a temporary directory and swapped into place, so
+a crash mid-write never leaves a half-written snapshot behind; a crash
+during the swap itself leaves the previous snapshot aside, where
+recover_directory finds it.
+
+Pickles are only ever read from directories the engine wrote itself; never
+point a restore at untrusted files.
+"""
+
+import json
+import os
+import pickle
+import re
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+MANIFEST_NAME = "manifest.json"
+
+# Suffix of the temporary (.tmp-) and previous (.old-) directories of a swap,
+# tagged with the writer's process and thread
+_SWAP_SUFFIX = re.compile(r"\.(tmp|old)-(\d+)-\d+$")
+
+@contextmanager
+def atomic_directory(path: str) -> Iterator[str]:
+    """
+    Write a directory atomically.
+    
+    Yields a fresh temporary directory next to path; when the block
+    completes it replaces path, and on error it is removed. The previous
+    directory is moved aside to path.old-* and only deleted once the new
+    one is in place, so a crash in between leaves it for recover_directory.
+    
+    Args:
+        path: Final directory path
+    
+    Yields:
+        Temporary directory to write into
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    # Unique per writer, so threads and processes can write the same path concurrently
+    suffix = f"{os.getpid()}-{threading.get_ident()}"
+    tmp_path = f"{path}.tmp-{suffix}"
+    old_path = f"{path}.old-{suffix}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    
+    try:
+        yield tmp_path
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    
+    # Files of the previous snapshot may still be memory-mapped; renaming and
+    # unlinking them is safe, the mappings keep their data until closed
+    if os.path.exists(path):
+        try:
+            os.rename(path, old_path)
+        except FileNotFoundError:
+            pass
+    try:
+        os.rename(tmp_path, path)
+    except OSError:
+        # A concurrent writer swapped its copy in first; keep that one
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not os.path.exists(path):
+            raise
+    shutil.rmtree(old_path, ignore_errors=True)
+
+def recover_directory(path: str) -> bool:
+    """
+    Repair a directory whose atomic_directory swap was interrupted by a crash.
+    
+    If path is missing, the newest previous directory (path.old-*) left by a
+    writer of another process is moved back into place. Previous directories
+    left behind next to an existing path are removed. Writers of the current
+    process are still running and finish their own swaps.
+    
+    Args:
+        path: Directory written with atomic_directory
+    
+    Returns:
+        True if path exists afterwards
+    """
+    parent = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(parent):
+        return False
+    
+    base = os.path.basename(os.path.abspath(path))
+    previous = []
+    for name in os.listdir(parent):
+        match = _SWAP_SUFFIX.search(name)
+        if (match and match.group(1) == "old" and name[:match.start()] == base
+                and int(match.group(2)) != os.getpid()):
+            previous.append(os.path.join(parent, name))
+    previous.sort(key=os.path.getmtime)
+    
+    if not os.path.exists(path) and previous:
+        os.rename(previous.pop(), path)
+    for old_path in previous:
+        shutil.rmtree(old_path, ignore_errors=True)
+    return os.path.exists(path)
+
+def save_array(directory: str, name: str, array: Optional[np.ndarray]) -> None:
+    """
+    Save an array as <name>.npy, or a sparse matrix as <name>.npz
+    (skipped for None).
+    
+    Args:
+        directory: Snapshot directory
+        name: Array name
+        array: Array or sparse matrix to save
+    """
+    if array is None:
+        return
+    if sp.issparse(array):
+        sp.save_npz(os.path.join(directory, f"{name}.npz"), array.tocsr())
+    else:
+        np.save(os.path.join(directory, f"{name}.npy"), np.asarray(array), allow_pickle=False)
+
+def create_array(directory: str, name: str, shape: Tuple[int, ...], dtype: Any) -> np.ndarray:
+    """
+    Create <name>.npy as a writable memory-mapped array, for arrays filled
+    in chunks that should not be built in memory first.
+    
+    Args:
+        directory: Snapshot directory
+        name: Array name
+        shape: Array shape
+        dtype: Element type
+    
+    Returns:
+        Writable memory-mapped array (flush it before the directory is committed)
+    """
+    return np.lib.format.open_memmap(os.path.join(directory, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+def load_array(directory: str, name: str, mmap: bool = False) -> Optional[np.ndarray]:
+    """
+    Load <name>.npy (or a sparse <name>.npz), or None if the snapshot has
+    no such array.
+    
+    Args:
+        directory: Snapshot directory
+        name: Array name
+        mmap: Map the file read-only instead of reading it into memory
+            (sparse matrices are always read into memory)
+    
+    Returns:
+        Array or CSR matrix, or None
+    """
+    sparse_path = os.path.join(directory, f"{name}.npz")
+    if os.path.exists(sparse_path):
+        return sp.load_npz(sparse_path).tocsr()
+    
+    path = os.path.join(directory, f"{name}.npy")
+    if not os.path.exists(path):
+        return None
+    return np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+
+def save_object(directory: str, name: str, obj: Any) -> None:
+    """
+    Pickle an object (e.g. a fitted estimator) as <name>.pkl.
+    
+    Args:
+        directory: Snapshot directory
+        name: Object name
+        obj: Object to save
+    """
+    with open(os.path.join(directory, f"{name}.pkl"), "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_object(directory: str, name: str) -> Any:
+    """
+    Load a pickled object saved with save_object.
+    
+    Args:
+        directory: Snapshot directory
+        name: Object name
+    
+    Returns:
+        Unpickled object
+    """
+    with open(os.path.join(directory, f"{name}.pkl"), "rb") as f:
+        return pickle.load(f)
+
+def save_manifest(directory: str, manifest: Dict[str, Any]) -> None:
+    """
+    Write the snapshot's JSON manifest.
+    
+    Args:
+        directory: Snapshot directory
+        manifest: JSON-serializable snapshot metadata
+    """
+    with open(os.path.join(directory, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+def load_manifest(directory: str) -> Dict[str, Any]:
+    """
+    Read the snapshot's JSON manifest.
+    
+    Args:
+        directory: Snapshot directory
+    
+    Returns:
+        Snapshot metadata
+    
+    Raises:
+        FileNotFoundError: If the directory holds no snapshot
+    """
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No snapshot found in {directory}")
+    with open(path) as f:
+        return json.load(f)
+
+def list_snapshots(root: str) -> List[str]:
+    """
+    List the snapshot directories directly below a root directory.
+    
+    A snapshot whose swap was interrupted is listed under its own name; use
+    recover_directory before reading it.
+    
+    Args:
+        root: Directory holding one snapshot directory per experiment
+    
+    Returns:
+        Sorted names of the snapshot directories
+    """
+    if not os.path.isdir(root):
+        return []
+    names = set()
+    for name in os.listdir(root):
+        match = _SWAP_SUFFIX.search(name)
+        if match and match.group(1) == "tmp":
+            continue
+        if os.path.isfile(os.path.join(root, name, MANIFEST_NAME)):
+            names.add(name[:match.start()] if match else name)
+    return sorted(names)
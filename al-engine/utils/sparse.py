@@ -0,0 +1,86 @@
+"""
+Sparse Matrix Helpers for AL Engine
+
+Pools of text or hashed features are scipy.sparse CSR matrices that would
+grow by orders of magnitude if densified. These helpers let the engine treat
+dense arrays and CSR matrices alike: row-wise stacking, float casts and
+squared norms keep sparse inputs sparse, and only small results (e.g.
+distance blocks) are made dense.
+"""
+
+from typing import Iterator, List, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+def is_sparse(X) -> bool:
+    """Whether X is a scipy.sparse matrix or array."""
+    return sp.issparse(X)
+
+def as_float(X, dtype=np.float64):
+    """
+    Cast to a float dtype, keeping sparse input in CSR form.
+    
+    Args:
+        X: Dense array or sparse matrix
+        dtype: Target dtype
+    
+    Returns:
+        Array or CSR matrix of dtype (no copy if X already matches)
+    """
+    if is_sparse(X):
+        return X.tocsr().astype(dtype, copy=False)
+    return np.asarray(X, dtype=dtype)
+
+def to_dense(X) -> np.ndarray:
+    """Densify a (small) sparse result; dense input is returned as an array."""
+    return X.toarray() if is_sparse(X) else np.asarray(X)
+
+def row_sq_norms(X) -> np.ndarray:
+    """
+    Squared Euclidean norm of every row.
+    
+    Args:
+        X: Dense array or sparse matrix (n_samples, n_features)
+    
+    Returns:
+        Squared norms (n_samples,)
+    """
+    if is_sparse(X):
+        return np.asarray(X.multiply(X).sum(axis=1), dtype=np.float64).ravel()
+    return np.einsum("ij,ij->i", X, X)
+
+def vstack_rows(blocks: List) -> object:
+    """
+    Stack row blocks, sparse if any block is sparse.
+    
+    Args:
+        blocks: Dense arrays and/or sparse matrices with equal column counts
+    
+    Returns:
+        Dense array, or CSR matrix
+    """
+    if any(is_sparse(block) for block in blocks):
+        return sp.vstack([sp.csr_matrix(block) for block in blocks], format="csr")
+    return np.vstack(blocks)
+
+def nonzero_entries(row) -> Iterator[Tuple[int, float]]:
+    """
+    Iterate over the non-zero (column, value) pairs of one row.
+    
+    Args:
+        row: 1-D dense row, or sparse matrix holding one row
+    
+    Yields:
+        (column index, value) tuples in column order
+    """
+    if is_sparse(row):
+        row = row.tocsr()
+        row.sum_duplicates()
+        for column, value in zip(row.indices, row.data):
+            if value != 0:
+                yield int(column), float(value)
+        return
+    
+    row = np.asarray(row).ravel()
+    for column in np.flatnonzero(row):
+        yield int(column), float(row[column])
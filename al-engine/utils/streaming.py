@@ -0,0 +1,122 @@
+"""
+Streaming Pool Scoring for AL Engine
+
+Scores a pool chunk by chunk and keeps only a running top-k of the scores,
+so peak memory depends on the chunk size and k instead of the pool size.
+Chunks can be scored on several threads; estimators whose predict_proba
+releases the GIL (e.g. scikit-learn tree ensembles) then run in parallel.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Tuple
+import numpy as np
+
+from utils.uncertainty import top_k_indices
+
+class TopKAccumulator:
+    """
+    Running top-k of (index, score) pairs.
+    
+    Each pushed chunk is merged with the current winners and cut back to k
+    with a partial sort, so at most 2k entries are held at any time.
+    """
+    
+    def __init__(self, k: int):
+        """
+        Initialize an empty accumulator.
+        
+        Args:
+            k: Number of best entries to keep
+        """
+        self.k = k
+        self.indices = np.array([], dtype=np.intp)
+        self.scores = np.array([], dtype=np.float64)
+    
+    def push(self, indices: np.ndarray, scores: np.ndarray) -> None:
+        """
+        Merge a chunk of scored indices.
+        
+        Args:
+            indices: Indices of the scored rows
+            scores: Scores aligned with indices
+        """
+        # Cut the chunk to its own top k before merging
+        if len(scores) > self.k:
+            winners = top_k_indices(scores, self.k)
+            indices, scores = indices[winners], scores[winners]
+        
+        self.indices = np.concatenate([self.indices, indices])
+        self.scores = np.concatenate([self.scores, scores])
+        
+        if len(self.scores) > self.k:
+            winners = top_k_indices(self.scores, self.k)
+            self.indices, self.scores = self.indices[winners], self.scores[winners]
+    
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the top k entries, best first.
+        
+        Returns:
+            Tuple of (indices, scores)
+        """
+        order = top_k_indices(self.scores, self.k)
+        return self.indices[order], self.scores[order]
+
+def iter_chunk_bounds(n: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """
+    Iterate over [start, stop) bounds of consecutive chunks.
+    
+    Args:
+        n: Number of rows
+        chunk_size: Maximum rows per chunk
+    
+    Yields:
+        (start, stop) tuples
+    """
+    for start in range(0, n, chunk_size):
+        yield start, min(start + chunk_size, n)
+
+def stream_top_k(score_chunk: Callable[[int, int], np.ndarray], n: int, k: int,
+                 chunk_size: int, n_jobs: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score rows [0, n) chunk by chunk and return the k best.
+    
+    With n_jobs > 1 chunks are scored on a thread pool, with at most
+    2 * n_jobs chunks in flight to keep memory bounded. Results are merged
+    in chunk order, so the outcome does not depend on thread timing.
+    
+    Args:
+        score_chunk: Callable mapping (start, stop) to scores of those rows
+        n: Number of rows to score
+        k: Number of rows to select
+        chunk_size: Rows per chunk
+        n_jobs: Number of scoring threads
+    
+    Returns:
+        Tuple of (row positions, scores) of the k best rows, best first
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    
+    accumulator = TopKAccumulator(k)
+    bounds = iter_chunk_bounds(n, chunk_size)
+    
+    if n_jobs <= 1:
+        for start, stop in bounds:
+            accumulator.push(np.arange(start, stop), score_chunk(start, stop))
+        return accumulator.result()
+    
+    with ThreadPoolExecutor(max_workers=n_jobs, thread_name_prefix="al-scoring") as executor:
+        in_flight = deque()
+        for start, stop in bounds:
+            in_flight.append((start, stop, executor.submit(score_chunk, start, stop)))
+            if len(in_flight) >= 2 * n_jobs:
+                start_done, stop_done, future = in_flight.popleft()
+                accumulator.push(np.arange(start_done, stop_done), future.result())
+        
+        while in_flight:
+            start_done, stop_done, future = in_flight.popleft()
+            accumulator.push(np.arange(start_done, stop_done), future.result())
+    
+    return accumulator.result()
@@ -0,0 +1,132 @@
+"""
+Growable Training Buffer for AL Engine
+
+Holds the labeled set of an experiment in preallocated arrays whose capacity
+doubles when full. Appending a label copies only the new rows, so labeling n
+samples costs O(n) copies in total instead of restacking the whole training
+set on every label. Models are fitted on views of the filled rows.
+"""
+
+from typing import Any, Dict, Optional
+import numpy as np
+
+from utils.sparse import is_sparse, vstack_rows
+
+class TrainingBuffer:
+    """
+    Labeled features and targets with amortized O(1) appends.
+    
+    Sparse features cannot be preallocated; they are stacked on append and
+    only the targets are buffered.
+    """
+    
+    def __init__(self, X: np.ndarray, y: np.ndarray, capacity: Optional[int] = None):
+        """
+        Initialize the buffer with the initial training set.
+        
+        Args:
+            X: Initial training features; their dtype is kept for all rows
+            y: Initial training labels
+            capacity: Initial number of rows to allocate (defaults to len(y))
+        """
+        n_rows = len(y)
+        capacity = max(capacity or n_rows, n_rows, 1)
+        
+        if is_sparse(X):
+            self._X = X
+        else:
+            X = np.asarray(X)
+            self._X = np.empty((capacity,) + X.shape[1:], dtype=X.dtype)
+            self._X[:n_rows] = X
+        
+        y = np.asarray(y)
+        self._y = np.empty((capacity,) + y.shape[1:], dtype=y.dtype)
+        self._y[:n_rows] = y
+        self.n_rows = n_rows
+        self.reallocations = 0
+    
+    def __len__(self) -> int:
+        return self.n_rows
+    
+    @property
+    def capacity(self) -> int:
+        """Number of rows that fit before the next reallocation."""
+        return len(self._y)
+    
+    @property
+    def X(self) -> np.ndarray:
+        """View of the filled feature rows (the matrix itself if sparse)."""
+        return self._X if is_sparse(self._X) else self._X[:self.n_rows]
+    
+    @property
+    def y(self) -> np.ndarray:
+        """View of the filled labels."""
+        return self._y[:self.n_rows]
+    
+    def _grow(self, min_capacity: int) -> None:
+        """Reallocate to at least min_capacity rows, doubling the capacity."""
+        capacity = max(2 * self.capacity, min_capacity)
+        
+        if not is_sparse(self._X):
+            X = np.empty((capacity,) + self._X.shape[1:], dtype=self._X.dtype)
+            X[:self.n_rows] = self._X[:self.n_rows]
+            self._X = X
+        
+        y = np.empty((capacity,) + self._y.shape[1:], dtype=self._y.dtype)
+        y[:self.n_rows] = self._y[:self.n_rows]
+        self._y = y
+        self.reallocations += 1
+    
+    def append(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Append newly labeled rows.
+        
+        Views returned before the call stay valid but do not include the new
+        rows.
+        
+        Args:
+            X: New features (cast to the buffer's dtype)
+            y: New labels
+        """
+        y = np.asarray(y)
+        n_new = len(y)
+        if n_new == 0:
+            return
+        
+        if self.n_rows + n_new > self.capacity:
+            self._grow(self.n_rows + n_new)
+        
+        if is_sparse(self._X):
+            self._X = vstack_rows([self._X, X])
+        else:
+            self._X[self.n_rows:self.n_rows + n_new] = X
+        self._y[self.n_rows:self.n_rows + n_new] = y
+        self.n_rows += n_new
+    
+    def truncate(self, n_rows: int) -> None:
+        """
+        Drop the rows after the first n_rows, e.g. of an update that failed.
+        
+        Args:
+            n_rows: Number of rows to keep
+        """
+        if n_rows >= self.n_rows:
+            return
+        
+        if is_sparse(self._X):
+            self._X = self._X[:n_rows]
+        self.n_rows = n_rows
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get buffer statistics.
+        
+        Returns:
+            Dict with filled rows, capacity and reallocation count
+        """
+        return {
+            "rows": self.n_rows,
+            "capacity": self.capacity,
+            "reallocations": self.reallocations,
+            "sparse": is_sparse(self._X)
+        }
@@ -0,0 +1,99 @@
+"""
+Per-Tree Probability Cache for AL Engine
+
+A forest's class probabilities are the mean of its trees' probabilities.
+When an update only adds or retires a few trees (incremental forest growth),
+the pool probabilities can be brought up to date from per-row probability
+sums: the new trees are scored and added, the retired trees are scored and
+subtracted, and the sums are divided by the current number of trees. A pool
+rescoring then costs time proportional to the trees that changed instead of
+the whole forest.
+"""
+
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from utils.sparse import is_sparse, as_float
+from utils.streaming import iter_chunk_bounds
+
+class TreeProbabilityCache:
+    """
+    Running per-row sums of tree probabilities over a fixed pool.
+    
+    Trees are tracked by identity, so the cache works with any ensemble
+    exposing estimators_ whose trees predict probabilities for all of the
+    ensemble's classes (RandomForestClassifier, ExtraTreesClassifier).
+    """
+    
+    def __init__(self, chunk_size: int = 4096):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            chunk_size: Pool rows converted to float32 at a time
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.sums: Optional[np.ndarray] = None
+        self.trees: List[Any] = []
+        self.trees_added = 0
+        self.trees_retired = 0
+        self.rebuilds = 0
+    
+    def _accumulate(self, X, added: List[Any], retired: List[Any]) -> None:
+        """Add the probabilities of added trees and subtract those of retired trees."""
+        # Trees expect float32 input; sparse input is validated per tree (as
+        # in the tree-vote strategy) to keep its index format right
+        sparse = is_sparse(X)
+        for start, stop in iter_chunk_bounds(X.shape[0], self.chunk_size):
+            chunk = as_float(X[start:stop], np.float32) if sparse else np.ascontiguousarray(X[start:stop], dtype=np.float32)
+            for tree in added:
+                self.sums[start:stop] += tree.predict_proba(chunk, check_input=sparse)
+            for tree in retired:
+                self.sums[start:stop] -= tree.predict_proba(chunk, check_input=sparse)
+    
+    def probabilities(self, forest, X) -> np.ndarray:
+        """
+        Get the forest's class probabilities for the pool.
+        
+        Args:
+            forest: Fitted tree ensemble
+            X: Pool features; must be the same rows on every call
+        
+        Returns:
+            Class probabilities (n_rows, n_classes), equal to
+            forest.predict_proba(X) up to floating-point rounding
+        """
+        current = list(forest.estimators_)
+        current_ids = {id(tree) for tree in current}
+        cached_ids = {id(tree) for tree in self.trees}
+        
+        added = [tree for tree in current if id(tree) not in cached_ids]
+        retired = [tree for tree in self.trees if id(tree) not in current_ids]
+        
+        shape = (X.shape[0], len(forest.classes_))
+        # Start over if the pool or classes changed, or if it is not cheaper
+        if self.sums is None or self.sums.shape != shape or len(added) + len(retired) >= len(current):
+            self.sums = np.zeros(shape, dtype=np.float64)
+            added, retired = current, []
+            self.rebuilds += 1
+        
+        self._accumulate(X, added, retired)
+        self.trees = current
+        self.trees_added += len(added)
+        self.trees_retired += len(retired)
+        
+        return self.sums / len(current)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dict with tree counts and rebuilds
+        """
+        return {
+            "trees": len(self.trees),
+            "trees_added": self.trees_added,
+            "trees_retired": self.trees_retired,
+            "rebuilds": self.rebuilds
+        }
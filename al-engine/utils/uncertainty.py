@@ -0,0 +1,122 @@
+"""
+Uncertainty Scoring for AL Engine
+
+Vectorized NumPy scoring functions that turn a single ``predict_proba``
+matrix into per-sample uncertainty scores, plus an O(n) top-k selection.
+Higher scores always mean "more informative".
+"""
+
+from typing import Callable, Dict
+import numpy as np
+
+def least_confidence(probabilities: np.ndarray) -> np.ndarray:
+    """
+    Least-confidence score: 1 - max class probability.
+    
+    Args:
+        probabilities: Class probabilities (n_samples, n_classes)
+    
+    Returns:
+        Uncertainty scores (n_samples,)
+    """
+    return 1.0 - np.max(probabilities, axis=1)
+
+def margin(probabilities: np.ndarray) -> np.ndarray:
+    """
+    Margin score: 1 - (top-1 probability - top-2 probability).
+    
+    Args:
+        probabilities: Class probabilities (n_samples, n_classes)
+    
+    Returns:
+        Uncertainty scores (n_samples,)
+    """
+    if probabilities.shape[1] < 2:
+        return np.zeros(probabilities.shape[0], dtype=probabilities.dtype)
+    
+    # Partial sort puts the two largest probabilities in the last two columns
+    top_two = np.partition(probabilities, -2, axis=1)[:, -2:]
+    return 1.0 - (top_two[:, 1] - top_two[:, 0])
+
+def entropy(probabilities: np.ndarray) -> np.ndarray:
+    """
+    Shannon entropy of the predicted class distribution (natural log).
+    
+    Args:
+        probabilities: Class probabilities (n_samples, n_classes)
+    
+    Returns:
+        Uncertainty scores (n_samples,)
+    """
+    log_probabilities = np.zeros_like(probabilities)
+    np.log(probabilities, out=log_probabilities, where=probabilities > 0)
+    return -np.einsum("ij,ij->i", probabilities, log_probabilities)
+
+def vote_fractions(votes: np.ndarray, n_classes: int) -> np.ndarray:
+    """
+    Fraction of voters choosing each class, per sample.
+    
+    Counts all votes with a single bincount over (sample, class) cells.
+    
+    Args:
+        votes: Integer class votes (n_voters, n_samples)
+        n_classes: Number of classes
+    
+    Returns:
+        Vote fractions (n_samples, n_classes)
+    """
+    n_voters, n_samples = votes.shape
+    cells = votes + n_classes * np.arange(n_samples)[None, :]
+    counts = np.bincount(cells.ravel(), minlength=n_samples * n_classes)
+    return counts.reshape(n_samples, n_classes) / n_voters
+
+SCORING_FUNCTIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "least_confidence": least_confidence,
+    "margin": margin,
+    "entropy": entropy
+}
+
+def uncertainty_scores(probabilities: np.ndarray, method: str = "least_confidence") -> np.ndarray:
+    """
+    Compute uncertainty scores with the given method.
+    
+    Args:
+        probabilities: Class probabilities (n_samples, n_classes)
+        method: One of "least_confidence", "margin", "entropy"
+    
+    Returns:
+        Uncertainty scores (n_samples,)
+    
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method not in SCORING_FUNCTIONS:
+        raise ValueError(f"Unknown uncertainty method '{method}'. Available: {list(SCORING_FUNCTIONS.keys())}")
+    
+    return SCORING_FUNCTIONS[method](np.asarray(probabilities))
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select the indices of the k highest scores, ordered best first.
+    
+    Uses ``argpartition`` so only the k winners are sorted, keeping
+    selection O(n + k log k) instead of a full O(n log n) sort.
+    
+    Args:
+        scores: Scores (n_samples,)
+        k: Number of indices to select
+    
+    Returns:
+        Indices of the top k scores in descending score order
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.array([], dtype=np.intp)
+    
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(n)
+    
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
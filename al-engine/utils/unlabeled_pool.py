@@ -0,0 +1,146 @@
+"""
+Unlabeled Pool Manager for AL Engine
+
+Array-backed bookkeeping of which pool rows are still unlabeled. A boolean
+mask gives O(1) membership checks and a compact index array (kept dense by
+swap-with-last removal) gives copy-free views of the remaining rows.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+import numpy as np
+
+class UnlabeledPool:
+    """
+    Set of unlabeled row indices over a fixed-size pool.
+    
+    Membership checks, removals and re-additions are O(1). The remaining
+    indices are exposed as a view on an internal array; their order is
+    not stable across removals.
+    """
+    
+    def __init__(self, size: int):
+        """
+        Initialize a pool where every row is unlabeled.
+        
+        Args:
+            size: Number of rows in the pool
+        """
+        self.size = size
+        self._mask = np.ones(size, dtype=bool)
+        self._indices = np.arange(size, dtype=np.intp)
+        self._positions = np.arange(size, dtype=np.intp)
+        self._count = size
+        self._snapshots = 0
+    
+    def __len__(self) -> int:
+        """Number of unlabeled rows."""
+        return self._count
+    
+    def __contains__(self, index) -> bool:
+        """Check whether a row is still unlabeled."""
+        return 0 <= index < self.size and bool(self._mask[index])
+    
+    @property
+    def indices(self) -> np.ndarray:
+        """Unlabeled row indices as a read-only view (no copy)."""
+        view = self._indices[:self._count]
+        view.flags.writeable = False
+        return view
+    
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean mask over the pool, True for unlabeled rows (read-only view)."""
+        view = self._mask.view()
+        view.flags.writeable = False
+        return view
+    
+    @contextmanager
+    def snapshot(self) -> Iterator[np.ndarray]:
+        """
+        Hold a view of the unlabeled indices that later changes leave intact.
+        
+        While a snapshot is held, the first removal or addition copies the
+        index array (copy-on-write) instead of rearranging the viewed one,
+        so the view can be read while labels keep arriving. Nothing is
+        copied if the pool does not change.
+        
+        Yields:
+            Read-only view of the unlabeled indices at entry
+        """
+        indices = self._indices
+        self._snapshots += 1
+        try:
+            yield self.indices
+        finally:
+            if self._indices is indices:
+                self._snapshots -= 1
+    
+    def remove(self, index: int) -> None:
+        """
+        Mark a row as labeled.
+        
+        Args:
+            index: Row index to remove
+        
+        Raises:
+            KeyError: If the row is not in the unlabeled pool
+        """
+        if index not in self:
+            raise KeyError(f"Row {index} is not in the unlabeled pool")
+        self._detach()
+        
+        # Move the last unlabeled index into the freed slot
+        position = self._positions[index]
+        last_index = self._indices[self._count - 1]
+        self._indices[position] = last_index
+        self._positions[last_index] = position
+        
+        self._count -= 1
+        self._indices[self._count] = index
+        self._positions[index] = self._count
+        self._mask[index] = False
+    
+    def add(self, index: int) -> None:
+        """
+        Return a previously removed row to the unlabeled pool.
+        
+        Args:
+            index: Row index to add back
+        """
+        if not 0 <= index < self.size:
+            raise KeyError(f"Row {index} is outside the pool")
+        if self._mask[index]:
+            return
+        self._detach()
+        
+        # Swap the row into the first slot past the unlabeled region
+        position = self._positions[index]
+        boundary_index = self._indices[self._count]
+        self._indices[position] = boundary_index
+        self._positions[boundary_index] = position
+        
+        self._indices[self._count] = index
+        self._positions[index] = self._count
+        self._count += 1
+        self._mask[index] = True
+    
+    def iter_chunks(self, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Iterate over the unlabeled indices in fixed-size chunks.
+        
+        Args:
+            chunk_size: Maximum number of indices per chunk
+        
+        Yields:
+            Read-only views of consecutive index chunks
+        """
+        indices = self.indices
+        for start in range(0, len(indices), chunk_size):
+            yield indices[start:start + chunk_size]
+    
+    def _detach(self) -> None:
+        """Copy the index array before changing it if a snapshot views it."""
+        if self._snapshots:
+            self._indices = self._indices.copy()
+            self._snapshots = 0
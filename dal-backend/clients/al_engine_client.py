@@ -72,26 +72,40 @@ class ALEngineClient:
         """Initialize AL experiment."""
         return await self._make_request("POST", "/initialize", config)
     
-    async def get_next_sample(self) -> Dict[str, Any]:
+    def _experiment_endpoint(self, experiment_id: Optional[str], endpoint: str) -> str:
+        """Route to an experiment's keyed endpoint, or the engine's latest experiment."""
+        if experiment_id is None:
+            return endpoint
+        return f"/experiments/{experiment_id}{endpoint}"
+    
+    async def get_next_sample(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """Get next sample for labeling."""
-        return await self._make_request("GET", "/next-sample")
+        return await self._make_request("GET", self._experiment_endpoint(experiment_id, "/next-sample"))
+    
+    async def get_next_samples(self, n: int, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get the n most informative samples for labeling in one request."""
+        return await self._make_request("GET", self._experiment_endpoint(experiment_id, "/next-samples"), params={"n": n})
     
-    async def submit_label(self, sample_id: str, label: int) -> Dict[str, Any]:
+    async def submit_label(self, sample_id: str, label: int, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """Submit label for a sample."""
         params = {"sample_id": sample_id, "label": label}
-        return await self._make_request("POST", "/submit-label", params=params)
+        return await self._make_request("POST", self._experiment_endpoint(experiment_id, "/submit-label"), params=params)
     
-    async def get_metrics(self) -> Dict[str, Any]:
+    async def get_metrics(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
         """Get model performance metrics."""
-        return await self._make_request("GET", "/metrics")
+        return await self._make_request("GET", self._experiment_endpoint(experiment_id, "/metrics"))
+    
+    async def get_status(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Get AL engine or experiment status."""
+        return await self._make_request("GET", self._experiment_endpoint(experiment_id, "/status"))
     
-    async def get_status(self) -> Dict[str, Any]:
-        """Get AL engine status."""
-        return await self._make_request("GET", "/status")
+    async def list_experiments(self) -> Dict[str, Any]:
+        """List experiments hosted by the AL engine."""
+        return await self._make_request("GET", "/experiments")
     
-    async def reset(self) -> Dict[str, Any]:
-        """Reset AL engine."""
-        return await self._make_request("POST", "/reset")
+    async def reset(self, experiment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Reset one experiment, or the whole AL engine."""
+        return await self._make_request("POST", self._experiment_endpoint(experiment_id, "/reset"))
     
     async def list_available_plugins(self) -> Dict[str, Any]:
         """List available plugins."""
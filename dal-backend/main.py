@@ -92,6 +92,16 @@ async def get_next_sample(experiment_id: str):
         logger.error(f"Failed to get next sample: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/experiments/{experiment_id}/next-samples")
+async def get_next_samples(experiment_id: str, n: int = 1):
+    """Get the n most informative samples for labeling in one request."""
+    try:
+        result = await orchestrator.get_next_samples(experiment_id, n)
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get next samples: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/experiments/{experiment_id}/submit-label")
 async def submit_label(experiment_id: str, label_data: Dict[str, Any]):
     """Submit a label for a sample and update the model."""
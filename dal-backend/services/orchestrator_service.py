@@ -172,10 +172,10 @@ class OrchestratorService:
                 }
             
             # Get status from AL Engine
-            al_status = await self.al_engine_client.get_status()
+            al_status = await self.al_engine_client.get_status(experiment_id)
             
             # Get metrics from AL Engine
-            metrics_result = await self.al_engine_client.get_metrics()
+            metrics_result = await self.al_engine_client.get_metrics(experiment_id)
             
             experiment_info = self.active_experiments[experiment_id]
             
@@ -214,7 +214,7 @@ class OrchestratorService:
                 }
             
             # Get next sample from AL Engine
-            result = await self.al_engine_client.get_next_sample()
+            result = await self.al_engine_client.get_next_sample(experiment_id)
             
             if result["status"] == "success":
                 # Update experiment state
@@ -229,6 +229,40 @@ class OrchestratorService:
                 "error": str(e)
             }
     
+    async def get_next_samples(self, experiment_id: str, n: int) -> Dict[str, Any]:
+        """
+        Get the n most informative samples for labeling in one request.
+        
+        Args:
+            experiment_id: Experiment identifier
+            n: Number of samples to return
+            
+        Returns:
+            Ranked sample information
+        """
+        try:
+            if experiment_id not in self.active_experiments:
+                return {
+                    "status": "error",
+                    "error": f"Experiment {experiment_id} not found"
+                }
+            
+            # Get a batch of samples from AL Engine
+            result = await self.al_engine_client.get_next_samples(n, experiment_id)
+            
+            if result["status"] == "success":
+                # Update experiment state
+                self.active_experiments[experiment_id]["last_sample_request"] = datetime.now().isoformat()
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Failed to get next samples: {str(e)}")
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+    
     async def submit_label(self, experiment_id: str, sample_id: str, label: int, 
                           metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -251,7 +285,7 @@ class OrchestratorService:
                 }
             
             # Submit label to AL Engine
-            al_result = await self.al_engine_client.submit_label(sample_id, label)
+            al_result = await self.al_engine_client.submit_label(sample_id, label, experiment_id)
             
             if al_result["status"] == "success":
                 # Store model update on blockchain
@@ -472,7 +506,7 @@ class OrchestratorService:
     async def get_metrics(self, experiment_id: str) -> Dict[str, Any]:
         """Get current model performance metrics."""
         try:
-            return await self.al_engine_client.get_metrics()
+            return await self.al_engine_client.get_metrics(experiment_id)
         except Exception as e:
             logger.error(f"Failed to get metrics: {str(e)}")
             return {
@@ -558,8 +592,8 @@ class OrchestratorService:
             if experiment_id in self.active_experiments:
                 del self.active_experiments[experiment_id]
             
-            # Reset AL Engine
-            al_result = await self.al_engine_client.reset()
+            # Reset the experiment in the AL Engine, leaving other experiments running
+            al_result = await self.al_engine_client.reset(experiment_id)
             
             return {
                 "status": "success",